@@ -1,10 +1,18 @@
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from pydantic import BaseModel, Field
 from sqlalchemy import text
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+import csv
+import io
 import uuid
 from datetime import datetime
 from backend.core.db import auth_engine
+from backend.core import post_import, task_store
+from backend.api.routes.chat import ensure_chat_with_user_message, get_brand_voice_prompt
+from backend.worker import generate_campaign_posts
+
+MAX_CAMPAIGN_POSTS = 100
+MAX_BULK_POSTS = 10_000
 
 router = APIRouter(prefix="/api/campaigns", tags=["Campaigns"])
 
@@ -22,6 +30,21 @@ class PostCreate(BaseModel):
     platform: str = "linkedin"
     scheduled_date: Optional[datetime] = None
 
+class BulkPostsCreate(BaseModel):
+    user_id: str
+    # Rows yahan validate nahi hote: har row ka apna result (ek galat row poori request fail na kare)
+    posts: List[Dict[str, Any]] = Field(..., max_length=MAX_BULK_POSTS)
+
+class PostSchedule(BaseModel):
+    scheduled_date: Optional[datetime] = None  # None = unschedule (wapas draft)
+
+class CampaignGenerateRequest(BaseModel):
+    user_id: str
+    brief: str
+    count: int = Field(10, ge=1, le=MAX_CAMPAIGN_POSTS)
+    platform: str = "linkedin"
+    brand_voice_id: Optional[str] = None
+
 # Routes
 @router.get("/{user_id}")
 def get_campaigns(user_id: str):
@@ -83,7 +106,8 @@ def get_campaign_posts(campaign_id: str):
                     "content": row.content,
                     "platform": row.platform,
                     "scheduled_date": row.scheduled_date,
-                    "status": row.status
+                    "status": row.status,
+                    "publish_error": row.publish_error
                 })
             return {"success": True, "posts": posts}
     except Exception as e:
@@ -103,9 +127,110 @@ def create_post(post: PostCreate):
                 "content": post.content,
                 "platform": post.platform,
                 "scheduled": post.scheduled_date,
-                "status": "draft"
+                # scheduled_date ho toh post_scheduler isse time pe publish karega
+                "status": "scheduled" if post.scheduled_date else "draft"
             })
             conn.commit()
         return {"success": True, "id": new_id}
     except Exception as e:
         return {"success": False, "error": str(e)}
+
+@router.post("/posts/bulk")
+def create_posts_bulk(request: BulkPostsCreate):
+    """
+    JSON array of posts (campaign_id, content, platform, scheduled_date) in batched inserts.
+    Returns per-row results in input order.
+    """
+    try:
+        return {"success": True, **post_import.import_posts(request.user_id, request.posts)}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@router.post("/posts/import")
+def import_posts_csv(user_id: str = Form(...), file: UploadFile = File(...)):
+    """
+    CSV import (header: campaign_id,content,platform,scheduled_date), max MAX_BULK_POSTS rows.
+    File row-by-row padhi jaati hai, poori memory mein load nahi hoti; `index` = header ke baad
+    row number (0 se).
+    """
+    try:
+        text_file = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+        # JSON bulk jaisi hi limit: pehle rows gino (spooled file, streaming), fir seek(0) karke import
+        rows = sum(1 for _ in csv.DictReader(text_file))
+        if rows > MAX_BULK_POSTS:
+            raise HTTPException(status_code=413, detail=f"CSV has {rows} rows, max {MAX_BULK_POSTS} per import")
+        text_file.seek(0)
+        return {"success": True, **post_import.import_posts(user_id, csv.DictReader(text_file))}
+    except HTTPException:
+        raise
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@router.post("/posts/{post_id}/schedule")
+def schedule_post(post_id: str, schedule: PostSchedule):
+    """
+    Draft / scheduled / failed post ka publish time set (ya hatao). Published posts nahi badalte.
+    """
+    try:
+        with auth_engine.connect() as conn:
+            updated = conn.execute(text("""
+                UPDATE posts SET scheduled_date = :scheduled, status = :status, publish_error = NULL
+                WHERE id = :id AND status IN ('draft', 'scheduled', 'failed')
+            """), {
+                "id": post_id,
+                "scheduled": schedule.scheduled_date,
+                "status": "scheduled" if schedule.scheduled_date else "draft",
+            }).rowcount
+            conn.commit()
+        if not updated:
+            return {"success": False, "error": "Post not found or already published"}
+        return {"success": True, "id": post_id}
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
+@router.post("/{campaign_id}/generate")
+def generate_campaign(campaign_id: str, request: CampaignGenerateRequest):
+    """
+    Brief + count se campaign ke saare posts background mein generate karta hai.
+    Posts `draft` status mein bante hain; progress /api/tasks/{task_id}/events pe.
+    """
+    with auth_engine.connect() as conn:
+        campaign = conn.execute(
+            text("SELECT name FROM campaigns WHERE id = :cid AND user_id = :uid"),
+            {"cid": campaign_id, "uid": request.user_id}
+        ).fetchone()
+    if not campaign:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+
+    system_prompt = get_brand_voice_prompt(request.brand_voice_id) if request.brand_voice_id else None
+
+    # tasks.chat_id ke liye ek chat: campaign generation history mein bhi dikhe
+    chat_id = str(uuid.uuid4())
+    task_id = str(uuid.uuid4())
+    ensure_chat_with_user_message(
+        chat_id, request.user_id,
+        f"Generate {request.count} {request.platform} posts for campaign '{campaign.name}': {request.brief}",
+    )
+    task_store.create_task(task_id, chat_id, "generate_campaign")
+
+    generate_campaign_posts.apply_async(
+        kwargs={
+            "campaign_id": campaign_id,
+            "user_id": request.user_id,
+            "brief": request.brief,
+            "count": request.count,
+            "platform": request.platform,
+            "system_prompt": system_prompt,
+        },
+        task_id=task_id,
+    )
+
+    return {
+        "success": True,
+        "task_id": task_id,
+        "status": "processing",
+        "events_url": f"/api/tasks/{task_id}/events",
+    }
@@ -3,14 +3,15 @@ from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 from sqlalchemy import text
 import json
-from backend.core.agent.agent_config import create_agent
+from backend.core.agent.agent_config import apply_brand_voice, create_agent
 from backend.core.db import auth_engine
 from backend.core.schemas import ChatRequest
 
 router = APIRouter(prefix="/api", tags=["Chat"])
 
 from backend.core.celery_app import celery_app
-from backend.worker import test_task # In future, this will be generate_task
+from backend.core import task_store
+from backend.worker import generate_content
 
 def get_brand_voice_prompt(voice_id: str) -> str | None:
     try:
@@ -20,6 +21,30 @@ def get_brand_voice_prompt(voice_id: str) -> str | None:
     except Exception:
         return None
 
+def ensure_chat_with_user_message(chat_id: str, user_id: str, message: str):
+    """Chat row (agar nahi hai) + USER message persist."""
+    with auth_engine.connect() as conn:
+        # Check if chat exists
+        exists = conn.execute(text("SELECT 1 FROM chats WHERE id = :cid"), {"cid": chat_id}).fetchone()
+
+        if not exists:
+            # Generate Title
+            title_words = message.split()
+            generated_title = " ".join(title_words[:6])
+            if len(title_words) > 6: generated_title += "..."
+
+            conn.execute(text("""
+                INSERT INTO chats (id, user_id_str, title) VALUES (:cid, :uid, :title)
+            """), {"cid": chat_id, "uid": user_id, "title": generated_title})
+            conn.commit()
+
+        # Persist USER Message
+        conn.execute(text("""
+            INSERT INTO chat_messages (chat_id, role, content)
+            VALUES (:cid, 'user', :content)
+        """), {"cid": chat_id, "content": message})
+        conn.commit()
+
 @router.post("/chat/async")
 def chat_async(request: ChatRequest):
     """
@@ -31,14 +56,23 @@ def chat_async(request: ChatRequest):
     if request.brand_voice_id:
         system_prompt = get_brand_voice_prompt(request.brand_voice_id)
 
-    # Trigger Celery Task (Passing system_prompt if needed)
-    # Note: We need to update the worker task to accept system_prompt
-    task = test_task.delay(request.message) # TODO: Pass system_prompt
-    
-    return {"task_id": task.id, "status": "processing"}
-
+    # 1. Chat + user message + pending task row (worker isi row ko update karta hai)
+    task_id = str(uuid.uuid4())
+    ensure_chat_with_user_message(request.session_id, request.user_id, request.message)
+    task_store.create_task(task_id, request.session_id, "generate")
 
+    # 2. Trigger Celery Task (brand voice worker mein apply hota hai)
+    generate_content.apply_async(
+        kwargs={
+            "message": request.message,
+            "session_id": request.session_id,
+            "user_id": request.user_id,
+            "system_prompt": system_prompt,
+        },
+        task_id=task_id,
+    )
 
+    return {"task_id": task_id, "status": "processing", "events_url": f"/api/tasks/{task_id}/events"}
 
 
 @router.post("/chat")
@@ -46,30 +80,9 @@ def chat_endpoint(request: ChatRequest):
     chat_id = request.session_id
     user_id = request.user_id # Email in our case
     
-    # 1. Ensure Chat Exists in New DB
+    # 1. Ensure Chat Exists in New DB + 2. Persist USER Message
     try:
-        with auth_engine.connect() as conn:
-            # Check if chat exists
-            exists = conn.execute(text("SELECT 1 FROM chats WHERE id = :cid"), {"cid": chat_id}).fetchone()
-            
-            if not exists:
-                # Generate Title
-                title_words = request.message.split()
-                generated_title = " ".join(title_words[:6])
-                if len(title_words) > 6: generated_title += "..."
-                
-                conn.execute(text("""
-                    INSERT INTO chats (id, user_id_str, title) VALUES (:cid, :uid, :title)
-                """), {"cid": chat_id, "uid": user_id, "title": generated_title})
-                conn.commit()
-            
-            # 2. Persist USER Message
-            conn.execute(text("""
-                INSERT INTO chat_messages (chat_id, role, content) 
-                VALUES (:cid, 'user', :content)
-            """), {"cid": chat_id, "content": request.message})
-            conn.commit()
-            
+        ensure_chat_with_user_message(chat_id, user_id, request.message)
     except Exception as e:
         print(f"DB Error (User Msg): {e}")
 
@@ -88,16 +101,9 @@ def chat_endpoint(request: ChatRequest):
             # Create a fresh agent instance for this request to ensure thread safety and state isolation
             agent = create_agent()
             
-            # Inject Brand Voice if present
+            # Inject Brand Voice if present (prepended as a "System Note" for robust compatibility)
             if request.brand_voice_id:
-                voice_prompt = get_brand_voice_prompt(request.brand_voice_id)
-                if voice_prompt:
-                    # We can prepend this to the message OR set it as agent instruction if supported.
-                    # For Agno, we can often pass 'description' or update instructions.
-                    # Or simpler: Prepend to user message as a "System Note".
-                    # Better: If agent supports 'instruction', set it.
-                    # Let's prepend to message for now for robust compatibility.
-                    request.message = f"System Instruction: Adopt the following persona:\n{voice_prompt}\n\nUser Query: {request.message}"
+                request.message = apply_brand_voice(request.message, get_brand_voice_prompt(request.brand_voice_id))
 
             print(f"DEBUG: Agent creation took {time.time() - start_time:.4f}s")
             
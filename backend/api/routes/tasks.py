@@ -1,16 +1,150 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+import time
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
 from backend.core.db import auth_engine
 from backend.core.celery_app import celery_app
+from backend.core import blob_store, task_events, task_store
 from celery.result import AsyncResult
 
 router = APIRouter(prefix="/api/tasks", tags=["Tasks"])
 
+HEARTBEAT_SECONDS = 15
+MAX_BULK_IDS = 500
+
+
+class TaskStatusRequest(BaseModel):
+    task_ids: List[str] = Field(..., max_length=MAX_BULK_IDS)
+
+
+def _row_status(row: dict) -> dict:
+    # DB row → compact status (poora generated content nahi, woh GET /{task_id} se)
+    status = {"task_id": row["id"], "status": row["status"], "phase": row["status"], "version": 0,
+              "updated_at": str(row["updated_at"])}
+    result = row.get("result") or {}
+    if isinstance(result, dict) and "error" in result:
+        status["error"] = result["error"]
+    return status
+
+
+def _resolve_statuses(task_ids: List[str]) -> dict:
+    """Pehle event snapshots (ek MGET), jo nahi mile woh `tasks` table se (ek query)."""
+    statuses = task_events.snapshots(task_ids)
+    missing = [t for t in task_ids if t not in statuses]
+    if missing:
+        for row in task_store.get_tasks(missing):
+            statuses[row["id"]] = _row_status(row)
+    return statuses
+
+
+def _current_status(task_id: str) -> dict | None:
+    return _resolve_statuses([task_id]).get(task_id)
+
+
+def _sse(event: dict) -> str:
+    return f"id: {event.get('version', 0)}\nevent: progress\ndata: {json.dumps(event, default=str)}\n\n"
+
+
+@router.post("/status")
+def get_tasks_status(request: TaskStatusRequest):
+    """
+    Bulk status: many task ids resolved in one backend round trip.
+    """
+    task_ids = list(dict.fromkeys(request.task_ids))
+    statuses = _resolve_statuses(task_ids)
+    return {
+        "tasks": statuses,
+        "missing": [t for t in task_ids if t not in statuses],
+    }
+
+
+@router.get("/{task_id}/events")
+async def stream_task_events(task_id: str, request: Request):
+    """
+    Server-Sent Events: current status turant, fir har progress change push hota hai
+    (task complete / fail hone pe stream band).
+    """
+    async def event_stream():
+        # Pehle subscribe, fir snapshot: beech mein aaya event miss nahi hota
+        async with task_events.subscribe(task_id) as subscription:
+            current = await run_in_threadpool(_current_status, task_id)
+            if current is None:
+                yield f"event: error\ndata: {json.dumps({'error': 'Task not found'})}\n\n"
+                return
+            version = current.get("version", 0)
+            yield _sse(current)
+            if task_events.is_terminal(current):
+                return
+
+            while not await request.is_disconnected():
+                event = await subscription.next(timeout=HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event.get("version", 0) <= version:
+                    continue
+                version = event["version"]
+                yield _sse(event)
+                if task_events.is_terminal(event):
+                    return
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/{task_id}/wait")
+async def wait_for_task_change(
+    task_id: str,
+    since_version: int = 0,
+    timeout: float = Query(25, gt=0, le=60),
+):
+    """
+    Long-poll: `since_version` se naya event aate hi return (ya timeout pe current status).
+    """
+    async with task_events.subscribe(task_id) as subscription:
+        current = await run_in_threadpool(_current_status, task_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        if current.get("version", 0) > since_version or task_events.is_terminal(current):
+            return {**current, "changed": True}
+
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            event = await subscription.next(timeout=remaining)
+            if event and event.get("version", 0) > since_version:
+                return {**event, "changed": True}
+        return {**current, "changed": False}
+
+
+@router.get("/{task_id}/result")
+def get_task_result(task_id: str):
+    """
+    Full result: `tasks` row ke blob references ko content se resolve karke.
+    """
+    rows = task_store.get_tasks([task_id])
+    if not rows:
+        raise HTTPException(status_code=404, detail="Task not found")
+    row = rows[0]
+    result = row["result"] if isinstance(row["result"], dict) else {}
+    return {
+        "task_id": task_id,
+        "status": row["status"],
+        "result": blob_store.resolve(result),
+    }
+
+
 @router.get("/{task_id}")
 def get_task_status(task_id: str):
     task_result = AsyncResult(task_id, app=celery_app)
-    
+
     response = {
         "task_id": task_id,
         "status": task_result.status,
@@ -0,0 +1,109 @@
+"""
+Benchmark: per-hint line scan vs single compiled-regex hint matching.
+
+Usage:
+    python -m backend.benchmarks.bench_hint_matching
+    python -m backend.benchmarks.bench_hint_matching --live https://a.com https://b.com
+
+Offline mode synthetic page bodies pe chalta hai aur URL count x hint count ka grid
+print karta hai (old `hints × lines` loop vs HintMatcher ka ek regex alternation). `--live` diye URLs ko
+browser pool se crawl karke end-to-end time bhi naapta hai (Playwright chahiye).
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from backend.core.tools.text_match import HintMatcher
+
+VOCAB = (
+    "price rating review shipping coffee arabica roast organic discount stock "
+    "delivery warranty brand customer support refund seller sustainable blend"
+).split()
+
+
+def _synthetic_body(rng, lines=400):
+    return "\n".join(
+        " ".join(rng.choice(VOCAB).capitalize() if rng.random() < 0.1 else rng.choice(VOCAB) for _ in range(12))
+        for _ in range(lines)
+    )
+
+
+def _naive(body, hints, max_per_hint):
+    # Old extract_candidates loop: har hint ke liye har line, har baar .lower()
+    matches = {}
+    for hint in hints:
+        for line in body.split("\n"):
+            if hint.lower() in line.lower():
+                matches.setdefault(hint, []).append(line.strip())
+    return {k: v[:max_per_hint] for k, v in matches.items()}
+
+
+def _single_pass(bodies, hints, max_per_hint):
+    matcher = HintMatcher(hints)
+    return [matcher.match_lines(body, max_per_hint) for body in bodies]
+
+
+def _time(fn, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def offline(url_counts, hint_counts, runs, max_per_hint):
+    rng = random.Random(7)
+    pages = [_synthetic_body(rng) for _ in range(max(url_counts))]
+    extra = [f"term{i}" for i in range(max(hint_counts))]
+    print(f"{'urls':>6}{'hints':>7}{'naive ms':>12}{'single-pass ms':>16}{'speedup':>10}")
+    for n_urls in url_counts:
+        bodies = pages[:n_urls]
+        for n_hints in hint_counts:
+            hints = (VOCAB + extra)[:n_hints]
+            # Speed tabhi matlab ka hai jab output naive loop jaisa hi ho
+            assert _single_pass(bodies, hints, max_per_hint) == [_naive(b, hints, max_per_hint) for b in bodies]
+            naive = _time(lambda: [_naive(b, hints, max_per_hint) for b in bodies], runs)
+            single = _time(lambda: _single_pass(bodies, hints, max_per_hint), runs)
+            print(f"{n_urls:>6}{n_hints:>7}{naive * 1000:>12.2f}{single * 1000:>16.2f}{naive / single:>9.1f}x")
+
+
+def live(urls, hints, max_concurrency):
+    from backend.core.tools.browser import PlaywrightTools
+
+    tools = PlaywrightTools()
+    tools.pool  # warm up before timing
+    print(f"{'urls':>6}{'sequential s':>14}{'crawl s':>10}")
+    for n in sorted({1, len(urls) // 2 or 1, len(urls)}):
+        subset = urls[:n]
+        start = time.perf_counter()
+        for url in subset:
+            tools.extract_candidates(url, hints)
+        sequential = time.perf_counter() - start
+        start = time.perf_counter()
+        tools.crawl(subset, hints, max_concurrency=max_concurrency)
+        crawled = time.perf_counter() - start
+        print(f"{n:>6}{sequential:>14.2f}{crawled:>10.2f}")
+    print(tools.pool.stats())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--urls", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--hints", type=int, nargs="+", default=[1, 5, 20, 100])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-per-hint", type=int, default=5)
+    parser.add_argument("--live", nargs="+", metavar="URL", help="Crawl real pages with the browser pool")
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    if args.live:
+        live(args.live, VOCAB[:5], args.concurrency)
+    else:
+        offline(args.urls, args.hints, args.runs, args.max_per_hint)
+
+
+if __name__ == "__main__":
+    main()
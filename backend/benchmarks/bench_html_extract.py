@@ -0,0 +1,98 @@
+"""
+Microbenchmark: BeautifulSoup full parse vs streaming extractor.
+
+Usage:
+    python -m backend.benchmarks.bench_html_extract --corpus path/to/saved_pages
+    python -m backend.benchmarks.bench_html_extract            # synthetic pages
+
+Har page pe dono extractors chalte hain; time (median of N runs) aur peak memory
+(tracemalloc) compare hote hain. Corpus folder mein saved `.html` files rakhiye.
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import time
+import tracemalloc
+
+from backend.core.tools.html_extract import extract_text_stream
+
+CHUNK_SIZE = 16 * 1024
+
+
+def _synthetic_pages():
+    script = "<script>" + "var x = {a: 1, b: [1,2,3]};" * 20000 + "</script>"
+    style = "<style>" + ".c{color:red;margin:0 auto;}" * 20000 + "</style>"
+    para = "<p>" + "Search engine optimization keeps pages discoverable. " * 40 + "</p>"
+    return {
+        "small.html": f"<html><head><title>Small</title></head><body>{para * 5}</body></html>",
+        "script_heavy.html": f"<html><head>{script}{style}</head><body>{para * 50}</body></html>",
+        "long_article.html": f"<html><body>{para * 3000}</body></html>",
+    }
+
+
+def _load_corpus(path):
+    pages = {}
+    for file in sorted(glob.glob(os.path.join(path, "**", "*.htm*"), recursive=True)):
+        with open(file, "r", encoding="utf-8", errors="replace") as f:
+            pages[os.path.relpath(file, path)] = f.read()
+    return pages
+
+
+def _bs4_extract(data, char_limit):
+    from bs4 import BeautifulSoup
+
+    # Purana path: poora body decode + poora tree
+    soup = BeautifulSoup(data.decode("utf-8", errors="replace"), "html.parser")
+    for tag in soup(["script", "style", "noscript", "iframe"]):
+        tag.decompose()
+    return " ".join(soup.get_text().split())[:char_limit]
+
+
+def _stream_extract(data, char_limit):
+    chunks = (data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+    return extract_text_stream(chunks, char_limit=char_limit).text
+
+
+def _measure(fn, data, char_limit, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(data, char_limit)
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn(data, char_limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", help="Folder with saved .html pages")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--char-limit", type=int, default=3000)
+    args = parser.parse_args()
+
+    pages = _load_corpus(args.corpus) if args.corpus else _synthetic_pages()
+    extractors = {"stream": _stream_extract}
+    try:
+        import bs4  # noqa: F401
+        extractors = {"bs4": _bs4_extract, **extractors}
+    except ImportError:
+        print("bs4 not installed, only the streaming extractor is measured")
+
+    print(f"{'page':<30}{'size KB':>10}" + "".join(f"{n + ' ms':>12}{n + ' peak KB':>16}" for n in extractors))
+    for name, html in pages.items():
+        # Response body bytes ki tarah (network se yahi aata hai)
+        data = html.encode("utf-8")
+        row = f"{name[:29]:<30}{len(data) / 1024:>10.0f}"
+        for fn in extractors.values():
+            seconds, peak = _measure(fn, data, args.char_limit, args.runs)
+            row += f"{seconds * 1000:>12.2f}{peak / 1024:>16.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: importing a content calendar (per-row create_post vs executemany vs COPY).
+
+Usage:
+    python -m backend.benchmarks.bench_post_import
+    python -m backend.benchmarks.bench_post_import --posts 10000 --batch 1000 --per-row-sample 500
+
+DATABASE_URL wale Postgres pe chalta hai: ek throwaway campaign banata hai, har method se
+posts import karta hai, fir campaign delete (ON DELETE CASCADE posts bhi saaf kar deta hai).
+Per-row method (har post apna connection + commit, purane `create_post` jaisa) sirf
+`--per-row-sample` posts pe chalta hai aur total posts tak extrapolate hota hai.
+"""
+
+import argparse
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from backend.core.db import auth_engine
+from backend.core.post_import import import_posts, normalize_row
+
+BENCH_USER = "bench-post-import"
+WORDS = "launch webinar product update customer story tips hiring growth brand community".split()
+
+
+def _rows(campaign_id, count, rng):
+    start = datetime.utcnow() + timedelta(days=1)
+    return [
+        {
+            "campaign_id": campaign_id,
+            "content": " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 60))),
+            "platform": rng.choice(("linkedin", "twitter")),
+            "scheduled_date": (start + timedelta(hours=i)).isoformat() if i % 3 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def _per_row(rows):
+    # Purana path: har post ke liye naya connection, ek INSERT, ek commit
+    for raw in rows:
+        row = normalize_row(raw)
+        with auth_engine.connect() as conn:
+            conn.execute(text("""
+                INSERT INTO posts (id, campaign_id, content, platform, scheduled_date, status)
+                VALUES (:id, :campaign_id, :content, :platform, :scheduled_date, :status)
+            """), row)
+            conn.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--posts", type=int, default=10_000, help="Posts per method")
+    parser.add_argument("--batch", type=int, default=1000, help="Rows per batch (bulk methods)")
+    parser.add_argument("--per-row-sample", type=int, default=500, help="Posts actually inserted one by one")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    campaign_id = f"bench-{uuid.uuid4()}"
+    with auth_engine.connect() as conn:
+        conn.execute(text("INSERT INTO campaigns (id, user_id, name) VALUES (:id, :uid, 'Import benchmark')"),
+                     {"id": campaign_id, "uid": BENCH_USER})
+        conn.commit()
+
+    try:
+        print(f"{'method':>12}{'posts':>8}{'seconds':>10}{'posts/s':>10}")
+        sample = _rows(campaign_id, args.per_row_sample, rng)
+        started = time.perf_counter()
+        _per_row(sample)
+        elapsed = time.perf_counter() - started
+        print(f"{'per-row':>12}{len(sample):>8}{elapsed:>10.2f}{len(sample) / elapsed:>10.0f}"
+              f"   (~{elapsed * args.posts / len(sample):.1f}s for {args.posts})")
+
+        rows = _rows(campaign_id, args.posts, rng)
+        for method in ("executemany", "copy"):
+            started = time.perf_counter()
+            summary = import_posts(BENCH_USER, rows, batch_size=args.batch, method=method)
+            elapsed = time.perf_counter() - started
+            assert summary["created"] == args.posts, summary["failed"]
+            print(f"{method:>12}{args.posts:>8}{elapsed:>10.2f}{args.posts / elapsed:>10.0f}")
+    finally:
+        with auth_engine.connect() as conn:
+            conn.execute(text("DELETE FROM campaigns WHERE id = :id"), {"id": campaign_id})
+            conn.commit()
+
+
+if __name__ == "__main__":
+    main()
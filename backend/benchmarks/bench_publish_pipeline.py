@@ -0,0 +1,83 @@
+"""
+Benchmark: publish pipeline output size (raw vs minified vs gzip vs brotli).
+
+Usage:
+    python -m backend.benchmarks.bench_publish_pipeline
+    python -m backend.benchmarks.bench_publish_pipeline --blogs 200 --mbps 1.6 10 50
+
+Generated blogs (agent jaisa indented HTML: headings, lists, tables) ko deploy wale
+wrapper + minify se guzarta hai aur har stage ka total size, per-page processing time,
+aur diye gaye bandwidth pe estimated transfer time print karta hai.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from backend.core.tools.cpanel import CpanelDeployTools
+from backend.core.tools.publish import compressed_variants
+
+WORDS = (
+    "search engine optimization content strategy keyword ranking organic traffic backlink "
+    "audience conversion headline readability schema sitemap crawl index page speed mobile"
+).split()
+
+
+def _sentence(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+
+
+def _blog(rng, sections=6):
+    parts = [f"    <h1>{_sentence(rng)[:60]}</h1>\n"]
+    for _ in range(sections):
+        parts.append(f"\n    <!-- section -->\n    <h2>\n        {_sentence(rng)[:50]}\n    </h2>\n")
+        for _ in range(rng.randint(2, 4)):
+            parts.append("    <p>\n        " + "\n        ".join(_sentence(rng) for _ in range(4)) + "\n    </p>\n")
+        items = "".join(f"        <li>  {_sentence(rng)}  </li>\n" for _ in range(rng.randint(3, 6)))
+        parts.append(f"    <ul>\n{items}    </ul>\n")
+        if rng.random() < 0.4:
+            rows = "".join(
+                f"        <tr>\n            <td>{rng.choice(WORDS)}</td>\n            <td>{rng.randint(1, 999)}</td>\n        </tr>\n"
+                for _ in range(5)
+            )
+            parts.append(f"    <table>\n{rows}    </table>\n")
+    return "".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blogs", type=int, default=50)
+    parser.add_argument("--mbps", type=float, nargs="+", default=[1.6, 10.0], help="Link speeds for transfer estimate")
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    tools = CpanelDeployTools(host="https://bench", user="bench", token="bench", site_url="https://example.com")
+
+    totals = {"raw": 0, "minified": 0, ".gz": 0, ".br": 0}
+    timings = []
+    for i in range(args.blogs):
+        page = tools._wrap_html(_blog(rng), f"Blog {i}", f"https://example.com/blog-{i}.html")
+        start = time.perf_counter()
+        optimized = tools._optimize_page(page)
+        variants = compressed_variants(optimized.encode("utf-8"))
+        timings.append(time.perf_counter() - start)
+
+        totals["raw"] += len(page.encode("utf-8"))
+        totals["minified"] += len(optimized.encode("utf-8"))
+        for suffix, data in variants.items():
+            totals[suffix] += len(data)
+
+    print(f"{args.blogs} blogs, median minify+compress {statistics.median(timings) * 1000:.2f} ms/page\n")
+    header = f"{'stage':>10}{'total KB':>11}{'vs raw':>9}" + "".join(f"{f'{m:g} Mbps s':>13}" for m in args.mbps)
+    print(header)
+    for stage, size in totals.items():
+        if not size:
+            print(f"{stage:>10}{'n/a (brotli not installed)':>30}")
+            continue
+        transfer = "".join(f"{size * 8 / (m * 1_000_000):>13.2f}" for m in args.mbps)
+        print(f"{stage:>10}{size / 1024:>11.1f}{size / totals['raw']:>8.0%} {transfer}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark: interactive latency during a bulk generation backlog (shared vs named queues).
+
+Usage:
+    python -m backend.benchmarks.bench_task_queues
+    python -m backend.benchmarks.bench_task_queues --bulk 60 --bulk-seconds 2 --interactive-rate 20
+
+Redis / Celery ke bina local simulation: stub LLM (sleep) tasks threads pe chalte hain.
+- shared: ek hi default queue, saari concurrency ek saath, Celery default prefetch (4).
+- named: `celery_app.WORKER_PROFILES` wali per-queue concurrency + prefetch.
+Pehle bulk backlog daala jaata hai, fir interactive jobs steady rate pe aate hain;
+interactive p50/p95 latency aur bulk throughput dono modes ke liye print hote hain.
+"""
+
+import argparse
+import collections
+import statistics
+import threading
+import time
+
+from backend.core.celery_app import GENERATION_QUEUE, INTERACTIVE_QUEUE, WORKER_PROFILES
+
+DEFAULT_PREFETCH = 4  # Celery worker_prefetch_multiplier default
+
+
+class _Queue:
+    def __init__(self):
+        self.items = collections.deque()
+        self.cond = threading.Condition()
+        self.closed = False
+
+    def put(self, item):
+        with self.cond:
+            self.items.append(item)
+            self.cond.notify()
+
+    def take(self, n):
+        """Block until items are available, then reserve up to n (prefetch)."""
+        with self.cond:
+            while not self.items and not self.closed:
+                self.cond.wait(0.05)
+            return [self.items.popleft() for _ in range(min(n, len(self.items)))]
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+def _stub_llm(job):
+    time.sleep(job["duration"])
+
+
+def _worker(queue, prefetch, done):
+    reserved = collections.deque()
+    while True:
+        if not reserved:
+            batch = queue.take(prefetch)
+            if not batch:
+                return
+            reserved.extend(batch)
+        job = reserved.popleft()
+        _stub_llm(job)
+        job["finished"] = time.perf_counter()
+        done.append(job)
+
+
+def run(mode, bulk, bulk_seconds, interactive_rate, interactive_seconds, interactive_duration):
+    queues = {name: _Queue() for name in WORKER_PROFILES}
+    done = []
+    threads = []
+    if mode == "shared":
+        shared = _Queue()
+        queues = {name: shared for name in WORKER_PROFILES}
+        total = sum(p["concurrency"] for p in WORKER_PROFILES.values())
+        threads = [threading.Thread(target=_worker, args=(shared, DEFAULT_PREFETCH, done)) for _ in range(total)]
+    else:
+        for name, profile in WORKER_PROFILES.items():
+            threads += [
+                threading.Thread(target=_worker, args=(queues[name], profile["prefetch"], done))
+                for _ in range(profile["concurrency"])
+            ]
+    for t in threads:
+        t.start()
+
+    start = time.perf_counter()
+    for _ in range(bulk):
+        queues[GENERATION_QUEUE].put({"kind": "bulk", "duration": bulk_seconds, "submitted": time.perf_counter()})
+
+    interval = 1.0 / interactive_rate
+    while time.perf_counter() - start < interactive_seconds:
+        queues[INTERACTIVE_QUEUE].put(
+            {"kind": "interactive", "duration": interactive_duration, "submitted": time.perf_counter()}
+        )
+        time.sleep(interval)
+
+    for q in set(queues.values()):
+        q.close()
+    for t in threads:
+        t.join()
+
+    latencies = sorted(j["finished"] - j["submitted"] for j in done if j["kind"] == "interactive")
+    bulk_done = [j for j in done if j["kind"] == "bulk"]
+    elapsed = max(j["finished"] for j in done) - start
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    return statistics.median(latencies), p95, len(bulk_done) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bulk", type=int, default=40, help="Bulk generation jobs queued up front")
+    parser.add_argument("--bulk-seconds", type=float, default=1.0, help="Stub LLM time per bulk job")
+    parser.add_argument("--interactive-rate", type=float, default=10.0, help="Interactive jobs per second")
+    parser.add_argument("--interactive-seconds", type=float, default=5.0, help="How long interactive load runs")
+    parser.add_argument("--interactive-duration", type=float, default=0.05, help="Stub LLM time per interactive job")
+    args = parser.parse_args()
+
+    print(f"profiles: {WORKER_PROFILES}\n")
+    print(f"{'mode':>8}{'interactive p50 s':>19}{'interactive p95 s':>19}{'bulk jobs/s':>13}")
+    for mode in ("shared", "named"):
+        p50, p95, throughput = run(
+            mode, args.bulk, args.bulk_seconds, args.interactive_rate,
+            args.interactive_seconds, args.interactive_duration,
+        )
+        print(f"{mode:>8}{p50:>19.3f}{p95:>19.3f}{throughput:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
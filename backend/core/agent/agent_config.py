@@ -5,12 +5,12 @@
 from agno.agent import Agent
 from agno.models.ollama import Ollama
 from backend.core.db import db
-from backend.core.agent.instructions import AGENT_INSTRUCTIONS
+from backend.core.agent.instructions import AGENT_INSTRUCTIONS, POST_WRITER_INSTRUCTIONS
 import os
 
 # Tools Import (Modular Path)
 from backend.core.tools.search import DuckDuckGoToolkit 
-from backend.core.tools.imagebb import image_to_seo_html
+from backend.core.tools.imagebb import image_to_seo_html, images_to_seo_html
 from backend.core.tools.cpanel import CpanelDeployTools
 
 def create_agent():
@@ -39,6 +39,7 @@ def create_agent():
         tools=[
             DuckDuckGoToolkit(),
             image_to_seo_html,
+            images_to_seo_html,
             CpanelDeployTools(),
         ],
         
@@ -53,5 +54,28 @@ def create_agent():
         markdown=True,
     )
 
+def create_post_writer():
+    """
+    Campaign posts ke liye halka agent: koi tools nahi (deploy / search / images nahi),
+    koi session storage / history nahi. Bulk jobs mein har post ek independent call hai.
+    """
+    return Agent(
+        name="Campaign Post Writer",
+        model=Ollama(
+            id="deepseek-v3.1:671b-cloud",
+        ),
+        instructions=POST_WRITER_INSTRUCTIONS,
+        markdown=False,
+    )
+
+def apply_brand_voice(message: str, voice_prompt: str | None) -> str:
+    """
+    Brand voice ko message ke aage "System Note" ki tarah jodta hai
+    (chat stream aur background worker dono ek hi format use karte hain).
+    """
+    if not voice_prompt:
+        return message
+    return f"System Instruction: Adopt the following persona:\n{voice_prompt}\n\nUser Query: {message}"
+
 # Global Instance (Singleton)
 unified_content_agent = create_agent()
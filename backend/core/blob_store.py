@@ -0,0 +1,135 @@
+# Blob Store
+# Bade task results (generated HTML, research dumps) ko Redis result backend / tasks.result
+# JSONB se bahar rakhne ke liye. Result mein sirf chhota reference jaata hai:
+#   {"$blob": "<sha256>", "bytes": 182304, "content_type": "text/html", "expires_at": ...}
+#
+# Local filesystem (content-addressed, same content = same file). Multi-node setup mein
+# TASK_BLOB_DIR ek shared volume hona chahiye jo API aur workers dono dekh sakein.
+
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
+
+DEFAULT_BLOB_DIR = os.getenv("TASK_BLOB_DIR", "tmp/task_blobs")
+INLINE_LIMIT_BYTES = int(os.getenv("TASK_RESULT_INLINE_LIMIT", str(16 * 1024)))
+
+# Expiry policies (seconds; None = kabhi expire nahi)
+EXPIRY_POLICIES: Dict[str, Optional[int]] = {
+    "generation": 30 * 24 * 60 * 60,   # generated blog; chat_messages mein copy bhi hai
+    "research": 24 * 60 * 60,          # research dumps: sirf us run ke kaam ke
+    "published": None,                 # deployed artifacts
+}
+
+
+class BlobStore:
+    def __init__(self, root: str = DEFAULT_BLOB_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def _path(self, blob_id: str) -> str:
+        return os.path.join(self.root, blob_id[:2], blob_id)
+
+    def put(self, data: Union[str, bytes], content_type: str = "text/plain", policy: str = "generation") -> Dict[str, Any]:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+        blob_id = hashlib.sha256(raw).hexdigest()
+        path = self._path(blob_id)
+        ttl = EXPIRY_POLICIES[policy]
+        expires_at = time.time() + ttl if ttl is not None else None
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if not os.path.exists(path):
+            # tmp + rename: aadha likha blob kabhi padha nahi jaata
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(raw)
+            os.replace(tmp_path, path)
+
+        meta_path = f"{path}.meta.json"
+        previous = self._read_meta(meta_path)
+        # Same content doosri policy se dobara aaye toh lambi expiry jeet-ti hai
+        if previous and (previous.get("expires_at") is None or (expires_at and previous["expires_at"] > expires_at)):
+            expires_at = previous.get("expires_at")
+        with open(meta_path, "w") as f:
+            json.dump({"content_type": content_type, "policy": policy, "expires_at": expires_at}, f)
+
+        return {
+            "$blob": blob_id,
+            "bytes": len(raw),
+            "content_type": content_type,
+            "expires_at": datetime.fromtimestamp(expires_at, timezone.utc).isoformat() if expires_at else None,
+        }
+
+    @staticmethod
+    def _read_meta(meta_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, ref: Dict[str, Any]) -> Optional[bytes]:
+        try:
+            with open(self._path(ref["$blob"]), "rb") as f:
+                return f.read()
+        except OSError:
+            return None  # expire ho chuka / purge ho gaya
+
+    def purge_expired(self) -> int:
+        removed = 0
+        now = time.time()
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".meta.json"):
+                    continue
+                meta_path = os.path.join(dirpath, name)
+                meta = self._read_meta(meta_path)
+                if meta and meta.get("expires_at") and meta["expires_at"] < now:
+                    for path in (meta_path[: -len(".meta.json")], meta_path):
+                        try:
+                            os.remove(path)
+                        except OSError:
+                            pass
+                    removed += 1
+        return removed
+
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and "$blob" in value
+
+
+def offload(result: Dict[str, Any], store: Optional[BlobStore] = None, policy: str = "generation",
+            content_types: Optional[Dict[str, str]] = None, inline_limit: int = INLINE_LIMIT_BYTES) -> Dict[str, Any]:
+    """Top-level values bigger than `inline_limit` (serialized) are replaced by blob references."""
+    store = store or BlobStore()
+    content_types = content_types or {}
+    compact = {}
+    for key, value in result.items():
+        serialized = value if isinstance(value, str) else json.dumps(value, default=str)
+        if len(serialized.encode("utf-8")) > inline_limit:
+            default_type = "text/plain" if isinstance(value, str) else "application/json"
+            compact[key] = store.put(serialized, content_types.get(key, default_type), policy)
+        else:
+            compact[key] = value
+    return compact
+
+
+def resolve(result: Dict[str, Any], store: Optional[BlobStore] = None) -> Dict[str, Any]:
+    """Blob references ko wapas content se replace (missing/expired → None + `expired` flag)."""
+    store = store or BlobStore()
+    resolved = {}
+    for key, value in result.items():
+        if not is_blob_ref(value):
+            resolved[key] = value
+            continue
+        raw = store.get(value)
+        if raw is None:
+            resolved[key] = None
+            resolved[f"{key}_expired"] = True
+        elif value.get("content_type") == "application/json":
+            resolved[key] = json.loads(raw)
+        else:
+            resolved[key] = raw.decode("utf-8")
+    return resolved
@@ -1,9 +1,31 @@
 import os
+import sys
 from celery import Celery
+from kombu import Queue
 
 # Get Redis URL from environment or default to localhost
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+# Named queues: lambi blog generations chhote interactive jobs ko starve na karein
+INTERACTIVE_QUEUE = "interactive"   # editor transforms, title generation (seconds)
+GENERATION_QUEUE = "generation"     # full blog / bulk generation (minutes)
+PUBLISHING_QUEUE = "publishing"     # cPanel deploy, sitemap, image uploads (I/O bound)
+
+# Per-queue worker settings (ek worker process per queue):
+#   python -m backend.core.celery_app generation
+# concurrency: parallel tasks; prefetch: har process kitne tasks pehle se reserve kare.
+# Lambi tasks ke liye prefetch 1, warna ek busy process ke paas tasks atke rehte hain.
+WORKER_PROFILES = {
+    INTERACTIVE_QUEUE: {"concurrency": int(os.getenv("INTERACTIVE_CONCURRENCY", "4")), "prefetch": 4},
+    GENERATION_QUEUE: {"concurrency": int(os.getenv("GENERATION_CONCURRENCY", "2")), "prefetch": 1},
+    PUBLISHING_QUEUE: {"concurrency": int(os.getenv("PUBLISHING_CONCURRENCY", "4")), "prefetch": 2},
+}
+
+# Idempotent tasks ke options: ack run ke baad, worker crash ho toh task wapas queue mein.
+# Generation tasks (LLM call + chat_messages / posts INSERT) pe mat lagao: redelivery pe
+# duplicate rows aur double LLM cost.
+RETRY_SAFE = {"acks_late": True, "reject_on_worker_lost": True}
+
 celery_app = Celery(
     "content_agent",
     broker=REDIS_URL,
@@ -17,4 +39,40 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="UTC",
     enable_utc=True,
+
+    task_queues=[Queue(name) for name in WORKER_PROFILES],
+    task_default_queue=INTERACTIVE_QUEUE,
+    task_routes={
+        "generate_*": {"queue": GENERATION_QUEUE},
+        "publish_*": {"queue": PUBLISHING_QUEUE},
+        "test_task": {"queue": INTERACTIVE_QUEUE},
+    },
+
+    # Ack-after-run globally nahi: sirf idempotent tasks (RETRY_SAFE) crash pe dobara chalte hain
+    worker_prefetch_multiplier=1,
+    # Redis visibility timeout sabse lambi generation se zyada ho
+    broker_transport_options={"visibility_timeout": 3 * 60 * 60},
+
+    # Result backend mein sirf compact results (bade payloads blob_store mein), woh bhi limited time
+    result_expires=int(os.getenv("CELERY_RESULT_EXPIRES", str(24 * 60 * 60))),
+    beat_schedule={
+        "purge-expired-blobs": {"task": "purge_expired_blobs", "schedule": 60 * 60},
+    },
 )
+
+
+def worker_argv(queue: str) -> list:
+    profile = WORKER_PROFILES[queue]
+    return [
+        "worker",
+        "-Q", queue,
+        "-n", f"{queue}@%h",
+        "--concurrency", str(profile["concurrency"]),
+        "--prefetch-multiplier", str(profile["prefetch"]),
+        "--loglevel", "INFO",
+    ]
+
+
+if __name__ == "__main__":
+    # python -m backend.core.celery_app <interactive|generation|publishing>
+    celery_app.worker_main(worker_argv(sys.argv[1] if len(sys.argv) > 1 else INTERACTIVE_QUEUE))
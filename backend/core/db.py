@@ -125,9 +125,16 @@ def init_custom_tables():
                     platform VARCHAR(50) DEFAULT 'linkedin',
                     scheduled_date TIMESTAMP,
                     status VARCHAR(50) DEFAULT 'draft',
+                    publish_error TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
             """))
+            conn.execute(text("ALTER TABLE posts ADD COLUMN IF NOT EXISTS publish_error TEXT;"))
+            # Scheduler ke liye: sirf scheduled posts index mein (drafts / published nahi)
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_posts_due ON posts (status, scheduled_date)
+                WHERE status = 'scheduled';
+            """))
             # ---------------------------------
             
             conn.commit()
@@ -0,0 +1,170 @@
+# Fair Share Limiter
+# LLM calls ke liye bounded concurrency + per-user fair share.
+# Total `capacity` slots; jitne users us waqt kaam maang rahe hain (running ya waiting),
+# har user ko max ceil(capacity / active_users) slots. Ek user ka 50-post campaign
+# doosre user ke 5-post campaign ko starve nahi karta, aur akela user saari capacity le sakta hai.
+#
+# - Redis (default): running leases aur waiting users do sorted sets mein, admit/deny ek Lua
+#   script mein atomic. Prefork pool ke saare processes (aur saare worker nodes) ek hi
+#   capacity share karte hain. Lease pe TTL: process crash ho toh slot LLM_SLOT_TTL ke baad khud free.
+# - Single-process dev setup (LLM_LIMITER=local) mein in-process limiter, Redis ki zaroorat nahi.
+
+import math
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+LIMITER_KIND = os.getenv("LLM_LIMITER", "redis")
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "6"))
+LLM_SLOT_TTL = int(os.getenv("LLM_SLOT_TTL", "600"))
+LLM_SLOT_POLL = float(os.getenv("LLM_SLOT_POLL", "0.2"))
+
+# KEYS: running, waiting. ARGV: member ("<user>|<token>"), now, capacity, lease_ttl, wait_ttl.
+# Score = expiry time; expire hue members (crashed process) pehle hi hata diye jaate hain.
+_ACQUIRE = """
+local running, waiting = KEYS[1], KEYS[2]
+local member, now = ARGV[1], tonumber(ARGV[2])
+local capacity, lease_ttl, wait_ttl = tonumber(ARGV[3]), tonumber(ARGV[4]), tonumber(ARGV[5])
+redis.call('ZREMRANGEBYSCORE', running, '-inf', now)
+redis.call('ZREMRANGEBYSCORE', waiting, '-inf', now)
+redis.call('ZADD', waiting, now + wait_ttl, member)
+
+local function user_of(m) return string.match(m, '^(.*)|[^|]*$') end
+local user = user_of(member)
+local active, users, total, mine = {}, 0, 0, 0
+for _, m in ipairs(redis.call('ZRANGE', running, 0, -1)) do
+    local u = user_of(m)
+    if not active[u] then active[u] = true; users = users + 1 end
+    total = total + 1
+    if u == user then mine = mine + 1 end
+end
+for _, m in ipairs(redis.call('ZRANGE', waiting, 0, -1)) do
+    local u = user_of(m)
+    if not active[u] then active[u] = true; users = users + 1 end
+end
+
+local admitted = 0
+if total < capacity and mine < math.max(1, math.ceil(capacity / users)) then
+    redis.call('ZREM', waiting, member)
+    redis.call('ZADD', running, now + lease_ttl, member)
+    admitted = 1
+end
+redis.call('EXPIRE', running, lease_ttl)
+redis.call('EXPIRE', waiting, lease_ttl)
+return admitted
+"""
+
+
+def _user_of(member: str) -> str:
+    return member.rsplit("|", 1)[0]
+
+
+class RedisFairShareLimiter:
+    """Saare processes / nodes ke beech shared limiter (same Redis + same `name`)."""
+
+    def __init__(self, capacity: int = LLM_MAX_CONCURRENCY, url: str = REDIS_URL, name: str = "llm",
+                 lease_ttl: int = LLM_SLOT_TTL, poll_interval: float = LLM_SLOT_POLL):
+        self.capacity = max(1, capacity)
+        self.url = url
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        # Waiting entry har poll pe refresh hoti hai; process mar jaaye toh jaldi expire
+        self.wait_ttl = max(5.0, poll_interval * 10)
+        self._running_key = f"fair-share:{name}:running"
+        self._waiting_key = f"fair-share:{name}:waiting"
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import redis
+            self._client = redis.Redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    def _try_acquire(self, member: str) -> bool:
+        return bool(self.client.eval(
+            _ACQUIRE, 2, self._running_key, self._waiting_key,
+            member, time.time(), self.capacity, self.lease_ttl, self.wait_ttl,
+        ))
+
+    @contextmanager
+    def slot(self, user_id: str):
+        member = f"{user_id}|{uuid.uuid4().hex}"
+        try:
+            while not self._try_acquire(member):
+                time.sleep(self.poll_interval)
+        except BaseException:
+            self.client.zrem(self._waiting_key, member)
+            raise
+        try:
+            yield
+        finally:
+            self.client.zrem(self._running_key, member)
+
+    def stats(self) -> dict:
+        now = time.time()
+        running, waiting = defaultdict(int), defaultdict(int)
+        for key, counts in ((self._running_key, running), (self._waiting_key, waiting)):
+            for member in self.client.zrangebyscore(key, now, "+inf"):
+                counts[_user_of(member)] += 1
+        return {"capacity": self.capacity, "running": dict(running), "waiting": dict(waiting)}
+
+
+class LocalFairShareLimiter:
+    """In-process limiter (ek worker process ke threads ke beech): dev / eager Celery."""
+
+    def __init__(self, capacity: int = LLM_MAX_CONCURRENCY):
+        self.capacity = max(1, capacity)
+        self._cond = threading.Condition()
+        self._running = defaultdict(int)
+        self._waiting = defaultdict(int)
+
+    def _share(self) -> int:
+        active = set(self._running) | set(self._waiting)
+        return max(1, math.ceil(self.capacity / max(1, len(active))))
+
+    def _can_run(self, user_id: str) -> bool:
+        in_flight = sum(self._running.values())
+        return in_flight < self.capacity and self._running.get(user_id, 0) < self._share()
+
+    @contextmanager
+    def slot(self, user_id: str):
+        with self._cond:
+            self._waiting[user_id] += 1
+            try:
+                while not self._can_run(user_id):
+                    self._cond.wait()
+            finally:
+                self._waiting[user_id] -= 1
+                if not self._waiting[user_id]:
+                    del self._waiting[user_id]
+            self._running[user_id] += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._running[user_id] -= 1
+                if not self._running[user_id]:
+                    del self._running[user_id]
+                # Share badal sakta hai (user gaya), sab waiters dobara check karein
+                self._cond.notify_all()
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"capacity": self.capacity, "running": dict(self._running), "waiting": dict(self._waiting)}
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_limiter():
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = LocalFairShareLimiter() if LIMITER_KIND == "local" else RedisFairShareLimiter()
+    return _limiter
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Index, text
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime
 
@@ -99,7 +99,13 @@ class Post(Base):
     content = Column(Text, nullable=False)
     platform = Column(String(50), default='linkedin') # linkedin, twitter, etc
     scheduled_date = Column(DateTime, nullable=True)
-    status = Column(String(50), default='draft') # draft, scheduled, published
+    status = Column(String(50), default='draft') # draft, scheduled, publishing, published, failed
+    publish_error = Column(Text, nullable=True) # failed: kyun (client missing / platform error)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     campaign = relationship("Campaign", back_populates="posts")
+
+    # Partial index: scheduler sirf due scheduled posts padhta hai
+    __table_args__ = (
+        Index('idx_posts_due', 'status', 'scheduled_date', postgresql_where=text("status = 'scheduled'")),
+    )
@@ -0,0 +1,166 @@
+# Post Import
+# Content calendar (hundreds / thousands of posts) ek saath `posts` mein daalna.
+#
+# - Rows batches mein (POST_IMPORT_BATCH): har batch ek ownership query (saare naye
+#   campaign ids ek `ANY` mein), ek bulk insert, ek commit.
+# - Insert: psycopg3 `COPY ... FROM STDIN` (sabse tez), driver mein copy na ho toh executemany.
+# - Har row ka result wapas: {"index", "id"} ya {"index", "error"}; kharab rows baaki import nahi rokti.
+
+import os
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from backend.core.db import auth_engine
+
+IMPORT_BATCH_SIZE = int(os.getenv("POST_IMPORT_BATCH", "1000"))
+IMPORT_METHOD = os.getenv("POST_IMPORT_METHOD", "copy")  # copy | executemany
+MAX_CONTENT_LENGTH = 10_000
+# core/db.py ke posts columns: VARCHAR(255) / VARCHAR(50). Lambi value poore COPY batch ko fail karti.
+MAX_CAMPAIGN_ID_LENGTH = 255
+MAX_PLATFORM_LENGTH = 50
+POST_COLUMNS = ("id", "campaign_id", "content", "platform", "scheduled_date", "status")
+
+
+def _text_field(raw: Dict[str, Any], name: str, max_length: int) -> str:
+    value = raw.get(name)
+    if value is None:
+        value = ""
+    if not isinstance(value, str):
+        raise ValueError(f"{name} must be a string")
+    value = value.strip()
+    if len(value) > max_length:
+        raise ValueError(f"{name} longer than {max_length} characters")
+    # Postgres text mein NUL byte allowed nahi (COPY poora batch reject karta)
+    if "\x00" in value:
+        raise ValueError(f"{name} contains a NUL character")
+    return value
+
+
+def _scheduled_date(value: Any) -> Optional[datetime]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            raise ValueError(f"invalid scheduled_date: {value!r}")
+    elif not isinstance(value, datetime):
+        raise ValueError("scheduled_date must be an ISO 8601 string")
+    if value.tzinfo:
+        # posts.scheduled_date naive UTC hai (TIMESTAMP; offset Postgres chupchap ignore karta)
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def normalize_row(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON object / CSV row → posts row. Type aur column size yahin check hote hain taaki ek kharab
+    row insert batch tak na pahunche; galat row pe ValueError (message per-row result mein jaata hai).
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("row must be an object")
+    campaign_id = _text_field(raw, "campaign_id", MAX_CAMPAIGN_ID_LENGTH)
+    content = _text_field(raw, "content", MAX_CONTENT_LENGTH)
+    platform = _text_field(raw, "platform", MAX_PLATFORM_LENGTH).lower() or "linkedin"
+    if not campaign_id:
+        raise ValueError("campaign_id is required")
+    if not content:
+        raise ValueError("content is required")
+    scheduled = _scheduled_date(raw.get("scheduled_date"))
+
+    return {
+        "id": str(uuid.uuid4()),
+        "campaign_id": campaign_id,
+        "content": content,
+        "platform": platform,
+        "scheduled_date": scheduled,
+        # create_post jaisa: date ho toh scheduler utha lega
+        "status": "scheduled" if scheduled else "draft",
+    }
+
+
+def _owned_campaigns(conn, user_id: str, campaign_ids: List[str]) -> set:
+    if not campaign_ids:
+        return set()
+    rows = conn.execute(
+        text("SELECT id FROM campaigns WHERE user_id = :uid AND id = ANY(:ids)"),
+        {"uid": user_id, "ids": campaign_ids}
+    ).fetchall()
+    return {row.id for row in rows}
+
+
+def insert_rows(conn, rows: List[Dict[str, Any]], method: str = IMPORT_METHOD):
+    if not rows:
+        return
+    if method == "copy":
+        # Same transaction: SQLAlchemy connection ka hi DBAPI connection (psycopg3 mein `cursor.copy`)
+        with conn.connection.driver_connection.cursor() as cur:
+            if hasattr(cur, "copy"):
+                with cur.copy(f"COPY posts ({', '.join(POST_COLUMNS)}) FROM STDIN") as copy:
+                    for row in rows:
+                        copy.write_row(tuple(row[c] for c in POST_COLUMNS))
+                return
+    conn.execute(text("""
+        INSERT INTO posts (id, campaign_id, content, platform, scheduled_date, status)
+        VALUES (:id, :campaign_id, :content, :platform, :scheduled_date, :status)
+    """), rows)
+
+
+def _flush(conn, user_id: str, batch: list, owned: Dict[str, bool], results: list, method: str) -> int:
+    """
+    Ek batch insert + commit. Row results commit ke baad hi likhe jaate hain; batch fail ho toh
+    rollback aur sirf isi batch ki rows error (pichle committed batches apne ids ke saath rehte hain).
+    """
+    if not batch:
+        return 0
+    try:
+        # Ownership: is batch ke naye campaign ids ek hi query mein (pichle batches ka cache)
+        unseen = list({row["campaign_id"] for _, row in batch} - owned.keys())
+        found = _owned_campaigns(conn, user_id, unseen)
+        owned.update({cid: cid in found for cid in unseen})
+
+        valid = [(index, row) for index, row in batch if owned[row["campaign_id"]]]
+        insert_rows(conn, [row for _, row in valid], method)
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"Post import batch failed ({len(batch)} rows): {e}")
+        results.extend({"index": index, "error": f"Batch insert failed: {e}"} for index, _ in batch)
+        return 0
+
+    results.extend(
+        {"index": index, "id": row["id"]} if owned[row["campaign_id"]]
+        else {"index": index, "error": "Campaign not found"}
+        for index, row in batch
+    )
+    return len(valid)
+
+
+def import_posts(user_id: str, raw_rows: Iterable[Dict[str, Any]],
+                 batch_size: int = IMPORT_BATCH_SIZE, method: str = IMPORT_METHOD) -> Dict[str, Any]:
+    """
+    Rows ko batches mein validate + insert karta hai (iterable streaming ho sakta hai, jaise CSV reader).
+    Har batch apna commit; kisi batch ka DB error sirf usi batch ki rows ko fail karta hai,
+    aur per-row results hamesha wapas aate hain.
+    """
+    results: List[Dict[str, Any]] = []
+    owned: Dict[str, bool] = {}
+    batch = []
+    created = 0
+
+    with auth_engine.connect() as conn:
+        for index, raw in enumerate(raw_rows):
+            try:
+                batch.append((index, normalize_row(raw)))
+            except ValueError as e:
+                results.append({"index": index, "error": str(e)})
+            if len(batch) >= batch_size:
+                created += _flush(conn, user_id, batch, owned, results, method)
+                batch = []
+        created += _flush(conn, user_id, batch, owned, results, method)
+
+    results.sort(key=lambda r: r["index"])
+    return {"created": created, "failed": len(results) - created, "results": results}
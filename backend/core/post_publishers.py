@@ -0,0 +1,31 @@
+# Post Publishers
+# Platform (linkedin, twitter, ...) → client jo ek post ko sach mein platform pe bhejta hai.
+# Scheduler sirf registered platforms ke posts claim karta hai; baaki `scheduled` hi rehte hain
+# jab tak unka client na aa jaye. `publish_post` yahan se client leta hai; client na mile toh
+# post `failed` hota hai (publish_error ke saath), kabhi `published` nahi.
+#
+# Naya client:
+#   @register("linkedin")
+#   def publish_to_linkedin(post) -> None: ...   # fail ho toh exception raise karo
+
+from typing import Any, Callable, Dict, List, Optional
+
+Publisher = Callable[[Any], None]
+
+_PUBLISHERS: Dict[str, Publisher] = {}
+
+
+def register(platform: str) -> Callable[[Publisher], Publisher]:
+    def decorator(fn: Publisher) -> Publisher:
+        _PUBLISHERS[platform.lower()] = fn
+        return fn
+    return decorator
+
+
+def get_publisher(platform: Optional[str]) -> Optional[Publisher]:
+    return _PUBLISHERS.get((platform or "").lower())
+
+
+def platforms() -> List[str]:
+    """Platforms jinka client registered hai."""
+    return sorted(_PUBLISHERS)
@@ -0,0 +1,160 @@
+# Post Scheduler
+# Scheduled campaign posts ko unke time pe publish worker tak bhejta hai.
+#
+# - Poori `posts` table scan nahi: sirf agle LOOKAHEAD window ke scheduled posts
+#   partial index (idx_posts_due) se padhe jaate hain, har REFRESH pe incrementally.
+# - Memory mein min-heap (scheduled_date, post_id): loop agle due post tak sota hai.
+# - Claim `FOR UPDATE SKIP LOCKED` se: kai scheduler nodes saath chal sakte hain,
+#   ek post sirf ek node claim karta hai (status scheduled → publishing).
+# - Sirf un platforms ke posts jinka client `post_publishers` mein registered hai; baaki
+#   `scheduled` hi rehte hain (failed nahi hote) jab tak client na aa jaye.
+#
+# Chalane ke liye:
+#   python -m backend.core.post_scheduler
+
+import heapq
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import text
+
+from backend.core import post_publishers
+from backend.core.db import auth_engine
+
+REFRESH_SECONDS = int(os.getenv("SCHEDULER_REFRESH_SECONDS", "30"))
+LOOKAHEAD_SECONDS = int(os.getenv("SCHEDULER_LOOKAHEAD_SECONDS", str(60 * 60)))
+CLAIM_BATCH = int(os.getenv("SCHEDULER_CLAIM_BATCH", "100"))
+
+
+def _dispatch_to_worker(post_id: str):
+    from backend.worker import publish_post
+    publish_post.delay(post_id)
+
+
+class PostScheduler:
+    def __init__(self, dispatch: Optional[Callable[[str], None]] = None,
+                 refresh_seconds: int = REFRESH_SECONDS, lookahead_seconds: int = LOOKAHEAD_SECONDS,
+                 claim_batch: int = CLAIM_BATCH):
+        self.dispatch = dispatch or _dispatch_to_worker
+        self.refresh_seconds = refresh_seconds
+        self.lookahead = timedelta(seconds=lookahead_seconds)
+        self.claim_batch = claim_batch
+        self._heap: List[tuple] = []
+        # post_id → scheduled_date; reschedule hone pe purani heap entry yahan match nahi karti (lazy delete)
+        self._known: Dict[str, datetime] = {}
+        self._last_refresh = 0.0
+
+    def refresh(self, now: datetime) -> int:
+        """Lookahead window ke scheduled posts; sirf naye / reschedule hue heap mein jaate hain."""
+        platforms = post_publishers.platforms()
+        rows = []
+        if platforms:
+            with auth_engine.connect() as conn:
+                rows = conn.execute(text("""
+                    SELECT id, scheduled_date FROM posts
+                    WHERE status = 'scheduled' AND scheduled_date <= :horizon
+                      AND lower(platform) = ANY(:platforms)
+                    ORDER BY scheduled_date
+                """), {"horizon": now + self.lookahead, "platforms": platforms}).fetchall()
+
+        added = 0
+        for row in rows:
+            if self._known.get(row.id) != row.scheduled_date:
+                self._known[row.id] = row.scheduled_date
+                heapq.heappush(self._heap, (row.scheduled_date, row.id))
+                added += 1
+        self._last_refresh = time.monotonic()
+        return added
+
+    def next_due(self) -> Optional[datetime]:
+        # Stale entries (rescheduled / already claimed) top se hatao
+        while self._heap and self._known.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def claim_due(self, now: datetime) -> List[str]:
+        """Due posts claim karo (doosre node ke locked rows skip), status → publishing."""
+        platforms = post_publishers.platforms()
+        if not platforms:
+            return []
+        with auth_engine.connect() as conn:
+            rows = conn.execute(text("""
+                UPDATE posts SET status = 'publishing'
+                WHERE id IN (
+                    SELECT id FROM posts
+                    WHERE status = 'scheduled' AND scheduled_date <= :now
+                      AND lower(platform) = ANY(:platforms)
+                    ORDER BY scheduled_date
+                    LIMIT :limit
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id
+            """), {"now": now, "platforms": platforms, "limit": self.claim_batch}).fetchall()
+            conn.commit()
+        return [row.id for row in rows]
+
+    def _release(self, post_id: str):
+        # Dispatch fail (broker down): post wapas scheduled, agle tick pe retry
+        with auth_engine.connect() as conn:
+            conn.execute(text("""
+                UPDATE posts SET status = 'scheduled' WHERE id = :id AND status = 'publishing'
+            """), {"id": post_id})
+            conn.commit()
+
+    def run_due(self, now: datetime) -> List[str]:
+        # Due entries heap se nikaalo: ya hum claim karenge, ya doosra node kar chuka
+        # (still scheduled reh gaye toh agla refresh wapas le aayega)
+        while self._heap and self._heap[0][0] <= now:
+            scheduled_date, post_id = heapq.heappop(self._heap)
+            if self._known.get(post_id) == scheduled_date:
+                del self._known[post_id]
+
+        dispatched = []
+        while True:
+            claimed = self.claim_due(now)
+            failed = False
+            for post_id in claimed:
+                try:
+                    self.dispatch(post_id)
+                    dispatched.append(post_id)
+                except Exception as e:
+                    print(f"Post dispatch failed ({post_id}): {e}")
+                    self._release(post_id)
+                    failed = True
+            # Poora batch mila toh aur due posts ho sakte hain (dispatch fail ho raha ho toh ruk jao)
+            if failed or len(claimed) < self.claim_batch:
+                return dispatched
+
+    def tick(self, now: Optional[datetime] = None) -> float:
+        """Ek iteration; return: agle tick tak kitne seconds sona hai."""
+        now = now or datetime.utcnow()
+        if time.monotonic() - self._last_refresh >= self.refresh_seconds:
+            self.refresh(now)
+        due = self.next_due()
+        if due is not None and due <= now:
+            self.run_due(now)
+            due = self.next_due()
+
+        sleep_for = self.refresh_seconds - (time.monotonic() - self._last_refresh)
+        if due is not None:
+            sleep_for = min(sleep_for, (due - now).total_seconds())
+        return max(0.0, sleep_for)
+
+    def run_forever(self, stop: Optional[threading.Event] = None):
+        stop = stop or threading.Event()
+        print(f"Post scheduler started (refresh {self.refresh_seconds}s, lookahead {self.lookahead})")
+        while not stop.is_set():
+            try:
+                sleep_for = self.tick()
+            except Exception as e:
+                # DB blip: scheduler band nahi hona chahiye
+                print(f"Post scheduler tick failed: {e}")
+                sleep_for = self.refresh_seconds
+            stop.wait(sleep_for)
+
+
+if __name__ == "__main__":
+    PostScheduler().run_forever()
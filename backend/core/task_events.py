@@ -0,0 +1,161 @@
+# Task Events
+# Worker se task progress events API tak push karne ke liye (polling ki jagah).
+#
+# - Worker har progress change pe `publish()` karta hai: latest snapshot ek Redis key mein
+#   (TTL ke saath) + wahi event pub/sub channel pe.
+# - API SSE / long-poll endpoint channel subscribe karta hai, aur bulk status endpoint saare
+#   snapshots ek hi MGET mein padhta hai.
+# - Single-node / dev setup (TASK_EVENTS_BROKER=local) mein in-process broker, Redis ki zaroorat nahi.
+
+import asyncio
+import json
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+BROKER_KIND = os.getenv("TASK_EVENTS_BROKER", "redis")
+SNAPSHOT_TTL_SECONDS = int(os.getenv("TASK_EVENTS_TTL", str(24 * 60 * 60)))
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+
+def _channel(task_id: str) -> str:
+    return f"task-events:{task_id}"
+
+
+def _snapshot_key(task_id: str) -> str:
+    return f"task-status:{task_id}"
+
+
+def is_terminal(event: Optional[Dict[str, Any]]) -> bool:
+    return bool(event) and event.get("status") in TERMINAL_STATUSES
+
+
+class Subscription:
+    """One task's event stream: `await next(timeout)` → event or None on timeout."""
+
+    def __init__(self, queue: "asyncio.Queue[Dict[str, Any]]"):
+        self._queue = queue
+
+    async def next(self, timeout: float) -> Optional[Dict[str, Any]]:
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class RedisBroker:
+    def __init__(self, url: str = REDIS_URL):
+        self.url = url
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import redis
+            self._client = redis.Redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    def publish(self, task_id: str, event: Dict[str, Any]):
+        payload = json.dumps(event, default=str)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(_snapshot_key(task_id), payload, ex=SNAPSHOT_TTL_SECONDS)
+        pipe.publish(_channel(task_id), payload)
+        pipe.execute()
+
+    def snapshots(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not task_ids:
+            return {}
+        values = self.client.mget([_snapshot_key(t) for t in task_ids])
+        return {t: json.loads(v) for t, v in zip(task_ids, values) if v}
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: str) -> AsyncIterator[Subscription]:
+        import redis.asyncio as aioredis
+
+        client = aioredis.Redis.from_url(self.url, decode_responses=True)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(_channel(task_id))
+        queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+
+        async def _pump():
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    await queue.put(json.loads(message["data"]))
+
+        pump = asyncio.create_task(_pump())
+        try:
+            yield Subscription(queue)
+        finally:
+            pump.cancel()
+            await pubsub.unsubscribe(_channel(task_id))
+            await pubsub.aclose()
+            await client.aclose()
+
+
+class LocalBroker:
+    """In-process broker: worker aur API ek hi process mein (dev / eager Celery)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._subscribers: Dict[str, Set[tuple]] = {}
+
+    def publish(self, task_id: str, event: Dict[str, Any]):
+        with self._lock:
+            self._snapshots[task_id] = event
+            subscribers = list(self._subscribers.get(task_id, ()))
+        for loop, queue in subscribers:
+            # Worker thread se API ke event loop mein safely daalna
+            loop.call_soon_threadsafe(queue.put_nowait, event)
+
+    def snapshots(self, task_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {t: self._snapshots[t] for t in task_ids if t in self._snapshots}
+
+    @asynccontextmanager
+    async def subscribe(self, task_id: str) -> AsyncIterator[Subscription]:
+        entry = (asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._subscribers.setdefault(task_id, set()).add(entry)
+        try:
+            yield Subscription(entry[1])
+        finally:
+            with self._lock:
+                self._subscribers.get(task_id, set()).discard(entry)
+                if not self._subscribers.get(task_id):
+                    self._subscribers.pop(task_id, None)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = LocalBroker() if BROKER_KIND == "local" else RedisBroker()
+    return _broker
+
+
+def publish(task_id: str, event: Dict[str, Any]):
+    """Best effort: event bus down ho toh bhi task chalta rahe."""
+    try:
+        get_broker().publish(task_id, {"task_id": task_id, **event})
+    except Exception as e:
+        print(f"Task event publish failed ({task_id}): {e}")
+
+
+def snapshots(task_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    try:
+        return get_broker().snapshots(list(task_ids))
+    except Exception as e:
+        print(f"Task snapshot read failed: {e}")
+        return {}
+
+
+def subscribe(task_id: str):
+    return get_broker().subscribe(task_id)
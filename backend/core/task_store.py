@@ -0,0 +1,61 @@
+# Task Store
+# `tasks` table ke liye chhote helpers (API aur Celery worker dono use karte hain).
+# API task row banata hai (pending), worker running → completed / failed karta hai.
+
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+
+from backend.core.db import auth_engine
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+FINISHED_STATUSES = (COMPLETED, FAILED)
+
+
+def create_task(task_id: str, chat_id: str, task_type: str, result: Optional[Dict[str, Any]] = None):
+    with auth_engine.connect() as conn:
+        conn.execute(text("""
+            INSERT INTO tasks (id, chat_id, type, status, result)
+            VALUES (:id, :cid, :type, :status, CAST(:result AS JSONB))
+        """), {
+            "id": task_id,
+            "cid": chat_id,
+            "type": task_type,
+            "status": PENDING,
+            "result": json.dumps(result) if result is not None else None,
+        })
+        conn.commit()
+
+
+def update_task(task_id: str, status: str, result: Optional[Dict[str, Any]] = None):
+    with auth_engine.connect() as conn:
+        conn.execute(text("""
+            UPDATE tasks
+            SET status = :status,
+                result = COALESCE(CAST(:result AS JSONB), result),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = :id
+        """), {
+            "id": task_id,
+            "status": status,
+            "result": json.dumps(result, default=str) if result is not None else None,
+        })
+        conn.commit()
+
+
+
+def get_tasks(task_ids: Iterable[str]) -> List[Dict[str, Any]]:
+    """Many task rows in one query (missing ids are simply absent)."""
+    ids = list(dict.fromkeys(task_ids))
+    if not ids:
+        return []
+    with auth_engine.connect() as conn:
+        rows = conn.execute(text("""
+            SELECT id, chat_id, type, status, result, created_at, updated_at
+            FROM tasks WHERE id = ANY(:ids)
+        """), {"ids": ids}).mappings().all()
+    return [dict(row) for row in rows]
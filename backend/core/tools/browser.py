@@ -0,0 +1,536 @@
+import asyncio
+import concurrent.futures
+import inspect
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, List, Dict, Optional
+
+from agno.tools import Toolkit
+from agno.utils.log import logger
+
+from backend.core.tools.text_match import HintMatcher
+
+try:
+    from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+except ImportError:
+    raise ImportError(
+        "Install playwright using `pip install playwright` "
+        "and run `playwright install chromium`"
+    )
+
+# Images, fonts, media and stylesheets are not needed to read page text.
+DEFAULT_BLOCKED_RESOURCES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+class _Slot:
+    """One warm browser; every page gets its own fresh context inside it."""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.last_used = time.monotonic()
+        self.uses = 0
+
+    def healthy(self) -> bool:
+        return self.browser.is_connected()
+
+
+class AsyncBrowserPool:
+    """
+    Async browser pool with warm browsers, resource blocking and autoscaling.
+
+    Only the browser process is reused. Each page runs in a fresh context that is
+    closed afterwards, so cookies, localStorage, sessionStorage, IndexedDB and
+    service workers never carry over to the next run or user.
+
+    The pool runs on its own event loop thread, so sync tool code can call
+    `run()` from any thread and async code can await `page()` on that loop.
+
+    Args:
+        min_size: Browsers kept warm at all times.
+        max_size: Upper bound when scaling up under load.
+        headless: Run browsers in headless mode.
+        proxy: Optional proxy configuration for every context.
+        block_resources: Resource types aborted before download.
+        scale_up_wait: Queue wait (seconds) after which a new browser is launched.
+        idle_ttl: Idle seconds before a browser above min_size is closed.
+        acquire_timeout: Max seconds to wait for a free browser.
+        health_interval: Seconds between health checks of idle browsers.
+    """
+    # Har distinct config ka apna pool (headless / proxy / size alag ho toh alag browsers)
+    _instances: Dict[tuple, "AsyncBrowserPool"] = {}
+    _instances_pid = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        min_size: int = 1,
+        max_size: int = 4,
+        headless: bool = True,
+        proxy: Optional[Dict[str, str]] = None,
+        block_resources=DEFAULT_BLOCKED_RESOURCES,
+        scale_up_wait: float = 0.5,
+        idle_ttl: float = 120.0,
+        acquire_timeout: float = 30.0,
+        health_interval: float = 30.0,
+    ):
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.headless = headless
+        self.proxy = proxy
+        self.block_resources = frozenset(block_resources or ())
+        self.scale_up_wait = scale_up_wait
+        self.idle_ttl = idle_ttl
+        self.acquire_timeout = acquire_timeout
+        self.health_interval = health_interval
+
+        self._slots: set = set()
+        self._launching = 0
+        self._waits: deque = deque(maxlen=200)
+        self._counters = {"launched": 0, "recycled": 0, "scaled_down": 0, "pages": 0, "blocked_requests": 0}
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="browser-pool", daemon=True)
+        self._thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        except Exception:
+            # Chromium missing / launch failed: don't leave the loop thread behind
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            raise
+
+    @classmethod
+    def _config_key(cls, kwargs: Dict[str, Any]) -> tuple:
+        # Defaults bhar ke compare: instance() aur instance(headless=True) ek hi pool hain
+        bound = inspect.signature(cls.__init__).bind(None, **kwargs)
+        bound.apply_defaults()
+        key = []
+        for name, value in list(bound.arguments.items())[1:]:
+            if isinstance(value, dict):
+                value = tuple(sorted(value.items()))
+            elif isinstance(value, (set, frozenset, list, tuple)):
+                value = frozenset(value)
+            key.append((name, value))
+        return tuple(key)
+
+    @classmethod
+    def instance(cls, **kwargs) -> "AsyncBrowserPool":
+        """Shared pool for this config (per process; fork ke baad naye pools)."""
+        key = cls._config_key(kwargs)
+        with cls._lock:
+            if cls._instances_pid != os.getpid():
+                cls._instances = {}
+                cls._instances_pid = os.getpid()
+            if key not in cls._instances:
+                cls._instances[key] = cls(**kwargs)
+        return cls._instances[key]
+
+    @staticmethod
+    def _wait(future: concurrent.futures.Future, timeout: float) -> Any:
+        # Timeout pe coroutine cancel: warna woh loop pe chalta rehta hai aur browser slot pakde rehta hai
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def _start(self):
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._playwright = await async_playwright().start()
+        for _ in range(self.min_size):
+            await self._idle.put(await self._launch())
+        self._health_task = asyncio.ensure_future(self._health_loop())
+
+    def _size(self) -> int:
+        return len(self._slots) + self._launching
+
+    async def _launch(self) -> _Slot:
+        self._launching += 1
+        try:
+            browser = await self._playwright.chromium.launch(headless=self.headless)
+            slot = _Slot(browser)
+            self._slots.add(slot)
+            self._counters["launched"] += 1
+            return slot
+        finally:
+            self._launching -= 1
+
+    async def _new_context(self, slot: _Slot):
+        context = await slot.browser.new_context(proxy=self.proxy)
+        if self.block_resources:
+            await context.route("**/*", self._route)
+        return context
+
+    async def _route(self, route):
+        if route.request.resource_type in self.block_resources:
+            self._counters["blocked_requests"] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _discard(self, slot: _Slot):
+        self._slots.discard(slot)
+        try:
+            await slot.browser.close()
+        except Exception:
+            pass
+
+    async def _acquire(self) -> _Slot:
+        started = self._loop.time()
+        deadline = started + self.acquire_timeout
+        while True:
+            if self._idle.empty() and self._size() < self.min_size:
+                slot = await self._launch()
+            else:
+                try:
+                    slot = await asyncio.wait_for(self._idle.get(), timeout=self.scale_up_wait)
+                except asyncio.TimeoutError:
+                    # Waited too long: scale up if allowed, else keep waiting until the deadline
+                    if self._size() < self.max_size:
+                        slot = await self._launch()
+                    elif self._loop.time() >= deadline:
+                        raise RuntimeError("No browser available in pool")
+                    else:
+                        continue
+            if not slot.healthy():
+                # Crashed browser: replace it and try again
+                self._counters["recycled"] += 1
+                await self._discard(slot)
+                continue
+            self._waits.append(self._loop.time() - started)
+            return slot
+
+    async def _release(self, slot: _Slot):
+        slot.last_used = time.monotonic()
+        slot.uses += 1
+        if not slot.healthy():
+            self._counters["recycled"] += 1
+            await self._discard(slot)
+            return
+        await self._idle.put(slot)
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            try:
+                await self._check_idle()
+            except Exception as e:
+                logger.error(f"[Playwright] Pool health check failed: {e}")
+
+    async def _check_idle(self):
+        idle = []
+        while not self._idle.empty():
+            idle.append(self._idle.get_nowait())
+        now = time.monotonic()
+        for slot in idle:
+            if not slot.healthy():
+                self._counters["recycled"] += 1
+                await self._discard(slot)
+            elif self._size() > self.min_size and now - slot.last_used > self.idle_ttl:
+                self._counters["scaled_down"] += 1
+                await self._discard(slot)
+            else:
+                await self._idle.put(slot)
+        while self._size() < self.min_size:
+            await self._idle.put(await self._launch())
+
+    @asynccontextmanager
+    async def page(self, timeout_ms: int = 30000):
+        """Open a page in a fresh context of a warm browser; the context is closed and the browser returned on exit."""
+        slot = await self._acquire()
+        context = None
+        try:
+            context = await self._new_context(slot)
+            page = await context.new_page()
+            page.set_default_timeout(timeout_ms)
+            self._counters["pages"] += 1
+            yield page
+        finally:
+            if context is not None:
+                # Context band = uski saari storage (cookies, local/session storage, IndexedDB, service workers) khatam
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            await self._release(slot)
+
+    async def visit(
+        self,
+        url: str,
+        fn: Callable[[Any], Awaitable[Any]],
+        timeout_ms: int = 30000,
+        wait_until: str = "domcontentloaded",
+    ) -> Any:
+        async with self.page(timeout_ms) as page:
+            await page.goto(url, wait_until=wait_until)
+            return await fn(page)
+
+    def run(
+        self,
+        url: str,
+        fn: Callable[[Any], Awaitable[Any]],
+        timeout_ms: int = 30000,
+        wait_until: str = "domcontentloaded",
+    ) -> Any:
+        """Sync bridge: open `url`, await `fn(page)` on the pool loop and return its result."""
+        future = asyncio.run_coroutine_threadsafe(
+            self.visit(url, fn, timeout_ms, wait_until), self._loop
+        )
+        return self._wait(future, timeout_ms / 1000 + self.acquire_timeout)
+
+    def run_many(
+        self,
+        urls: List[str],
+        fn: Callable[[Any], Awaitable[Any]],
+        timeout_ms: int = 15000,
+        max_concurrency: int = 4,
+        wait_until: str = "domcontentloaded",
+    ) -> List[Any]:
+        """
+        Sync bridge for several URLs at once: at most `max_concurrency` pages run
+        concurrently and each URL gets its own deadline. Results come back in URL
+        order; a failed or timed-out URL yields its exception instead of a value.
+        """
+
+        async def _all():
+            limit = asyncio.Semaphore(max_concurrency)
+
+            async def _one(url):
+                async with limit:
+                    return await asyncio.wait_for(
+                        self.visit(url, fn, timeout_ms, wait_until), timeout=timeout_ms / 1000
+                    )
+
+            return await asyncio.gather(*(_one(url) for url in urls), return_exceptions=True)
+
+        future = asyncio.run_coroutine_threadsafe(_all(), self._loop)
+        batches = -(-len(urls) // max(max_concurrency, 1))
+        return self._wait(future, batches * timeout_ms / 1000 + self.acquire_timeout)
+
+    def stats(self) -> dict:
+        waits = sorted(self._waits)
+        return {
+            "size": len(self._slots),
+            "idle": self._idle.qsize(),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "wait_p50_ms": round(waits[len(waits) // 2] * 1000, 1) if waits else 0.0,
+            "wait_max_ms": round(waits[-1] * 1000, 1) if waits else 0.0,
+            **self._counters,
+        }
+
+    def close(self):
+        async def _close():
+            self._health_task.cancel()
+            for slot in list(self._slots):
+                await self._discard(slot)
+            await self._playwright.stop()
+
+        asyncio.run_coroutine_threadsafe(_close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+def render_page_text(url: str, timeout_ms: int = 20000) -> str:
+    """Render a page in the headless pool and return its visible body text (for JS-rendered pages)."""
+
+    async def _body_text(page) -> str:
+        return await page.inner_text("body")
+
+    return AsyncBrowserPool.instance().run(url, _body_text, timeout_ms=timeout_ms, wait_until="load")
+
+
+class PlaywrightTools(Toolkit):
+    """
+    Playwright Toolkit for web scraping and automation.
+
+    Args:
+        headless: Run browser in headless mode.
+        pool_size: Max number of browsers in the pool.
+        proxy: Optional proxy configuration.
+        timeout_ms: Default page timeout in milliseconds.
+        block_resources: Resource types to skip loading (images, fonts, media, stylesheets).
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        pool_size: int = 2,
+        proxy: Optional[Dict[str, str]] = None,
+        timeout_ms: int = 30000,
+        block_resources=DEFAULT_BLOCKED_RESOURCES,
+    ):
+        self.headless = headless
+        self.pool_size = pool_size
+        self.proxy = proxy
+        self.timeout_ms = timeout_ms
+        self.block_resources = block_resources
+        self._pool: Optional[AsyncBrowserPool] = None
+
+        super().__init__(
+            name="playwright_tools",
+            tools=[
+                self.observe_page,
+                self.run_actions,
+                self.extract_candidates,
+                self.crawl,
+            ],
+        )
+
+    @property
+    def pool(self) -> AsyncBrowserPool:
+        if self._pool is None:
+            self._pool = AsyncBrowserPool.instance(
+                max_size=self.pool_size,
+                headless=self.headless,
+                proxy=self.proxy,
+                block_resources=self.block_resources,
+            )
+        return self._pool
+
+    def observe_page(self, url: str) -> str:
+        """
+        Observe page structure without selectors.
+
+        Args:
+            url: The URL to observe.
+
+        Returns:
+            JSON string with headings, buttons, links, and body preview.
+        """
+
+        async def _observe(page) -> dict:
+            logger.debug(f"[Playwright] Observing {url}")
+            return {
+                "headings": await page.locator("h1, h2, h3").all_inner_texts(),
+                "buttons": await page.locator("button").all_inner_texts(),
+                "links": await page.locator("a").all_inner_texts(),
+                "body_preview": (await page.inner_text("body"))[:4000],
+            }
+
+        try:
+            data = self.pool.run(url, _observe, timeout_ms=self.timeout_ms)
+            return json.dumps(data, indent=2)
+        except PlaywrightTimeout as e:
+            logger.warning(f"[Playwright] Timeout observing {url}: {e}")
+            return json.dumps({"error": f"Timeout: {e}"})
+        except Exception as e:
+            logger.error(f"[Playwright] Error observing {url}: {e}")
+            return json.dumps({"error": str(e)})
+
+    def run_actions(self, url: str, steps: List[Dict[str, Any]]) -> str:
+        """
+        Run declarative actions on a page.
+
+        Args:
+            url: The URL to navigate to.
+            steps: List of action dicts (action, selector, value, text).
+
+        Returns:
+            JSON string with steps executed and extracted data.
+        """
+
+        async def _run(page) -> dict:
+            logger.debug(f"[Playwright] Running actions on {url}")
+            extracted = []
+            for step in steps:
+                action = step.get("action")
+                if action == "scroll":
+                    await page.mouse.wheel(0, random.randint(300, 700))
+                    await page.wait_for_timeout(random.randint(200, 600))
+                elif action == "click":
+                    await page.click(step["selector"])
+                elif action == "fill":
+                    await page.fill(step["selector"], step["value"])
+                elif action == "wait_for_text":
+                    await page.wait_for_function(
+                        "text => document.body.innerText.includes(text)",
+                        arg=step["text"],
+                        timeout=5000,
+                    )
+                elif action == "extract_text":
+                    extracted.append({
+                        "selector": step["selector"],
+                        "text": (await page.inner_text(step["selector"])).strip(),
+                    })
+                else:
+                    return {"error": f"Unsupported action: {action}"}
+            return {"steps_executed": len(steps), "extracted": extracted}
+
+        try:
+            return json.dumps(self.pool.run(url, _run, timeout_ms=self.timeout_ms), indent=2)
+        except Exception as e:
+            logger.error(f"[Playwright] Error running actions: {e}")
+            return json.dumps({"error": str(e)})
+
+    def extract_candidates(self, url: str, hints: List[str], max_per_hint: int = 5) -> str:
+        """
+        Extract text matching hints from a page.
+
+        Args:
+            url: The URL to scrape.
+            hints: Keywords to search for.
+            max_per_hint: Max matches per hint.
+
+        Returns:
+            JSON string with matched lines.
+        """
+
+        async def _body(page) -> str:
+            return await page.inner_text("body")
+
+        try:
+            body = self.pool.run(url, _body, timeout_ms=self.timeout_ms)
+            matches = HintMatcher(hints).match_lines(body, max_per_hint)
+            return json.dumps({"url": url, "matches": matches}, indent=2)
+        except Exception as e:
+            logger.error(f"[Playwright] Error extracting candidates: {e}")
+            return json.dumps({"error": str(e)})
+
+    def crawl(
+        self,
+        urls: List[str],
+        hints: List[str],
+        max_per_hint: int = 5,
+        per_url_timeout_ms: int = 15000,
+        max_concurrency: int = 4,
+    ) -> str:
+        """
+        Extract text matching hints from several pages concurrently.
+
+        Args:
+            urls: The URLs to scrape.
+            hints: Keywords to search for (matched in a single pass per page).
+            max_per_hint: Max matches per hint per page.
+            per_url_timeout_ms: Deadline for each URL; slow pages are reported as errors.
+            max_concurrency: Max pages open at the same time.
+
+        Returns:
+            JSON string with matched lines (or an error) per URL.
+        """
+
+        async def _body(page) -> str:
+            return await page.inner_text("body")
+
+        urls = list(dict.fromkeys(urls))
+        try:
+            bodies = self.pool.run_many(
+                urls, _body, timeout_ms=per_url_timeout_ms, max_concurrency=max_concurrency
+            )
+        except Exception as e:
+            logger.error(f"[Playwright] Error crawling: {e}")
+            return json.dumps({"error": str(e)})
+
+        # One compiled pattern for all pages
+        matcher = HintMatcher(hints)
+        results = []
+        for url, body in zip(urls, bodies):
+            if isinstance(body, BaseException):
+                reason = "Timeout" if isinstance(body, (asyncio.TimeoutError, PlaywrightTimeout)) else str(body)
+                results.append({"url": url, "error": reason})
+            else:
+                results.append({"url": url, "matches": matcher.match_lines(body, max_per_hint)})
+        return json.dumps({"results": results}, indent=2)
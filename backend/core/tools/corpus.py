@@ -0,0 +1,217 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Hamari apni chhoti "Library" (local research corpus).
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+`search_and_fetch` jo pages padhta hai, woh tool call ke baad phenk diye jaate the.
+Alag-alag users milte-julte topics pe likhte hain, toh wahi sources dobara search + fetch hote the.
+Yahan har fetched page ka text ek on-disk inverted index (SQLite) mein jaata hai,
+aur agent `search_corpus` se BM25 ranking ke saath pehle yahan dhund sakta hai.
+"""
+
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from agno.utils.log import logger
+
+DEFAULT_CORPUS_PATH = os.getenv("RESEARCH_CORPUS_PATH", "tmp/research_corpus.db")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the to was were will with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+class ResearchCorpus:
+    """
+    On-disk inverted index over fetched page text, ranked with BM25.
+
+    Args:
+        path: SQLite file path (shared across worker processes).
+        max_bytes: Stored text ka upper bound; sabse purane pages pehle nikalte hain.
+        k1: BM25 term-frequency saturation.
+        b: BM25 length normalization.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CORPUS_PATH,
+        max_bytes: int = 100 * 1024 * 1024,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.k1 = k1
+        self.b = b
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._init_db()
+
+    @classmethod
+    def instance(cls, **kwargs) -> "ResearchCorpus":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(**kwargs)
+        return cls._instance
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS corpus_docs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT UNIQUE NOT NULL,
+                    title TEXT,
+                    text TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    length INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_corpus_docs_fetched ON corpus_docs (fetched_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS corpus_postings (
+                    term TEXT NOT NULL,
+                    doc_id INTEGER NOT NULL REFERENCES corpus_docs(id) ON DELETE CASCADE,
+                    tf INTEGER NOT NULL,
+                    PRIMARY KEY (term, doc_id)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_corpus_postings_doc ON corpus_postings (doc_id)")
+
+    def add(self, url: str, text: str, title: Optional[str] = None):
+        """Page ko index karta hai (same URL pe text badla ho toh re-index)."""
+        if not url or not text:
+            return
+        now = time.time()
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT id, text_hash FROM corpus_docs WHERE url = ?", (url,)
+                ).fetchone()
+                if row and row[1] == text_hash:
+                    # Content wahi hai, sirf freshness update
+                    conn.execute("UPDATE corpus_docs SET fetched_at = ? WHERE id = ?", (now, row[0]))
+                    return
+                if row:
+                    conn.execute("DELETE FROM corpus_docs WHERE id = ?", (row[0],))
+
+                terms = Counter(tokenize(f"{title or ''} {text}"))
+                cursor = conn.execute(
+                    "INSERT INTO corpus_docs (url, title, text, text_hash, length, size, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (url, title, text, text_hash, sum(terms.values()), len(text.encode("utf-8")), now),
+                )
+                conn.executemany(
+                    "INSERT INTO corpus_postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                    [(term, cursor.lastrowid, tf) for term, tf in terms.items()],
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Corpus index failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM corpus_docs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for doc_id, size in conn.execute(
+            "SELECT id, size FROM corpus_docs ORDER BY fetched_at ASC"
+        ).fetchall():
+            conn.execute("DELETE FROM corpus_docs WHERE id = ?", (doc_id,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def search(self, query: str, max_results: int = 5, max_age_seconds: Optional[float] = None,
+               content_chars: int = 0) -> List[Dict]:
+        """
+        BM25 ranked docs; `max_age_seconds` se purane pages ignore hote hain.
+        `content_chars` > 0 ho toh har result mein stored page text (itne chars tak) bhi.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        min_fetched = time.time() - max_age_seconds if max_age_seconds else 0.0
+
+        with self._connect() as conn:
+            n_docs, total_len = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM corpus_docs WHERE fetched_at >= ?",
+                (min_fetched,),
+            ).fetchone()
+            if not n_docs:
+                return []
+            avg_len = total_len / n_docs
+
+            scores: Dict[int, float] = {}
+            for term in terms:
+                postings = conn.execute("""
+                    SELECT p.doc_id, p.tf, d.length FROM corpus_postings p
+                    JOIN corpus_docs d ON d.id = p.doc_id
+                    WHERE p.term = ? AND d.fetched_at >= ?
+                """, (term, min_fetched)).fetchall()
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf, length in postings:
+                    norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_len))
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+
+            top = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:max_results]
+            results = []
+            for doc_id, score in top:
+                url, title, text, fetched_at = conn.execute(
+                    "SELECT url, title, text, fetched_at FROM corpus_docs WHERE id = ?", (doc_id,)
+                ).fetchone()
+                results.append({
+                    "url": url,
+                    "title": title,
+                    "score": round(score, 4),
+                    "snippet": self._snippet(text, terms),
+                    "fetched_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(fetched_at)),
+                })
+                if content_chars:
+                    results[-1]["content"] = text[:content_chars]
+            return results
+
+    @staticmethod
+    def _snippet(text: str, terms: List[str], width: int = 300) -> str:
+        lowered = text.lower()
+        positions = [p for p in (lowered.find(t) for t in terms) if p >= 0]
+        start = max(0, min(positions) - width // 3) if positions else 0
+        return text[start:start + width]
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            docs, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM corpus_docs"
+            ).fetchone()
+            terms = conn.execute("SELECT COUNT(DISTINCT term) FROM corpus_postings").fetchone()[0]
+        return {"docs": docs, "terms": terms, "bytes": size, "max_bytes": self.max_bytes}
@@ -1,14 +1,27 @@
 import os
 import re
+import json
+import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
 import xml.etree.ElementTree as ET
 
-import requests
 from agno.tools import Toolkit
 from agno.utils.log import logger
 
+from backend.core.tools.deploy_manifest import DeployManifest
+from backend.core.tools.http_client import HttpClient
+from backend.core.tools.publish import (
+    PublishReport,
+    compressed_variants,
+    inline_critical_css,
+    minify_html,
+)
+from backend.core.tools.sitemap_index import SitemapIndex
+from backend.core.tools.sitemap_queue import SitemapWriteQueue
+
 
 class CpanelDeployTools(Toolkit):
     def __init__(
@@ -18,6 +31,14 @@ class CpanelDeployTools(Toolkit):
         token: Optional[str] = None,
         public_dir: str = "/public_html",
         site_url: Optional[str] = None,
+        http_client: Optional[HttpClient] = None,
+        max_parallel_uploads: int = 4,
+        sitemap_index: Optional[SitemapIndex] = None,
+        deploy_manifest: Optional[DeployManifest] = None,
+        sitemap_window: float = 0.25,
+        minify: bool = True,
+        precompress: bool = True,
+        critical_css: Optional[str] = None,
         **kwargs
     ):
         self.host = host or os.getenv("CPANEL_HOST")
@@ -25,14 +46,37 @@ class CpanelDeployTools(Toolkit):
         self.token = token or os.getenv("CPANEL_API_TOKEN")
         self.public_dir = public_dir or os.getenv("CPANEL_PUBLIC_DIR", "/public_html")
         self.site_url = site_url or os.getenv("SITE_BASE_URL")
+        self.max_parallel_uploads = max_parallel_uploads
+        self._http = http_client
+        self._sitemap_index = sitemap_index
+        self._deploy_manifest = deploy_manifest
+        # Injected client / index (default wale lazily bante hain, unki identity key mein nahi)
+        self._injected_deps = tuple(id(dep) if dep is not None else None for dep in (http_client, sitemap_index))
+        self.sitemap_window = sitemap_window
+        self.minify = minify
+        self.precompress = precompress
+        self.critical_css = critical_css
 
         tools = [
             self.deploy_to_cpanel,
             self.update_sitemap,
+            self.deploy_batch,
+            self.sync_deploy_manifest,
         ]
 
         super().__init__(name="cpanel_deploy_tools", tools=tools, **kwargs)
 
+    @property
+    def http(self) -> HttpClient:
+        # Same CPANEL_HOST pe baar-baar calls jaati hain, pooled client connection reuse karta hai
+        return self._http or HttpClient.instance()
+
+    @property
+    def deploy_manifest(self) -> DeployManifest:
+        if self._deploy_manifest is None:
+            self._deploy_manifest = DeployManifest(self.site_url)
+        return self._deploy_manifest
+
     def _get_headers(self) -> dict:
         return {"Authorization": f"cpanel {self.user}:{self.token}"}
 
@@ -41,43 +85,103 @@ class CpanelDeployTools(Toolkit):
             return "cPanel env vars missing (CPANEL_HOST, CPANEL_USER, CPANEL_API_TOKEN, SITE_BASE_URL)"
         return None
 
-    def deploy_to_cpanel(
-        self,
-        html_content: str,
-        blog_title: str,
-        dry_run: bool = False,
-    ) -> str:
-        """
-        Deploy HTML content to cPanel hosting.
-
-        Args:
-            html_content: The HTML content to deploy.
-            blog_title: The title of the blog post (used for filename/slug).
-            dry_run: If True, returns preview without deploying.
-
-        Returns:
-            str: JSON result with status, filename, and URL.
-        """
-        import json
-
-        if error := self._validate_config():
-            return json.dumps({"status": "error", "reason": error})
-
-        if not html_content or len(html_content.strip()) < 100:
-            return json.dumps({"status": "error", "reason": "HTML content too short"})
+    # -------------------------
+    # FILE HELPERS
+    # -------------------------
+    def _save_file(self, filename: str, content: str, timeout: int = 20) -> Tuple[bool, str]:
+        """Upload one file into public_dir. Returns (ok, response text for logging)."""
+        res = self.http.post(
+            f"{self.host}/execute/Fileman/save_file_content",
+            headers=self._get_headers(),
+            data={"dir": self.public_dir, "file": filename, "content": content},
+            timeout=timeout,
+        )
+        return res.status_code == 200 and res.json().get("status") == 1, res.text
+
+    def _fetch_file(self, filename: str, timeout: int = 15) -> Optional[str]:
+        """Read one file from public_dir, or None if it does not exist."""
+        fetch = self.http.get(
+            f"{self.host}/execute/Fileman/get_file_content",
+            headers=self._get_headers(),
+            params={"dir": self.public_dir, "file": filename},
+            timeout=timeout,
+        )
+        if fetch.status_code == 200 and fetch.json().get("status") == 1:
+            return fetch.json()["data"]["content"]
+        return None
 
+    def _upload_binary(self, filename: str, data: bytes, timeout: int = 20) -> Tuple[bool, str]:
+        """Binary upload (.gz / .br) — save_file_content sirf text leta hai."""
+        res = self.http.post(
+            f"{self.host}/execute/Fileman/upload_files",
+            headers=self._get_headers(),
+            data={"dir": self.public_dir, "overwrite": "1"},
+            files={"file-1": (filename, data, "application/octet-stream")},
+            timeout=timeout,
+        )
+        body = res.json() if res.status_code == 200 else {}
+        return body.get("status") == 1 and bool((body.get("data") or {}).get("succeeded")), res.text
+
+    def _upload(self, report: PublishReport, filename: str, content: Union[str, bytes],
+                timeout: int = 20, raw_size: Optional[int] = None) -> Tuple[bool, str]:
+        start = time.perf_counter()
+        ok, response_text = False, ""
+        try:
+            if isinstance(content, bytes):
+                ok, response_text = self._upload_binary(filename, content, timeout=timeout)
+            else:
+                ok, response_text = self._save_file(filename, content, timeout=timeout)
+            return ok, response_text
+        finally:
+            size = len(content if isinstance(content, bytes) else content.encode("utf-8"))
+            report.record(filename, size, time.perf_counter() - start, ok, raw_size)
+
+    def _publish(self, report: PublishReport, filename: str, content: str,
+                 timeout: int = 20, raw_size: Optional[int] = None) -> Tuple[bool, str]:
+        """Main file upload, fir .gz/.br siblings. Sibling fail hona deploy fail nahi karta."""
+        ok, response_text = self._upload(report, filename, content, timeout=timeout, raw_size=raw_size)
+        if ok and self.precompress:
+            for suffix, data in compressed_variants(content.encode("utf-8")).items():
+                try:
+                    sibling_ok, sibling_text = self._upload(report, filename + suffix, data, timeout=timeout)
+                    if not sibling_ok:
+                        logger.warning(f"Compressed sibling upload failed for {filename}{suffix}: {sibling_text[:200]}")
+                except Exception as e:
+                    logger.warning(f"Compressed sibling upload failed for {filename}{suffix}: {e}")
+        return ok, response_text
+
+    def _list_files(self, timeout: int = 20) -> List[str]:
+        """Names of regular files in public_dir."""
+        res = self.http.get(
+            f"{self.host}/execute/Fileman/list_files",
+            headers=self._get_headers(),
+            params={"dir": self.public_dir, "types": "file"},
+            timeout=timeout,
+        )
+        body = res.json() if res.status_code == 200 else {}
+        if body.get("status") != 1:
+            raise RuntimeError(f"list_files failed: {res.text[:200]}")
+        return [f["file"] for f in body.get("data") or []]
+
+    # -------------------------
+    # PAGE DEPLOY
+    # -------------------------
+    def _page_target(self, html_content: str, blog_title: str) -> Tuple[str, str, str]:
         # SEO-safe slug
         slug = re.sub(r"[^a-z0-9]+", "-", blog_title.lower()).strip("-")[:60]
         content_hash = hashlib.md5(html_content.encode()).hexdigest()[:6]
         filename = f"{slug}-{content_hash}.html"
-        permalink = f"{self.site_url}/{filename}"
+        return slug, filename, f"{self.site_url}/{filename}"
 
-        if dry_run:
-            return json.dumps({"status": "preview", "filename": filename, "url": permalink})
+    @staticmethod
+    def _manifest_hash(html_content: str, blog_title: str) -> str:
+        # Title bhi wrapper (<title>) mein jaata hai, toh hash dono ka
+        return hashlib.md5(f"{blog_title}\0{html_content}".encode()).hexdigest()
 
+    def _wrap_html(self, html_content: str, blog_title: str, permalink: str) -> str:
         # SEO wrapper
         description = re.sub("<[^<]+?>", "", html_content)[:155]
-        full_html = f"""<!doctype html>
+        return f"""<!doctype html>
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -93,94 +197,313 @@ class CpanelDeployTools(Toolkit):
 </html>
 """
 
-        try:
-            res = requests.post(
-                f"{self.host}/execute/Fileman/save_file_content",
-                headers=self._get_headers(),
-                data={"dir": self.public_dir, "file": filename, "content": full_html},
-                timeout=20,
-            )
+    def _optimize_page(self, page: str) -> str:
+        # Page speed: minify (+ critical CSS inline, agar site ne di ho). Saari files isi shape mein upload hoti hain
+        if self.critical_css:
+            page = inline_critical_css(page, self.critical_css)
+        return minify_html(page) if self.minify else page
+
+    def _deploy_page(self, html_content: str, blog_title: str, dry_run: bool = False) -> Dict:
+        if not html_content or len(html_content.strip()) < 100:
+            return {"status": "error", "reason": "HTML content too short"}
 
-            if res.status_code != 200 or res.json().get("status") != 1:
-                logger.error(f"Deploy failed: {res.text}")
-                return json.dumps({"status": "error", "reason": "Deploy failed"})
+        slug, filename, permalink = self._page_target(html_content, blog_title)
+        content_hash = self._manifest_hash(html_content, blog_title)
 
+        try:
+            # Same content pehle deploy ho chuka hai (retry / history replay) → upload skip
+            previous = self.deploy_manifest.get(slug)
+            if previous and previous.content_hash == content_hash:
+                return {
+                    "status": "unchanged",
+                    "filename": previous.filename,
+                    "url": previous.url,
+                    "deployed_at": datetime.utcfromtimestamp(previous.deployed_at).isoformat()
+                }
+
+            if dry_run:
+                return {"status": "preview", "filename": filename, "url": permalink}
+
+            page = self._wrap_html(html_content, blog_title, permalink)
+            raw_size = len(page.encode("utf-8"))
+            page = self._optimize_page(page)
+
+            report = PublishReport()
+            ok, response_text = self._publish(report, filename, page, raw_size=raw_size)
+            if not ok:
+                logger.error(f"Deploy failed: {response_text}")
+                return {"status": "error", "reason": "Deploy failed"}
+
+            entry = self.deploy_manifest.record(slug, content_hash, filename, permalink)
             logger.info(f"Deployed {filename} to {permalink}")
-            return json.dumps({
+            return {
                 "status": "success",
                 "filename": filename,
                 "url": permalink,
-                "deployed_at": datetime.utcnow().isoformat()
-            })
+                "deployed_at": datetime.utcfromtimestamp(entry.deployed_at).isoformat(),
+                "publish": report.summary()
+            }
 
         except Exception as e:
             logger.error(f"Deploy exception: {e}")
-            return json.dumps({"status": "error", "reason": str(e)})
+            return {"status": "error", "reason": str(e)}
 
-    def update_sitemap(self, page_url: str) -> str:
+    def deploy_to_cpanel(
+        self,
+        html_content: str,
+        blog_title: str,
+        dry_run: bool = False,
+    ) -> str:
         """
-        Safely update sitemap.xml with a new page URL.
+        Deploy HTML content to cPanel hosting.
 
         Args:
-            page_url: The full URL of the page to add to sitemap.
+            html_content: The HTML content to deploy.
+            blog_title: The title of the blog post (used for filename/slug).
+            dry_run: If True, returns preview without deploying.
 
         Returns:
-            str: JSON result with status and sitemap URL.
+            str: JSON result with status, filename, and URL. Status is "unchanged"
+                 (with the existing URL) when identical content was already deployed.
         """
-        import json
-
         if error := self._validate_config():
             return json.dumps({"status": "error", "reason": error})
 
-        try:
-            # Fetch existing sitemap
-            fetch = requests.get(
-                f"{self.host}/execute/Fileman/get_file_content",
-                headers=self._get_headers(),
-                params={"dir": self.public_dir, "file": "sitemap.xml"},
-                timeout=15,
-            )
-
-            sitemap_exists = fetch.status_code == 200 and fetch.json().get("status") == 1
-
-            if sitemap_exists:
-                root = ET.fromstring(fetch.json()["data"]["content"])
-                for loc in root.findall(".//{*}loc"):
-                    if loc.text == page_url:
-                        return json.dumps({
-                            "status": "ok",
-                            "message": "URL already exists in sitemap",
-                            "sitemap": f"{self.site_url}/sitemap.xml"
-                        })
-            else:
-                root = ET.Element("urlset", xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
+        return json.dumps(self._deploy_page(html_content, blog_title, dry_run))
 
-            # Append new URL
-            url_el = ET.SubElement(root, "url")
-            ET.SubElement(url_el, "loc").text = page_url
-            ET.SubElement(url_el, "lastmod").text = datetime.utcnow().date().isoformat()
+    def deploy_batch(
+        self,
+        posts: List[Dict[str, str]],
+        update_sitemap: bool = True,
+        dry_run: bool = False,
+    ) -> str:
+        """
+        Deploy many pages at once, then add all new URLs to sitemap.xml in one rewrite.
 
-            xml_data = ET.tostring(root, encoding="utf-8", xml_declaration=True)
+        Args:
+            posts: List of {"html_content": ..., "blog_title": ...} dicts.
+            update_sitemap: If True, add every successfully deployed URL to the sitemap.
+            dry_run: If True, returns previews without deploying.
 
-            save = requests.post(
-                f"{self.host}/execute/Fileman/save_file_content",
-                headers=self._get_headers(),
-                data={"dir": self.public_dir, "file": "sitemap.xml", "content": xml_data},
-                timeout=15,
-            )
+        Returns:
+            str: JSON with per-page results (same shape as deploy_to_cpanel) and the sitemap result.
+        """
+        if error := self._validate_config():
+            return json.dumps({"status": "error", "reason": error})
+        if not posts:
+            return json.dumps({"status": "error", "reason": "No posts given"})
+
+        def _deploy(post: Dict[str, str]) -> Dict:
+            return {
+                "blog_title": post.get("blog_title"),
+                **self._deploy_page(post.get("html_content") or "", post.get("blog_title") or "", dry_run),
+            }
+
+        # Bounded parallelism: cPanel host ko ek saath 30 uploads se overload nahi karna
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_parallel_uploads, len(posts))),
+            thread_name_prefix="cpanel-deploy",
+        ) as executor:
+            results = list(executor.map(_deploy, posts))
+
+        deployed = [r["url"] for r in results if r["status"] == "success"]
+        sitemap = None
+        if update_sitemap and deployed and not dry_run:
+            sitemap = self._queue_sitemap_update(deployed)
+
+        failed = sum(1 for r in results if r["status"] == "error")
+        return json.dumps({
+            "status": "success" if not failed else ("partial" if failed < len(results) else "error"),
+            "deployed": len(deployed),
+            "unchanged": sum(1 for r in results if r["status"] == "unchanged"),
+            "uploaded_bytes": sum(r["publish"]["uploaded_bytes"] for r in results if "publish" in r),
+            "failed": failed,
+            "results": results,
+            "sitemap": sitemap,
+        })
+
+    def sync_deploy_manifest(self, prune_missing: bool = True) -> str:
+        """
+        Compare the deploy manifest with the files actually present on the server.
+
+        Args:
+            prune_missing: If True, drop manifest entries whose file is gone from the server,
+                so the next deploy of that post uploads it again.
+
+        Returns:
+            str: JSON with in-sync count, pages missing on the server, and untracked remote pages.
+        """
+        if error := self._validate_config():
+            return json.dumps({"status": "error", "reason": error})
+
+        try:
+            remote = set(self._list_files())
+        except Exception as e:
+            logger.error(f"Manifest sync failed: {e}")
+            return json.dumps({"status": "error", "reason": str(e)})
 
-            if save.status_code != 200 or save.json().get("status") != 1:
-                return json.dumps({"status": "error", "reason": "Failed to save sitemap"})
+        entries = self.deploy_manifest.entries()
+        tracked = {e.filename for e in entries}
+        missing = [e for e in entries if e.filename not in remote]
+        untracked = sorted(f for f in remote if f.endswith(".html") and f not in tracked)
+
+        if prune_missing and missing:
+            self.deploy_manifest.remove([e.slug for e in missing])
+
+        return json.dumps({
+            "status": "success",
+            "in_sync": len(entries) - len(missing),
+            "missing_remote": [{"slug": e.slug, "filename": e.filename} for e in missing],
+            "pruned": len(missing) if prune_missing else 0,
+            "untracked_remote": untracked,
+        })
+
+    # -------------------------
+    # SITEMAP
+    # -------------------------
+    @property
+    def sitemap_index(self) -> SitemapIndex:
+        if self._sitemap_index is None:
+            self._sitemap_index = SitemapIndex(self.site_url)
+        return self._sitemap_index
+
+    def _import_remote_sitemap(self, index: SitemapIndex) -> Dict[int, List[str]]:
+        """
+        First run: purane sitemap.xml (flat urlset ya sitemap index) ke URLs local index mein laao.
+        """
+        content = self._fetch_file("sitemap.xml")
+        if content is None:
+            return {}
+
+        root = ET.fromstring(content)
+        documents = [root]
+        if root.tag.endswith("sitemapindex"):
+            documents = []
+            for loc in root.findall(".//{*}sitemap/{*}loc"):
+                shard_content = self._fetch_file(loc.text.rsplit("/", 1)[-1])
+                if shard_content is not None:
+                    documents.append(ET.fromstring(shard_content))
+
+        by_lastmod: Dict[Optional[str], List[str]] = {}
+        for doc in documents:
+            for url_el in doc.findall("{*}url"):
+                loc = url_el.find("{*}loc")
+                if loc is not None and loc.text:
+                    lastmod = url_el.find("{*}lastmod")
+                    by_lastmod.setdefault(lastmod.text if lastmod is not None else None, []).append(loc.text.strip())
+
+        imported: Dict[int, List[str]] = {}
+        for lastmod, urls in by_lastmod.items():
+            for shard, added in index.add(urls, lastmod).items():
+                imported.setdefault(shard, []).extend(added)
+        logger.info(f"Imported {sum(map(len, imported.values()))} URL(s) from remote sitemap into local index")
+        return imported
+
+    @property
+    def sitemap_queue(self) -> SitemapWriteQueue:
+        return SitemapWriteQueue.for_site(
+            self.site_url, self._add_to_sitemap, config_key=self._sitemap_writer_key(), window=self.sitemap_window
+        )
+
+    def _sitemap_writer_key(self) -> tuple:
+        # Writer isi instance ke credentials / client / index use karta hai: inmein se kuch bhi alag ho
+        # toh alag queue. Injected objects identity se (queue unhe zinda rakhta hai, id reuse nahi hota).
+        return (self.host, self.user, self.token, self.public_dir, self.minify, self.precompress) + self._injected_deps
+
+    def _add_to_sitemap(self, page_urls: List[str]) -> Dict:
+        """Queue writer: one locked (cross-process) sitemap update for a coalesced URL list."""
+        with self.sitemap_index.writer_lock():
+            return self._write_sitemap(page_urls)
+
+    def _queue_sitemap_update(self, page_urls: List[str], timeout: float = 60) -> Dict:
+        future = self.sitemap_queue.submit(page_urls)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            return {"status": "error", "reason": "Sitemap update timed out"}
+        except Exception as e:
+            return {"status": "error", "reason": str(e)}
 
-            logger.info(f"Added {page_url} to sitemap")
-            return json.dumps({
+    def _write_sitemap(self, page_urls: List[str]) -> Dict:
+        """
+        Add URLs to the sharded sitemap. Membership is checked against the local index,
+        and only the shards that gained URLs are re-rendered and uploaded.
+        """
+        index = self.sitemap_index
+        sitemap_url = f"{self.site_url}/sitemap.xml"
+        pending: List[str] = []
+        try:
+            # Pehli baar: remote sitemap ko local index mein import, fir sab shards + index upload
+            imported = self._import_remote_sitemap(index) if len(index) == 0 else {}
+            pending.extend(u for urls in imported.values() for u in urls)
+
+            shards_before = set(index.shards())
+            added = index.add(page_urls, datetime.utcnow().date().isoformat())
+            new_urls = [u for urls in added.values() for u in urls]
+            pending.extend(new_urls)
+
+            if not new_urls and not imported:
+                return {
+                    "status": "ok",
+                    "message": "URL already exists in sitemap",
+                    "sitemap": sitemap_url
+                }
+
+            uploaded = []
+            report = PublishReport()
+            for shard in sorted(set(added) | set(imported)):
+                filename = index.shard_filename(shard)
+                ok, _ = self._publish(report, filename, index.render_shard(shard), timeout=15)
+                if not ok:
+                    index.remove(pending)
+                    return {"status": "error", "reason": f"Failed to save {filename}"}
+                uploaded.append(filename)
+
+            # Index sirf tab re-upload jab shards ki list badli
+            if imported or set(added) - shards_before:
+                ok, _ = self._publish(report, "sitemap.xml", index.render_index(), timeout=15)
+                if not ok:
+                    index.remove(pending)
+                    return {"status": "error", "reason": "Failed to save sitemap"}
+                uploaded.append("sitemap.xml")
+
+            logger.info(f"Added {len(new_urls)} URL(s) to sitemap, uploaded {uploaded}")
+            return {
                 "status": "success",
-                "added_url": page_url,
-                "sitemap": f"{self.site_url}/sitemap.xml"
-            })
+                "added_urls": new_urls,
+                "uploaded": uploaded,
+                "publish": report.summary(),
+                "sitemap": sitemap_url
+            }
 
         except ET.ParseError:
-            return json.dumps({"status": "error", "reason": "sitemap.xml corrupted", "action": "manual_fix_required"})
+            if pending:
+                index.remove(pending)
+            return {"status": "error", "reason": "sitemap.xml corrupted", "action": "manual_fix_required"}
         except Exception as e:
+            if pending:
+                index.remove(pending)
             logger.error(f"Sitemap update exception: {e}")
-            return json.dumps({"status": "error", "reason": str(e)})
\ No newline at end of file
+            return {"status": "error", "reason": str(e)}
+
+    def update_sitemap(self, page_url: str) -> str:
+        """
+        Safely update sitemap.xml with a new page URL.
+
+        Args:
+            page_url: The full URL of the page to add to sitemap.
+
+        Returns:
+            str: JSON result with status and sitemap URL.
+        """
+        if error := self._validate_config():
+            return json.dumps({"status": "error", "reason": error})
+
+        # Concurrent publishers ek hi write cycle mein coalesce hote hain
+        result = self._queue_sitemap_update([page_url])
+        if result["status"] == "success":
+            if page_url in result["added_urls"]:
+                result = {"status": "success", "added_url": page_url, "sitemap": result["sitemap"]}
+            else:
+                result = {"status": "ok", "message": "URL already exists in sitemap", "sitemap": result["sitemap"]}
+        return json.dumps(result)
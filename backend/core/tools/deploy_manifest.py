@@ -0,0 +1,98 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Deploy manifest: har site ke liye slug → (content hash, filename, URL, deployed_at).
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Agent retry ya history replay pe same HTML dobara deploy karta hai. Manifest dekh ke
+pata chal jaata hai ki content badla hi nahi, toh upload skip karke purana permalink
+lauta dete hain.
+"""
+
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional
+
+DEFAULT_DEPLOY_MANIFEST_PATH = os.getenv("DEPLOY_MANIFEST_PATH", "tmp/deploy_manifest.db")
+
+
+class ManifestEntry(NamedTuple):
+    slug: str
+    content_hash: str
+    filename: str
+    url: str
+    deployed_at: float
+
+
+class DeployManifest:
+    """
+    Persisted record of what has been deployed to one site.
+
+    Args:
+        site_url: Site base URL (manifest is kept per site).
+        path: SQLite file path (shared across worker processes).
+    """
+
+    def __init__(self, site_url: str, path: str = DEFAULT_DEPLOY_MANIFEST_PATH):
+        self.site_url = site_url.rstrip("/")
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS deploy_manifest (
+                    site TEXT NOT NULL,
+                    slug TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    deployed_at REAL NOT NULL,
+                    PRIMARY KEY (site, slug)
+                ) WITHOUT ROWID
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, slug: str) -> Optional[ManifestEntry]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT slug, content_hash, filename, url, deployed_at FROM deploy_manifest "
+                "WHERE site = ? AND slug = ?",
+                (self.site_url, slug),
+            ).fetchone()
+        return ManifestEntry(*row) if row else None
+
+    def record(self, slug: str, content_hash: str, filename: str, url: str) -> ManifestEntry:
+        entry = ManifestEntry(slug, content_hash, filename, url, time.time())
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO deploy_manifest "
+                "(site, slug, content_hash, filename, url, deployed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.site_url, *entry),
+            )
+        return entry
+
+    def remove(self, slugs: List[str]):
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM deploy_manifest WHERE site = ? AND slug = ?",
+                [(self.site_url, slug) for slug in slugs],
+            )
+
+    def entries(self) -> List[ManifestEntry]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT slug, content_hash, filename, url, deployed_at FROM deploy_manifest "
+                "WHERE site = ? ORDER BY slug",
+                (self.site_url,),
+            ).fetchall()
+        return [ManifestEntry(*row) for row in rows]
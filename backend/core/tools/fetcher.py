@@ -0,0 +1,240 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Tiered page fetcher: pehle sasta raasta (plain HTTP), zaroorat ho tabhi mehnga (headless browser).
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Plain HTTP JS-rendered pages (React/Next/Angular SPAs) ka khaali shell deta hai → text empty.
+Browser har page pe chalana bahut mehnga hai. Isliye:
+1. HTTP se fetch karo.
+2. Text bahut kam hai aur SPA markers dikh rahe hain? → browser tier pe escalate.
+3. Domain ke liye kaunsa tier kaam aaya, yaad rakho (SQLite), taaki agli baar seedha wahi tier.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional
+from urllib.parse import urlparse
+
+from agno.utils.log import logger
+
+from backend.core.tools.html_extract import extract_text_stream
+from backend.core.tools.http_client import HttpClient
+
+DEFAULT_TIER_STORE_PATH = os.getenv("FETCH_TIER_STORE_PATH", "tmp/fetch_tiers.db")
+
+TIER_HTTP = "http"
+TIER_BROWSER = "browser"
+
+# Page ke shuru mein yeh dikhe aur text na ho → page JS se banta hai
+SPA_MARKERS = re.compile(
+    rb'id=["\'](?:root|app|__next|__nuxt|svelte)["\']\s*>\s*</div>'
+    rb'|ng-app|data-reactroot|window\.__INITIAL_STATE__|__NEXT_DATA__'
+    rb'|enable javascript|javascript is required|requires javascript',
+    re.IGNORECASE,
+)
+SNIFF_BYTES = 64 * 1024
+
+
+class FetchResult(NamedTuple):
+    status: int
+    text: str
+    tier: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class _Sniffer:
+    """Chunks aage bhejta hai aur pehle SNIFF_BYTES apne paas rakh leta hai (SPA detection ke liye)."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self.chunks = chunks
+        self.head = bytearray()
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.chunks:
+            if len(self.head) < SNIFF_BYTES:
+                self.head.extend(chunk[: SNIFF_BYTES - len(self.head)])
+            yield chunk
+
+
+class TieredFetcher:
+    """
+    HTTP-first page fetcher that escalates JS-rendered pages to a headless browser.
+
+    Args:
+        http_client: Pooled client for the HTTP tier (default: shared instance).
+        enable_browser: Browser tier on/off (Playwright install na ho toh apne aap off).
+        min_text_chars: Isse kam visible text = page shayad JS se render hota hai.
+        browser_timeout_ms: Browser render timeout.
+        tier_ttl_seconds: Domain ka yaad rakha tier kitne din valid (fir HTTP dobara try).
+        store_path: Per-domain tier memory ki SQLite file.
+    """
+
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        enable_browser: bool = True,
+        min_text_chars: int = 200,
+        browser_timeout_ms: int = 20000,
+        tier_ttl_seconds: int = 7 * 24 * 60 * 60,
+        store_path: str = DEFAULT_TIER_STORE_PATH,
+    ):
+        self._http = http_client
+        self.enable_browser = enable_browser
+        self.min_text_chars = min_text_chars
+        self.browser_timeout_ms = browser_timeout_ms
+        self.tier_ttl_seconds = tier_ttl_seconds
+        self.store_path = store_path
+        self._tiers: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        if os.path.dirname(store_path):
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS domain_tiers (
+                    domain TEXT PRIMARY KEY,
+                    tier TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+
+    @property
+    def http(self) -> HttpClient:
+        return self._http or HttpClient.instance()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.store_path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # -------------------------
+    # DOMAIN TIER MEMORY
+    # -------------------------
+    def tier_for(self, domain: str) -> str:
+        with self._lock:
+            if domain in self._tiers:
+                return self._tiers[domain]
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT tier, updated_at FROM domain_tiers WHERE domain = ?", (domain,)
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+        tier = TIER_HTTP
+        if row and time.time() - row[1] < self.tier_ttl_seconds:
+            tier = row[0]
+        with self._lock:
+            self._tiers[domain] = tier
+        return tier
+
+    def remember(self, domain: str, tier: str):
+        with self._lock:
+            if self._tiers.get(domain) == tier:
+                return
+            self._tiers[domain] = tier
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO domain_tiers (domain, tier, updated_at) VALUES (?, ?, ?)",
+                    (domain, tier, time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Tier store write failed: {e}")
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT tier, COUNT(*) FROM domain_tiers GROUP BY tier").fetchall()
+        return {"domains_by_tier": dict(rows), "browser_enabled": self.enable_browser}
+
+    # -------------------------
+    # FETCH
+    # -------------------------
+    def needs_browser(self, text: str, head: bytes) -> bool:
+        if len(text) >= self.min_text_chars:
+            return False
+        return not text or bool(SPA_MARKERS.search(head))
+
+    def fetch(
+        self,
+        url: str,
+        char_limit: int = 3000,
+        max_bytes: int = 2 * 1024 * 1024,
+        timeout: float = 10,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Optional[FetchResult]:
+        """Page ka text laata hai; jo tier kaam aaya woh result mein (`tier`) hota hai."""
+        domain = (urlparse(url).hostname or "").lower()
+
+        if self.enable_browser and self.tier_for(domain) == TIER_BROWSER:
+            result = self._fetch_browser(url, char_limit)
+            if result is not None:
+                return result
+            # Browser fail hua, HTTP se try karte hain
+
+        result, head = self._fetch_http(url, char_limit, max_bytes, timeout, headers)
+        if result is None or result.status == 304:
+            return result
+
+        if self.enable_browser and result.status == 200 and self.needs_browser(result.text, head):
+            logger.debug(f"JS-rendered page detected, escalating to browser: {url}")
+            rendered = self._fetch_browser(url, char_limit)
+            if rendered is not None and len(rendered.text) > len(result.text):
+                self.remember(domain, TIER_BROWSER)
+                return rendered
+            # Browser se bhi kuch behtar nahi mila: is domain pe dobara escalate mat karo
+            self.remember(domain, TIER_HTTP)
+        elif result.status == 200 and result.text:
+            self.remember(domain, TIER_HTTP)
+        return result
+
+    def _fetch_http(self, url, char_limit, max_bytes, timeout, headers):
+        with self.http.stream("GET", url, headers=headers or {}, timeout=timeout) as resp:
+            if resp.status_code == 304:
+                return FetchResult(304, "", TIER_HTTP), b""
+
+            # PDF / images jaisi cheezon ko HTML ki tarah parse karna bekaar hai
+            content_type = resp.headers.get("Content-Type", "text/html").lower()
+            if "html" not in content_type and "text" not in content_type:
+                logger.debug(f"Skipping non-HTML page ({content_type}): {url}")
+                return None, b""
+
+            # Chunk-by-chunk parse: script/style skip, kaafi text milte hi band
+            sniffer = _Sniffer(resp.iter_bytes())
+            extracted = extract_text_stream(
+                sniffer,
+                char_limit=char_limit,
+                max_bytes=max_bytes,
+                encoding=resp.charset_encoding,
+            )
+            result = FetchResult(
+                resp.status_code,
+                extracted.text,
+                TIER_HTTP,
+                etag=resp.headers.get("ETag"),
+                last_modified=resp.headers.get("Last-Modified"),
+            )
+            return result, bytes(sniffer.head)
+
+    def _fetch_browser(self, url: str, char_limit: int) -> Optional[FetchResult]:
+        try:
+            from backend.core.tools.browser import render_page_text
+        except ImportError:
+            logger.warning("Playwright not installed, browser tier disabled")
+            self.enable_browser = False
+            return None
+        try:
+            text = render_page_text(url, timeout_ms=self.browser_timeout_ms)
+        except Exception as e:
+            logger.error(f"Browser render failed for {url}: {e}")
+            return None
+        return FetchResult(200, " ".join(text.split())[:char_limit], TIER_BROWSER)
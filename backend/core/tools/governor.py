@@ -0,0 +1,226 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Outbound calls ka "Traffic Police" (per-host rate limiter + circuit breaker).
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+DuckDuckGo throttle kare ya cPanel host slow ho, toh har agent run poora timeout
+(10-20 s) wait karta tha aur worker blocked rehta tha.
+- Token bucket: ek host pe calls ki speed limit (taaki hum khud rate-limit na ho jaayen).
+- Circuit breaker: host lagataar fail ho raha hai toh turant error (fail fast),
+  aur exponential backoff ke baad ek "probe" call jaati hai check karne ke liye ki host theek hua ya nahi.
+
+State har process ki apni hai (RAM mein); `stats()` metrics ke liye expose hota hai.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from agno.utils.log import logger
+
+
+class CircuitOpenError(RuntimeError):
+    """Host abhi unhealthy hai, call bheji hi nahi gayi."""
+
+
+class RateLimitedError(RuntimeError):
+    """Host ki rate limit ke andar slot nahi mila (max_wait se zyada intezaar)."""
+
+
+class TokenBucket:
+    """Simple thread-safe token bucket (rate tokens/sec, burst capacity)."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, max_wait: float) -> bool:
+        deadline = time.monotonic() + max_wait
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    closed → (failure_threshold lagataar failures) → open
+    open → (cooldown khatam) → half_open: sirf ek probe call
+    half_open → success → closed | failure → open (cooldown double, max_cooldown tak)
+    """
+
+    def __init__(self, failure_threshold: int = 5, base_cooldown: float = 5.0, max_cooldown: float = 300.0):
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.trips = 0
+        self.open_until = 0.0
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() >= self.open_until:
+                self.state = "half_open"
+            if self.state == "half_open" and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+            return False
+
+    def release_probe(self):
+        with self._lock:
+            self.probe_in_flight = False
+
+    def record(self, success: bool) -> Optional[str]:
+        """Result record karta hai; state badli toh nayi state return karta hai."""
+        with self._lock:
+            previous = self.state
+            self.probe_in_flight = False
+            if success:
+                self.failures = 0
+                self.trips = 0
+                self.state = "closed"
+            else:
+                self.failures += 1
+                if self.state == "half_open" or self.failures >= self.failure_threshold:
+                    self.trips += 1
+                    cooldown = min(self.base_cooldown * (2 ** (self.trips - 1)), self.max_cooldown)
+                    self.open_until = time.monotonic() + cooldown
+                    self.state = "open"
+            return self.state if self.state != previous else None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "trips": self.trips,
+                "retry_in": round(max(0.0, self.open_until - time.monotonic()), 2) if self.state == "open" else 0.0,
+            }
+
+
+class OutboundGovernor:
+    """
+    Per-host rate limiting + circuit breaking for all outbound tool calls.
+
+    Args:
+        default_rate: Requests/sec per host (jab host ka override na ho).
+        default_burst: Burst capacity per host.
+        host_limits: Host-specific (rate, burst) overrides.
+        max_wait: Rate-limit slot ke liye max intezaar (seconds).
+        failure_threshold: Itne lagataar failures ke baad circuit open.
+        base_cooldown: Pehli baar open hone pe cooldown; har trip pe double.
+        max_cooldown: Cooldown ki upper limit.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        default_rate: float = 10.0,
+        default_burst: int = 20,
+        host_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        max_wait: float = 5.0,
+        failure_threshold: int = 5,
+        base_cooldown: float = 5.0,
+        max_cooldown: float = 300.0,
+    ):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = {
+            # DDG jaldi throttle karta hai, isliye dheere
+            "duckduckgo.com": (1.0, 3),
+            **(host_limits or {}),
+        }
+        self.max_wait = max_wait
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._registry_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "OutboundGovernor":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+        return cls._instance
+
+    def _host_state(self, host: str) -> Tuple[TokenBucket, CircuitBreaker, Dict[str, int]]:
+        host = host.lower()
+        with self._registry_lock:
+            if host not in self._buckets:
+                rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+                self._buckets[host] = TokenBucket(rate, burst)
+                self._breakers[host] = CircuitBreaker(
+                    self.failure_threshold, self.base_cooldown, self.max_cooldown
+                )
+                self._counters[host] = {"calls": 0, "failures": 0, "rejected_open": 0, "rejected_rate": 0}
+            return self._buckets[host], self._breakers[host], self._counters[host]
+
+    def acquire(self, host: str):
+        """Call se pehle: circuit check + rate-limit token. Allowed na ho toh exception."""
+        bucket, breaker, counters = self._host_state(host)
+        if not breaker.allow():
+            counters["rejected_open"] += 1
+            raise CircuitOpenError(f"{host} is unhealthy, retry in {breaker.snapshot()['retry_in']}s")
+        if not bucket.acquire(self.max_wait):
+            counters["rejected_rate"] += 1
+            # Probe slot pakda tha toh chhod do, warna half-open mein atak jayega
+            breaker.release_probe()
+            raise RateLimitedError(f"Rate limit for {host} exceeded")
+        counters["calls"] += 1
+
+    def record(self, host: str, success: bool):
+        _, breaker, counters = self._host_state(host)
+        if not success:
+            counters["failures"] += 1
+        new_state = breaker.record(success)
+        if new_state:
+            logger.warning(f"Circuit for {host} → {new_state}")
+
+    @contextmanager
+    def guard(self, host: str) -> Iterator[None]:
+        """`with governor.guard(host):` — exception aaye toh failure, warna success."""
+        self.acquire(host)
+        try:
+            yield
+        except Exception:
+            self.record(host, False)
+            raise
+        self.record(host, True)
+
+    def stats(self) -> dict:
+        with self._registry_lock:
+            hosts = list(self._buckets)
+        result = {}
+        for host in hosts:
+            bucket, breaker, counters = self._host_state(host)
+            result[host] = {
+                **breaker.snapshot(),
+                **counters,
+                "tokens": round(bucket.tokens, 2),
+                "rate": bucket.rate,
+            }
+        return result
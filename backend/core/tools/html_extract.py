@@ -0,0 +1,148 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Streaming HTML → text extractor.
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Pehle poora page download hota tha, BeautifulSoup poora tree banata tha,
+aur fir sirf 3000 chars rakhe jaate the. Multi-MB pages pe yeh bahut RAM + CPU khaata hai.
+Yahan response chunk-by-chunk parse hota hai, script/style andar hi skip ho jaate hain,
+aur jaise hi kaafi text mil gaya, padhna band.
+"""
+
+import codecs
+from html.parser import HTMLParser
+from typing import Iterable, List, NamedTuple, Optional
+
+# In tags ka content user ko dikhta nahi, isliye text mein nahi aana chahiye
+SKIP_TAGS = frozenset({"script", "style", "noscript", "iframe", "template", "svg"})
+
+# Block tags ke beech words chipakne nahi chahiye ("<h1>Title</h1><p>Body" → "Title Body")
+BLOCK_TAGS = frozenset({
+    "title", "p", "div", "br", "hr", "li", "ul", "ol", "tr", "td", "th", "table",
+    "section", "article", "header", "footer", "nav", "aside", "main", "blockquote",
+    "h1", "h2", "h3", "h4", "h5", "h6", "pre", "figure", "figcaption", "dd", "dt",
+})
+
+
+class ExtractResult(NamedTuple):
+    text: str
+    bytes_read: int
+    truncated: bool  # True agar char/byte limit ki wajah se beech mein ruke
+
+
+class _VisibleTextParser(HTMLParser):
+    """Sirf visible text collect karta hai, limit pe pahunchte hi `done` ho jaata hai."""
+
+    def __init__(self, char_limit: int):
+        super().__init__(convert_charrefs=True)
+        self.char_limit = char_limit
+        self.words: List[str] = []
+        self.pending = ""  # Chunk boundary pe kata hua aadha word
+        self.chars = 0
+        self.skip_depth = 0
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_startendtag(self, tag, attrs):
+        # <svg/> jaise self-closing tags depth nahi badhate
+        if tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS and self.skip_depth:
+            self.skip_depth -= 1
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if self.skip_depth or self.done:
+            return
+        # Inline tags word boundary nahi hote ("wor<b>d</b>" → "word"), sirf whitespace hota hai
+        data = self.pending + data
+        words = data.split()
+        self.pending = ""
+        if words and not data[-1].isspace():
+            self.pending = words.pop()
+        for word in words:
+            self._add(word)
+            if self.done:
+                return
+
+    def _flush(self):
+        if self.pending and not self.done and not self.skip_depth:
+            self._add(self.pending)
+        self.pending = ""
+
+    def _add(self, word: str):
+        self.words.append(word)
+        self.chars += len(word) + 1
+        if self.chars >= self.char_limit:
+            self.done = True
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def text(self) -> str:
+        words = self.words + ([self.pending] if self.pending and not self.done else [])
+        return " ".join(words)[: self.char_limit]
+
+
+def extract_text_stream(
+    chunks: Iterable[bytes],
+    char_limit: int = 3000,
+    max_bytes: int = 2 * 1024 * 1024,
+    encoding: Optional[str] = None,
+) -> ExtractResult:
+    """
+    Byte chunks se visible text nikalta hai.
+
+    Args:
+        chunks: Response body ke byte chunks (e.g. `response.iter_bytes()`).
+        char_limit: Itna text milte hi parsing band.
+        max_bytes: Isse zyada bytes kabhi nahi padhe jaate.
+        encoding: Response charset (default utf-8).
+
+    Returns:
+        ExtractResult(text, bytes_read, truncated)
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    parser = _VisibleTextParser(char_limit)
+    bytes_read = 0
+    truncated = False
+    for chunk in chunks:
+        remaining = max_bytes - bytes_read
+        if len(chunk) > remaining:
+            chunk = chunk[:remaining]
+            truncated = True
+        bytes_read += len(chunk)
+        parser.feed(decoder.decode(chunk))
+        if parser.done:
+            truncated = True
+            break
+        if bytes_read >= max_bytes:
+            truncated = True
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+
+    return ExtractResult(parser.text(), bytes_read, truncated)
+
+
+def extract_text(html: str, char_limit: int = 3000) -> str:
+    """Already-downloaded HTML string ke liye shortcut."""
+    parser = _VisibleTextParser(char_limit)
+    parser.feed(html)
+    if not parser.done:
+        parser.close()
+    return parser.text()
@@ -0,0 +1,195 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Saare tools ka shared HTTP client (connection pool).
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+`requests.get/post` har call pe naya TCP + TLS handshake karta hai.
+cPanel ko ek deploy mein kai calls jaati hain, same host pe, toh connection reuse
+(keep-alive) se har call ka handshake bach jaata hai.
+
+Tools isko constructor se lete hain (dependency injection), taaki tests apna
+client (local stand-in server / mock transport) pass kar sakein.
+"""
+
+import os
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import httpx
+from agno.utils.log import logger
+
+from backend.core.tools.governor import OutboundGovernor
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (AI Agent)"
+
+
+class HttpClient:
+    """
+    Pooled keep-alive HTTP client with per-host connection limits.
+
+    Args:
+        max_connections: Total open connections across all hosts.
+        max_per_host: Max concurrent requests to a single host.
+        max_keepalive: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection stays in the pool.
+        http2: Use HTTP/2 where the server supports it (needs `h2`).
+        timeout: Default request timeout in seconds.
+        pool_timeout: Seconds to wait for a free per-host slot.
+        transport: Optional custom httpx transport (tests, local stand-in servers).
+        governor: Per-host rate limiter / circuit breaker (default: shared instance).
+    """
+    _instance = None
+    _instance_pid = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_connections: int = 50,
+        max_per_host: int = 8,
+        max_keepalive: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = 10.0,
+        pool_timeout: float = 10.0,
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        governor: Optional[OutboundGovernor] = None,
+    ):
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                logger.warning("HTTP/2 requested but `h2` is not installed, falling back to HTTP/1.1")
+                http2 = False
+
+        self.max_per_host = max_per_host
+        self.pool_timeout = pool_timeout
+        self.http2 = http2
+        self.governor = governor or OutboundGovernor.instance()
+        self._client = httpx.Client(
+            http2=http2,
+            timeout=timeout,
+            follow_redirects=True,
+            headers={"User-Agent": DEFAULT_USER_AGENT, **(headers or {})},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            transport=transport,
+        )
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._stats_lock = threading.Lock()
+        self._requests = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._in_flight = defaultdict(int)
+
+    @classmethod
+    def instance(cls) -> "HttpClient":
+        """Process-wide shared client (fork ke baad naya banta hai, sockets share nahi hote)."""
+        with cls._lock:
+            if cls._instance is None or cls._instance_pid != os.getpid():
+                cls._instance = cls(http2=os.getenv("HTTP_CLIENT_HTTP2", "false").lower() == "true")
+                cls._instance_pid = os.getpid()
+        return cls._instance
+
+    @classmethod
+    def set_instance(cls, client: Optional["HttpClient"]):
+        """Shared client override karo (tests ke liye); None dene se agli call pe naya banega."""
+        with cls._lock:
+            cls._instance = client
+            cls._instance_pid = os.getpid() if client is not None else None
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._stats_lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    @contextmanager
+    def _host_guard(self, url: str) -> Iterator[str]:
+        host = (urlparse(url).hostname or url).lower()
+        # Unhealthy host pe slot ka intezaar bhi nahi: turant CircuitOpenError
+        self.governor.acquire(host)
+        slot = self._slot(host)
+        if not slot.acquire(timeout=self.pool_timeout):
+            self.governor.record(host, False)
+            raise httpx.PoolTimeout(f"No free connection slot for {host}")
+        with self._stats_lock:
+            self._requests[host] += 1
+            self._in_flight[host] += 1
+        try:
+            yield host
+        except Exception:
+            with self._stats_lock:
+                self._errors[host] += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self._in_flight[host] -= 1
+            slot.release()
+
+    def _record(self, host: str, response: httpx.Response):
+        # 5xx aur 429 = host pareshaan hai; 4xx hamari galti hai, host healthy hai
+        self.governor.record(host, response.status_code < 500 and response.status_code != 429)
+
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        with self._host_guard(url) as host:
+            try:
+                response = self._client.request(method, url, **kwargs)
+            except Exception:
+                # Timeout / connection error: host ke khilaaf failure
+                self.governor.record(host, False)
+                raise
+            self._record(host, response)
+            return response
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, url: str, **kwargs) -> Iterator[httpx.Response]:
+        """Body ko incrementally padhne ke liye (poora response RAM mein load nahi hota)."""
+        with self._host_guard(url) as host:
+            recorded = False
+            try:
+                with self._client.stream(method, url, **kwargs) as response:
+                    self._record(host, response)
+                    recorded = True
+                    yield response
+            except Exception:
+                # Headers aane se pehle fail hua tabhi host ki galti; caller ki exception nahi
+                if not recorded:
+                    self.governor.record(host, False)
+                raise
+
+    def stats(self) -> dict:
+        """Per-host request counts aur pool ki current haalat."""
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        with self._stats_lock:
+            hosts = {
+                host: {
+                    "requests": self._requests[host],
+                    "errors": self._errors[host],
+                    "in_flight": self._in_flight[host],
+                }
+                for host in self._requests
+            }
+        return {
+            "http2": self.http2,
+            "max_per_host": self.max_per_host,
+            "open_connections": len(connections),
+            "idle_connections": sum(1 for c in connections if getattr(c, "is_idle", lambda: False)()),
+            "hosts": hosts,
+            "governor": self.governor.stats(),
+        }
+
+    def close(self):
+        self._client.close()
@@ -0,0 +1,96 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Uploaded images ka register: file content hash → hosted URLs + dimensions.
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Same asset (logo, brand banner, stock photo) kai posts mein aata hai, aur har
+`image_to_seo_html` call use dobara optimize + upload karta tha. Ab pehle hash dekhte
+hain; mil gaya toh seedha purane URLs, na resize na upload.
+Key mein optimization settings (widths/formats/quality) bhi hain, settings badlein toh
+naye variants bante hain.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from agno.utils.log import logger
+
+DEFAULT_IMAGE_CACHE_PATH = os.getenv("IMAGE_UPLOAD_CACHE_PATH", "tmp/image_upload_cache.db")
+
+HASH_CHUNK = 1024 * 1024
+
+
+def hash_file(path: str, settings: str = "") -> str:
+    """sha256 of the file (read in chunks) plus the optimization settings."""
+    digest = hashlib.sha256(settings.encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ImageUploadCache:
+    """
+    Content-hash keyed record of uploaded images.
+
+    Args:
+        path: SQLite file path (shared across worker processes).
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, path: str = DEFAULT_IMAGE_CACHE_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS image_uploads (
+                    content_hash TEXT PRIMARY KEY,
+                    upload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+
+    @classmethod
+    def instance(cls, **kwargs) -> "ImageUploadCache":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(**kwargs)
+        return cls._instance
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, content_hash: str) -> Optional[Dict]:
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT upload FROM image_uploads WHERE content_hash = ?", (content_hash,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return json.loads(row[0]) if row else None
+
+    def set(self, content_hash: str, upload: Dict):
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO image_uploads (content_hash, upload, created_at) VALUES (?, ?, ?)",
+                    (content_hash, json.dumps(upload), time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Image upload cache write failed: {e}")
@@ -0,0 +1,110 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Upload se pehle image ko web ke liye taiyaar karna (Pillow).
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Pehle original file (camera photo, 4000px, EXIF ke saath) jaisi thi waisi upload hoti thi,
+toh published blogs pe bhaari images jaati thi. Yahan:
+- EXIF orientation apply karke metadata hata dete hain (re-encode mein EXIF/GPS nahi jaata).
+- Configured widths (default 480/960/1600) pe resize — kabhi upscale nahi.
+- WebP (aur AVIF, agar enable ho aur Pillow support kare) mein encode.
+- Har width ek `srcset` variant banta hai; HTML mein asli width/height jaati hai (CLS nahi).
+Animated GIF / SVG jaisi cheezein optimize nahi hoti, original hi upload hota hai.
+"""
+
+import io
+import os
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+from PIL import Image, ImageOps, features
+
+DEFAULT_WIDTHS = tuple(int(w) for w in os.getenv("IMAGE_SRCSET_WIDTHS", "480,960,1600").split(","))
+# AVIF encode slow hai aur har format = extra uploads, isliye opt-in (IMAGE_FORMATS=avif,webp)
+DEFAULT_FORMATS = tuple(f.strip().lower() for f in os.getenv("IMAGE_FORMATS", "webp").split(","))
+DEFAULT_QUALITY = int(os.getenv("IMAGE_QUALITY", "80"))
+
+MIME_TYPES = {"webp": "image/webp", "avif": "image/avif", "jpeg": "image/jpeg", "png": "image/png"}
+
+
+class ImageVariant(NamedTuple):
+    format: str
+    width: int
+    height: int
+    data: bytes
+
+
+class OptimizedImage(NamedTuple):
+    original_bytes: int
+    width: int   # largest variant ke dimensions (HTML width/height)
+    height: int
+    variants: List[ImageVariant]  # format ke hisaab se, har format mein chhoti → badi width
+
+    @property
+    def optimized_bytes(self) -> int:
+        """Bytes of the largest variant of the preferred format (what a desktop browser downloads)."""
+        largest = [v for v in self.variants if v.format == self.variants[0].format][-1]
+        return len(largest.data)
+
+
+def supported_formats(formats: Sequence[str]) -> List[str]:
+    return [f for f in formats if f in MIME_TYPES and (f not in ("webp", "avif") or features.check(f))]
+
+
+def optimization_settings(
+    widths: Sequence[int] = DEFAULT_WIDTHS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    quality: int = DEFAULT_QUALITY,
+) -> str:
+    """Stable string of the settings (upload cache key ka hissa)."""
+    return f"w={','.join(map(str, widths))};f={','.join(formats)};q={quality}"
+
+
+def optimize_image(
+    source: Union[str, bytes],
+    widths: Sequence[int] = DEFAULT_WIDTHS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    quality: int = DEFAULT_QUALITY,
+) -> Optional[OptimizedImage]:
+    """
+    Resize + re-encode an image (file path or bytes) into srcset variants.
+    With a path, Pillow reads the file itself, so the raw bytes are never held twice.
+
+    Returns None when the image should be uploaded as-is (animated, unreadable, or
+    no supported output format).
+    """
+    formats = supported_formats(formats)
+    if not formats:
+        return None
+    try:
+        if isinstance(source, bytes):
+            original_bytes, image = len(source), Image.open(io.BytesIO(source))
+        else:
+            original_bytes, image = os.path.getsize(source), Image.open(source)
+        if getattr(image, "is_animated", False):
+            return None
+        # Phone photos: rotation EXIF mein hoti hai, strip karne se pehle pixels mein apply
+        image = ImageOps.exif_transpose(image)
+    except Exception:
+        return None
+
+    has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+    image = image.convert("RGBA" if has_alpha else "RGB")
+
+    targets = sorted({min(w, image.width) for w in widths if w > 0}) or [image.width]
+    variants: List[ImageVariant] = []
+    for fmt in formats:
+        for width in targets:
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+            out = io.BytesIO()
+            # exif/icc pass nahi karte → metadata strip
+            if fmt == "jpeg":
+                resized.convert("RGB").save(out, "JPEG", quality=quality, optimize=True, progressive=True)
+            elif fmt == "png":
+                resized.save(out, "PNG", optimize=True)
+            else:
+                resized.save(out, fmt.upper(), quality=quality)
+            variants.append(ImageVariant(fmt, width, height, out.getvalue()))
+
+    largest = variants[len(targets) - 1]
+    return OptimizedImage(original_bytes, largest.width, largest.height, variants)
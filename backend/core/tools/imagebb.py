@@ -1,9 +1,127 @@
+import io
 import os
-import base64
 import mimetypes
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List
 from agno.tools import tool
 
+from backend.core.tools.http_client import HttpClient
+from backend.core.tools.image_cache import ImageUploadCache, hash_file
+from backend.core.tools.image_optimize import MIME_TYPES, optimization_settings, optimize_image
+
+# srcset `sizes`: image kitni chaudi dikhegi, yeh site ka theme tay karta hai (e.g.
+# "(max-width: 46rem) 100vw, 46rem"). Default full viewport width: kabhi chhota variant galat nahi chunta.
+IMAGE_SIZES = os.getenv("IMAGE_SIZES", "100vw")
+
+
+def _upload(api_key: str, fileobj: BinaryIO, name: str, timeout: int) -> Dict:
+    """imgbb pe ek file upload; response ka `data` dict ya {"error": ...}."""
+    try:
+        # Multipart file upload: httpx file object ko chunks mein bhejta hai,
+        # poore file ka base64 payload memory mein nahi banta
+        res = HttpClient.instance().post(
+            "https://api.imgbb.com/1/upload",
+            data={"key": api_key, "name": name},
+            files={"image": (name, fileobj)},
+            timeout=timeout,
+        )
+    except Exception as e:
+        # Timeout, ya imgbb ka circuit open hai (fail fast)
+        return {"error": f"Image upload failed: {e}"}
+
+    if res.status_code != 200:
+        return {"error": "Image upload failed"}
+    return res.json()["data"]
+
+
+def _check_image(image_path: str) -> Dict:
+    if not os.path.exists(image_path):
+        return {"error": "Image file not found"}
+
+    mime, _ = mimetypes.guess_type(image_path)
+    if not mime or not mime.startswith("image/"):
+        return {"error": "Only image files allowed"}
+    return {}
+
+
+def _upload_image(api_key: str, image_path: str, content_hash: str, timeout: int) -> Dict:
+    """Optimize + upload one image; returns the cacheable upload record."""
+    name = os.path.splitext(os.path.basename(image_path))[0]
+
+    # resize + WebP/AVIF + metadata strip; optimize na ho sake (GIF/SVG) toh original
+    optimized = optimize_image(image_path)
+    if optimized is None:
+        with open(image_path, "rb") as f:
+            data = _upload(api_key, f, name, timeout)
+        if "error" in data:
+            return data
+        bytes_before = bytes_after = os.path.getsize(image_path)
+        width, height = data.get("width"), data.get("height")
+        uploaded = {"original": [{"url": data["url"], "width": width}]}
+    else:
+        uploaded = {}
+        for variant in optimized.variants:
+            data = _upload(api_key, io.BytesIO(variant.data), f"{name}-{variant.width}w", timeout)
+            if "error" in data:
+                return data
+            uploaded.setdefault(variant.format, []).append({"url": data["url"], "width": variant.width})
+        width, height = optimized.width, optimized.height
+        bytes_before, bytes_after = optimized.original_bytes, optimized.optimized_bytes
+
+    upload = {
+        "variants": uploaded,
+        "width": width,
+        "height": height,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+    }
+    ImageUploadCache.instance().set(content_hash, upload)
+    return upload
+
+
+def _srcset(sources: List[Dict]) -> str:
+    return ", ".join(f"{s['url']} {s['width']}w" for s in sources)
+
+
+def _render_html(alt_text: str, uploaded: Dict[str, List[Dict]], width, height) -> str:
+    formats = list(uploaded)
+    fallback = uploaded[formats[-1]]
+    img = (
+        f'<img src="{fallback[-1]["url"]}" srcset="{_srcset(fallback)}" sizes="{IMAGE_SIZES}" '
+        f'alt="{alt_text}" loading="lazy" decoding="async" width="{width}" height="{height}" />'
+    )
+    if len(formats) == 1:
+        return img
+    # AVIF + WebP: browser pehla supported <source> leta hai
+    sources = "".join(
+        f'<source type="{MIME_TYPES[fmt]}" srcset="{_srcset(uploaded[fmt])}" sizes="{IMAGE_SIZES}" />'
+        for fmt in formats[:-1]
+    )
+    return f"<picture>{sources}{img}</picture>"
+
+
+def _seo_result(upload: Dict, topic: str, cached: bool) -> Dict:
+    # SEO alt text (simple + effective)
+    alt_text = f"{topic} – high quality illustration, SEO optimized, clear and descriptive"
+    uploaded = upload["variants"]
+    fallback = list(uploaded.values())[-1]
+    before, after = upload["bytes_before"], upload["bytes_after"]
+
+    return {
+        "image_url": fallback[-1]["url"],
+        "alt_text": alt_text,
+        # HTML ready for blog (responsive srcset + asli dimensions)
+        "html": _render_html(alt_text, uploaded, upload["width"], upload["height"]),
+        "width": upload["width"],
+        "height": upload["height"],
+        "size_bytes": after,
+        "bytes_before": before,
+        "bytes_after": after,
+        "saved_percent": round(100 * (1 - after / before), 1) if before else 0,
+        "variants": uploaded,
+        "cached": cached,
+    }
+
 
 @tool(
     name="image_to_seo_html",
@@ -19,46 +137,71 @@ def image_to_seo_html(
     if not API_KEY:
         return {"error": "IMGBB API key missing"}
 
-    if not os.path.exists(image_path):
-        return {"error": "Image file not found"}
+    if error := _check_image(image_path):
+        return error
 
-    mime, _ = mimetypes.guess_type(image_path)
-    if not mime or not mime.startswith("image/"):
-        return {"error": "Only image files allowed"}
+    # 2️⃣ same content pehle upload ho chuka hai? → purane URLs
+    content_hash = hash_file(image_path, optimization_settings())
+    upload = ImageUploadCache.instance().get(content_hash)
+    cached = upload is not None
 
-    # 2️⃣ upload image
-    with open(image_path, "rb") as f:
-        encoded = base64.b64encode(f.read())
+    # 3️⃣ optimize + upload
+    if upload is None:
+        upload = _upload_image(API_KEY, image_path, content_hash, timeout)
+        if "error" in upload:
+            return upload
 
-    res = requests.post(
-        "https://api.imgbb.com/1/upload",
-        data={"key": API_KEY, "image": encoded},
-        timeout=timeout,
-    )
+    # 4️⃣ alt text + HTML
+    return _seo_result(upload, topic, cached)
 
-    if res.status_code != 200:
-        return {"error": "Image upload failed"}
 
-    data = res.json()["data"]
-    image_url = data["url"]
+@tool(
+    name="images_to_seo_html",
+    description="Upload several images for one post at once and return SEO HTML for each (in input order)"
+)
+def images_to_seo_html(
+    image_paths: List[str],
+    topic: str,
+    timeout: int = 10,
+    max_parallel: int = 4,
+):
+    API_KEY = os.getenv("imagebb_api_key")
+    if not API_KEY:
+        return {"error": "IMGBB API key missing"}
 
-    # 3️⃣ SEO alt text (simple + effective)
-    alt_text = f"{topic} – high quality illustration, SEO optimized, clear and descriptive"
+    results: List[Dict] = [{} for _ in image_paths]
+    hashes: Dict[int, str] = {}
+    for i, path in enumerate(image_paths):
+        if error := _check_image(path):
+            results[i] = {"image_path": path, **error}
+        else:
+            hashes[i] = hash_file(path, optimization_settings())
 
-    # 4️⃣ HTML ready for blog
-    html = f"""
-<img 
-  src="{image_url}"
-  alt="{alt_text}"
-  loading="lazy"
-  width="{data.get('width')}"
-  height="{data.get('height')}"
-/>
-""".strip()
+    cache = ImageUploadCache.instance()
+    uploads = {h: cache.get(h) for h in set(hashes.values())}
+    cached = {h for h, upload in uploads.items() if upload is not None}
+
+    # Sirf uncached, aur ek hash ek hi baar (same file do baar list mein ho toh bhi)
+    pending = {h: image_paths[i] for i, h in hashes.items() if h not in cached}
+    if pending:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_parallel, len(pending))),
+            thread_name_prefix="imgbb-upload",
+        ) as executor:
+            futures = {h: executor.submit(_upload_image, API_KEY, path, h, timeout) for h, path in pending.items()}
+            for h, future in futures.items():
+                uploads[h] = future.result()
+
+    for i, h in hashes.items():
+        upload = uploads[h]
+        if "error" in upload:
+            results[i] = {"image_path": image_paths[i], **upload}
+        else:
+            results[i] = {"image_path": image_paths[i], **_seo_result(upload, topic, h in cached)}
 
     return {
-        "image_url": image_url,
-        "alt_text": alt_text,
-        "html": html,
-        "size_bytes": data.get("size"),
+        "images": results,
+        "uploaded": sum(1 for h in pending if "error" not in uploads[h]),
+        "cached": sum(1 for h in hashes.values() if h in cached),
+        "failed": sum(1 for r in results if "error" in r),
     }
@@ -0,0 +1,194 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Fetched pages ka cache (extracted text + validators).
+Popular sources research ke dauraan baar-baar khulte hain, aur zyada tar badalte nahi.
+
+HOW IT WORKS? (Kaise kaam karta hai?)
+- Har URL ke saath ETag / Last-Modified save hota hai.
+- Agli baar conditional request (If-None-Match / If-Modified-Since) jaati hai,
+  server 304 bole toh purana text hi use hota hai, download + parse dono bach jaate hain.
+- Text content hash se store hota hai, toh mirror / duplicate pages ek hi copy lete hain.
+- Disk pe total size bounded hai, LRU order mein purane pages nikalte hain.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from agno.utils.log import logger
+
+DEFAULT_PAGE_CACHE_PATH = os.getenv("PAGE_CACHE_PATH", "tmp/page_cache.db")
+
+
+class CachedPage(NamedTuple):
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class PageCache:
+    """
+    On-disk page text cache with HTTP validators and content-hash dedup.
+
+    Args:
+        path: SQLite file path (shared across worker processes).
+        max_bytes: Upper bound for stored text; LRU pages are evicted beyond this.
+        fresh_seconds: Within this window a cached page is served without revalidation.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str = DEFAULT_PAGE_CACHE_PATH,
+        max_bytes: int = 50 * 1024 * 1024,
+        fresh_seconds: int = 15 * 60,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fresh_seconds = fresh_seconds
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._init_db()
+
+    @classmethod
+    def instance(cls, **kwargs) -> "PageCache":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(**kwargs)
+        return cls._instance
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS page_contents (
+                    content_hash TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    content_hash TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages (accessed_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_hash ON pages (content_hash)")
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        try:
+            with self._connect() as conn:
+                row = conn.execute("""
+                    SELECT c.text, p.etag, p.last_modified, p.fetched_at
+                    FROM pages p JOIN page_contents c ON c.content_hash = p.content_hash
+                    WHERE p.url = ?
+                """, (url,)).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), url))
+                return CachedPage(*row)
+        except sqlite3.Error as e:
+            logger.warning(f"Page cache read failed: {e}")
+            return None
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        return time.time() - page.fetched_at < self.fresh_seconds
+
+    @staticmethod
+    def conditional_headers(page: Optional[CachedPage]) -> Dict[str, str]:
+        """Revalidation ke liye headers (validators na hon toh khaali dict)."""
+        headers = {}
+        if page is not None:
+            if page.etag:
+                headers["If-None-Match"] = page.etag
+            if page.last_modified:
+                headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def touch(self, url: str):
+        """304 mila: content wahi hai, bas fetched_at refresh karo."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Page cache touch failed: {e}")
+
+    def put(self, url: str, text: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        now = time.time()
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        try:
+            with self._connect() as conn:
+                # Same text pehle se hai (mirror / syndicated copy) toh dobara store nahi hota
+                conn.execute(
+                    "INSERT OR IGNORE INTO page_contents (content_hash, text, size) VALUES (?, ?, ?)",
+                    (content_hash, text, len(text.encode("utf-8"))),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO pages (url, content_hash, etag, last_modified, fetched_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, content_hash, etag, last_modified, now, now),
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Page cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        conn.execute(
+            "DELETE FROM page_contents WHERE content_hash NOT IN (SELECT content_hash FROM pages)"
+        )
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM page_contents").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # LRU order mein URLs hatao jab tak size limit ke andar na aa jaye
+        for url, content_hash in conn.execute(
+            "SELECT url, content_hash FROM pages ORDER BY accessed_at ASC"
+        ).fetchall():
+            conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+            still_used = conn.execute(
+                "SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1", (content_hash,)
+            ).fetchone()
+            if not still_used:
+                size = conn.execute(
+                    "SELECT size FROM page_contents WHERE content_hash = ?", (content_hash,)
+                ).fetchone()
+                conn.execute("DELETE FROM page_contents WHERE content_hash = ?", (content_hash,))
+                total -= size[0] if size else 0
+            if total <= self.max_bytes:
+                break
+
+    def stats(self) -> dict:
+        with self._connect() as conn:
+            pages = conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            contents, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM page_contents"
+            ).fetchone()
+        return {
+            "pages": pages,
+            "unique_contents": contents,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+        }
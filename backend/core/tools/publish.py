@@ -0,0 +1,102 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Publish pipeline stage: deploy se pehle HTML ko chhota karna + pre-compressed copies banana.
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Page speed SEO signal hai. Agent ka HTML unminified hota hai aur server pe plain `.html`
+jaata tha. Yahan:
+- HTML minify (comments hatao, tags ke beech whitespace collapse; <pre>/<script>/<style>/
+  <textarea> ka content jaisa tha waisa).
+- Site ki di hui critical CSS (theme ka above-the-fold hissa) <head> mein inline, taaki first
+  paint ke liye alag CSS request na lage. Default mein kuch inject nahi hota: page ka apna
+  styling jaisa hai waisa rehta hai.
+- `.gz` (aur brotli install ho toh `.br`) siblings banate hain; server (mod_rewrite /
+  nginx gzip_static) seedha yeh files serve kar sakta hai, har request pe compress nahi.
+- Har file ka size + upload time report mein jaata hai.
+"""
+
+import gzip
+import re
+from typing import Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:  # brotli optional hai, sirf gzip sibling banega
+    brotli = None
+
+_PRESERVE = re.compile(r"<(pre|textarea|script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+# Conditional comments (<!--[if IE]>) rehne do
+_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_WHITESPACE = re.compile(r"\s+")
+_BLOCK_GAP = re.compile(
+    r"> <(/?(?:html|head|body|meta|link|title|div|p|h[1-6]|ul|ol|li|table|thead|tbody|tr|t[dh]"
+    r"|section|article|header|footer|nav|main|figure|figcaption|br|hr|img)\b|\x00)"
+)
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_SPACE = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def minify_css(css: str) -> str:
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE.sub(r"\1", css)
+    css = _WHITESPACE.sub(" ", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_html(html: str) -> str:
+    """Conservative minifier: text content ke andar ka single space kabhi nahi hatata."""
+    preserved: List[str] = []
+
+    def _stash(match: re.Match) -> str:
+        preserved.append(match.group(0))
+        # <pre>/<script>/<style> block hain: placeholder tag jaisa dikhe taaki gap rules lagein
+        if match.group(1).lower() == "textarea":
+            return f"\x00{len(preserved) - 1}\x00"
+        return f"<\x00{len(preserved) - 1}\x00>"
+
+    html = _PRESERVE.sub(_stash, html)
+    html = _COMMENT.sub("", html)
+    html = _BETWEEN_TAGS.sub("> <", html)
+    html = _WHITESPACE.sub(" ", html)
+    # Block-level boundaries pe bacha hua space bhi bekaar hai
+    html = _BLOCK_GAP.sub(r"><\1", html)
+    return re.sub(r"<?\x00(\d+)\x00>?", lambda m: preserved[int(m.group(1))], html).strip()
+
+
+def inline_critical_css(html: str, css: str) -> str:
+    if not css.strip():
+        return html
+    style = f"<style>{minify_css(css)}</style>"
+    if "</head>" in html:
+        return html.replace("</head>", f"{style}</head>", 1)
+    return style + html
+
+
+def compressed_variants(data: bytes) -> Dict[str, bytes]:
+    """Filename suffix → compressed bytes (mtime=0 so identical input gives identical output)."""
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+    return variants
+
+
+class PublishReport:
+    """Per-file upload sizes and transfer times for one deploy."""
+
+    def __init__(self):
+        self.files: List[Dict] = []
+
+    def record(self, filename: str, size: int, seconds: float, ok: bool, raw_size: Optional[int] = None):
+        entry = {"file": filename, "bytes": size, "seconds": round(seconds, 3), "ok": ok}
+        if raw_size is not None:
+            entry["raw_bytes"] = raw_size
+        self.files.append(entry)
+
+    def summary(self) -> Dict:
+        return {
+            "files": self.files,
+            "uploaded_bytes": sum(f["bytes"] for f in self.files if f["ok"]),
+            "upload_seconds": round(sum(f["seconds"] for f in self.files), 3),
+        }
@@ -12,16 +12,25 @@ Yeh tool DuckDuckGo search engine use karta hai.
 from typing import List, Dict, Optional
 from agno.tools import Toolkit
 from agno.utils.log import logger
-import requests
-from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+
+from backend.core.tools.corpus import ResearchCorpus
+from backend.core.tools.fetcher import TieredFetcher
+from backend.core.tools.http_client import HttpClient
+from backend.core.tools.page_cache import PageCache
+from backend.core.tools.search_cache import SearchCache
 
 try:
     from ddgs import DDGS # DuckDuckGo unofficial API
 except ImportError:
     raise ImportError("pip install ddgs")
 
+DDG_HOST = "duckduckgo.com"
+FETCHED_TEXT_CHARS = 2000  # agent ko ek page ka kitna text dikhana hai
+
+
 class DuckDuckGoToolkit(Toolkit):
     """DuckDuckGo Toolkit – Production grade for AI Agents"""
 
@@ -30,17 +39,35 @@ class DuckDuckGoToolkit(Toolkit):
         enable_search: bool = True,
         enable_news: bool = False,
         enable_search_and_fetch: bool = True,
+        enable_batch_search: bool = True,
+        enable_corpus: bool = True,
         char_limit: int = 3000,
+        max_page_bytes: int = 2 * 1024 * 1024,
+        enable_cache: bool = True,
+        cache: Optional[SearchCache] = None,
+        page_cache: Optional[PageCache] = None,
+        corpus: Optional[ResearchCorpus] = None,
+        fetch_top_k: int = 3,
+        fetch_timeout: float = 10,
+        fetch_deadline: float = 12,
+        batch_deadline: float = 15,
+        http_client: Optional[HttpClient] = None,
+        fetcher: Optional[TieredFetcher] = None,
+        enable_browser_fallback: bool = True,
         **kwargs
     ):
         # Kon-kon se jasoosi tools on karne hain
         tools = []
+        if enable_corpus:
+            tools.append(self.search_corpus)     # Pehle apni library mein dekho
         if enable_search:
             tools.append(self.duckduckgo_search) # Google search jaisa
         if enable_news:
             tools.append(self.duckduckgo_news)   # News search
         if enable_search_and_fetch:
             tools.append(self.search_and_fetch)  # Search + Padhna
+        if enable_batch_search:
+            tools.append(self.batch_search)      # Ek saath kai queries
 
         super().__init__(
             name="duckduckgo",
@@ -48,6 +75,68 @@ class DuckDuckGoToolkit(Toolkit):
             **kwargs
         )
         self.char_limit = char_limit # Kitna text padhna hai page se
+        self.max_page_bytes = max_page_bytes # Page ke kitne bytes tak download karna hai (upar se cut)
+        self.fetch_top_k = fetch_top_k # search_and_fetch kitne results parallel kholega
+        self.fetch_timeout = fetch_timeout # Har page request ka timeout
+        self.fetch_deadline = fetch_deadline # Poore parallel fetch ka deadline
+        self.batch_deadline = batch_deadline # batch_search ki saari queries ka shared deadline
+        self._http = http_client # None → shared pooled client
+        # Pehle plain HTTP, JS-rendered pages ke liye hi headless browser
+        self.fetcher = fetcher or TieredFetcher(http_client=http_client, enable_browser=enable_browser_fallback)
+        # Shared on-disk cache (saare workers ke beech), test mein apna cache pass kar sakte hain
+        self.cache: Optional[SearchCache] = None
+        self.page_cache: Optional[PageCache] = None
+        if enable_cache:
+            self.cache = cache or SearchCache.instance()
+            self.page_cache = page_cache or PageCache.instance()
+        # Fetched pages ki local library (sessions/users ke beech reuse)
+        self.corpus: Optional[ResearchCorpus] = None
+        if enable_corpus:
+            self.corpus = corpus or ResearchCorpus.instance()
+
+    @property
+    def http(self) -> HttpClient:
+        return self._http or HttpClient.instance()
+
+    def cache_stats(self) -> dict:
+        """Search cache ka hit-rate aur size"""
+        if self.cache is None:
+            return {"enabled": False}
+        stats = {"enabled": True, **self.cache.stats(), "pages": self.page_cache.stats(), "fetch_tiers": self.fetcher.stats()}
+        if self.corpus is not None:
+            stats["corpus"] = self.corpus.stats()
+        return stats
+
+    # -------------------------
+    # CORPUS SEARCH (Apni library mein dhundna)
+    # -------------------------
+    def search_corpus(self, query: str, max_results: int = 5, max_age_days: int = 30) -> str:
+        """
+        Pehle padhe gaye pages (local corpus) mein BM25 search karta hai.
+        Web pe jaane se pehle yeh try karo: hit mila toh search + fetch dono bach jaate hain.
+
+        Args:
+            query: Kya dhundna hai.
+            max_results: Kitne pages chahiye.
+            max_age_days: Isse purane pages ignore (freshness window).
+
+        Returns:
+            JSON list: url, title, score, snippet, fetched_at, content (page text, search_and_fetch
+            jitna truncated).
+        """
+        if self.corpus is None:
+            return json.dumps({"error": "Corpus disabled"})
+        try:
+            results = self.corpus.search(
+                query,
+                max_results=max_results,
+                max_age_seconds=max_age_days * 86400,
+                content_chars=FETCHED_TEXT_CHARS,
+            )
+            return json.dumps(results)
+        except Exception as e:
+            logger.error(f"Corpus search failed: {e}")
+            return json.dumps({"error": str(e)})
 
     # -------------------------
     # SEARCH FUNCTION (Dhundne wala)
@@ -67,9 +156,18 @@ class DuckDuckGoToolkit(Toolkit):
         # Log karte hain ki kya dhund rahe hain
         logger.debug(f"DDG Search → {final_query}")
 
+        # Pehle cache check karo (same query, same site → network ki zaroorat nahi)
+        cache_key = SearchCache.make_key("text", final_query, max_results=max_results, site=site)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"DDG Search cache hit → {final_query}")
+                return json.dumps(cached)
+
         try:
             # DDGS library use karke search kiya
-            with DDGS() as ddgs:
+            # Governor: DDG throttle kare toh rate limit + circuit breaker (fail fast)
+            with self.http.governor.guard(DDG_HOST), DDGS() as ddgs:
                 results = ddgs.text(query=final_query, max_results=max_results)
 
             # Result ko clean format mein banaya
@@ -77,6 +175,10 @@ class DuckDuckGoToolkit(Toolkit):
                 {"title": r.get("title"), "url": r.get("href"), "snippet": r.get("body")}
                 for r in results
             ]
+
+            # Sirf successful results cache hote hain, errors nahi
+            if self.cache is not None and formatted_results:
+                self.cache.set(cache_key, formatted_results)
             
             # JSON format mein wapis kiya taaki code padh sake
             # Hum JSON.dumps isliye karte hain taaki frontend isse easily tod sake
@@ -93,8 +195,14 @@ class DuckDuckGoToolkit(Toolkit):
         """Latest news dhundta hai"""
         logger.debug(f"DDG News → {query}")
 
+        cache_key = SearchCache.make_key("news", query, max_results=max_results)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return json.dumps(cached)
+
         try:
-            with DDGS() as ddgs:
+            with self.http.governor.guard(DDG_HOST), DDGS() as ddgs:
                 results = ddgs.news(query=query, max_results=max_results)
 
             formatted_results = [
@@ -106,12 +214,74 @@ class DuckDuckGoToolkit(Toolkit):
                 }
                 for r in results
             ]
-            
+
+            if self.cache is not None and formatted_results:
+                self.cache.set(cache_key, formatted_results)
+
             return json.dumps(formatted_results)
             
         except Exception as e:
             return json.dumps({"error": str(e)})
 
+    # -------------------------
+    # BATCH SEARCH (Ek saath kai sawaal)
+    # -------------------------
+    def batch_search(self, queries: List[str], max_results: int = 5) -> str:
+        """
+        Ek hi topic ke kai sub-questions ek call mein search karta hai.
+        Queries parallel chalti hain, duplicate URLs merge hote hain, aur
+        results combined rank (reciprocal rank fusion) ke hisaab se sorted aate hain.
+
+        Args:
+            queries: Search queries ki list.
+            max_results: Har query ke kitne results laane hain.
+
+        Returns:
+            JSON list: title, url, snippet, queries (jin queries mein mila), score.
+        """
+        # Same query do baar na chale
+        unique_queries = list(dict.fromkeys(q.strip() for q in queries if q and q.strip()))
+        if not unique_queries:
+            return json.dumps({"error": "No queries given"})
+
+        per_query: Dict[str, List[Dict]] = {}
+        executor = ThreadPoolExecutor(max_workers=min(len(unique_queries), 8), thread_name_prefix="ddg-batch")
+        futures = {
+            executor.submit(self.duckduckgo_search, query=q, max_results=max_results): q
+            for q in unique_queries
+        }
+        try:
+            for future in as_completed(futures, timeout=self.batch_deadline):
+                try:
+                    results = json.loads(future.result())
+                except (json.JSONDecodeError, TypeError):
+                    continue
+                if isinstance(results, list):
+                    per_query[futures[future]] = results
+        except FuturesTimeout:
+            logger.warning(f"Batch search deadline ({self.batch_deadline}s) hit, {len(per_query)}/{len(unique_queries)} queries done")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # URL ke hisaab se merge: jo URL kai queries mein upar aaye, woh sabse upar
+        merged: Dict[str, Dict] = {}
+        for query in unique_queries:
+            for rank, r in enumerate(per_query.get(query, [])):
+                url = r.get("url")
+                if not url:
+                    continue
+                key = url.rstrip("/").lower()
+                entry = merged.setdefault(key, {**r, "queries": [], "score": 0.0})
+                entry["queries"].append(query)
+                entry["score"] += 1.0 / (60 + rank)
+                if not entry.get("snippet") and r.get("snippet"):
+                    entry["snippet"] = r["snippet"]
+
+        ranked = sorted(merged.values(), key=lambda e: e["score"], reverse=True)
+        for entry in ranked:
+            entry["score"] = round(entry["score"], 4)
+        return json.dumps(ranked)
+
     # -------------------------
     # SEARCH + FETCH (Dhund ke Padhne wala)
     # -------------------------
@@ -120,67 +290,131 @@ class DuckDuckGoToolkit(Toolkit):
         query: str,
         source_type: str = "blog",
         max_results: int = 1,
+        top_k: Optional[int] = None,
+        max_pages: int = 1,
     ) -> str:
-        """Pehle search karega, fir top result ko khol ke padhega"""
-        
+        """
+        Pehle search karega, fir top results ko ek saath (parallel) khol ke padhega.
+
+        Args:
+            query: Search query.
+            source_type: Kis type ka source chahiye (blog, news, etc.).
+            max_results: Kitne search results laane hain.
+            top_k: Kitne top results parallel fetch karne hain (default: toolkit setting).
+            max_pages: Kitne successful pages wapis chahiye; baaki fetches cancel ho jaate hain.
+        """
+        top_k = max(top_k or self.fetch_top_k, max_pages, 1)
+
         # Step 1: Search karo
-        search_json = self.duckduckgo_search(query=query, max_results=max_results)
+        search_json = self.duckduckgo_search(query=query, max_results=max(max_results, top_k))
         
         try:
             results = json.loads(search_json)
             if not results or "error" in results:
                 return "Kuch nahi mila."
-                
-            # Pehla result uthao
-            first_result = results[0]
-            url = first_result.get('url')
+
+            # Top K results uthao (jinka URL ho)
+            candidates = [r for r in results if r.get('url')][:top_k]
+            if not candidates:
+                return "Kuch nahi mila."
             
         except json.JSONDecodeError:
             return f"Result padh nahi paaya."
 
-        # Step 2: Page ko fetch karo (Padho)
-        content = self._fetch_page_content(url)
+        # Step 2: Pages ko parallel fetch karo, jo pehle aaye woh jeete (hedged requests)
+        pages = self._fetch_first_pages(candidates, max_pages)
 
-        if not content:
-            return f"Page khul nahi raha: {url}"
+        if not pages:
+            return f"Page khul nahi raha: {candidates[0].get('url')}"
+
+        # Padhe hue pages library mein daal do, agli baar search_corpus se mil jayenge
+        if self.corpus is not None:
+            for result, content in pages:
+                self.corpus.add(result.get('url'), content, title=result.get('title'))
 
         # Step 3: Padhai hui cheez wapis karo
-        output = f"""URL: {url}
-Title: {first_result.get('title')}
+        blocks = []
+        for result, content in pages:
+            blocks.append(f"""URL: {result.get('url')}
+Title: {result.get('title')}
 
 ---
 **FETCHED CONTENT (Page ka Text):**
 
-{content[:2000]}...
+{content[:FETCHED_TEXT_CHARS]}...
 
-(Text truncated to 2000 chars)
-"""
-        return output
+(Text truncated to {FETCHED_TEXT_CHARS} chars)
+""")
+        return "\n\n".join(blocks)
+
+    def _fetch_first_pages(self, candidates: List[Dict], max_pages: int) -> List[tuple]:
+        """
+        Candidates ko concurrently fetch karta hai aur pehle `max_pages` successful
+        (result, content) pairs deta hai. Deadline ke baad ya kaam poora hote hi
+        baaki fetches cancel (jo abhi shuru nahi hue) / abandon ho jaate hain.
+        """
+        if len(candidates) == 1:
+            content = self._fetch_page_content(candidates[0].get('url'))
+            return [(candidates[0], content)] if content else []
+
+        pages = []
+        executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="ddg-fetch")
+        futures = {
+            executor.submit(self._fetch_page_content, r.get('url')): r for r in candidates
+        }
+        try:
+            for future in as_completed(futures, timeout=self.fetch_deadline):
+                content = future.result()
+                if content:
+                    pages.append((futures[future], content))
+                    if len(pages) >= max_pages:
+                        break
+        except FuturesTimeout:
+            logger.warning(f"Fetch deadline ({self.fetch_deadline}s) hit, {len(pages)} page(s) mile")
+        finally:
+            # Intezaar nahi karte: pending fetches cancel, running wale apne timeout pe khatam honge
+            executor.shutdown(wait=False, cancel_futures=True)
+        return pages
 
     # -------------------------
     # HELPERS (Chote Madadgar)
     # -------------------------
     def _fetch_page_content(self, url: str) -> Optional[str]:
         """Kisi bhi website ka text nikalta hai (HTML hata ke)"""
+        # Cache mein hai aur abhi-abhi fetch hua tha? Network ki zaroorat hi nahi
+        cached = self.page_cache.get(url) if self.page_cache is not None else None
+        if cached is not None and self.page_cache.is_fresh(cached):
+            return cached.text[: self.char_limit]
+
         try:
-            # Website ko request bhejo (Jaise browser bhejta hai)
-            resp = requests.get(
+            # Tiered fetch: pooled HTTP pehle, zaroorat pade toh browser
+            # Cached copy ho toh conditional request: server 304 bolega agar page nahi badla
+            result = self.fetcher.fetch(
                 url,
-                headers={"User-Agent": "Mozilla/5.0 (AI Agent)"},
-                timeout=10
+                char_limit=self.char_limit,
+                max_bytes=self.max_page_bytes,
+                timeout=self.fetch_timeout,
+                headers=PageCache.conditional_headers(cached),
             )
+            if result is None:
+                return None
 
-            # BeautifulSoup use karke HTML saaf karo
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # Scripts aur Styles hatao (kachra hatao)
-            for tag in soup(["script", "style", "noscript", "iframe"]):
-                tag.decompose()
+            if result.status == 304 and cached is not None:
+                self.page_cache.touch(url)
+                return cached.text[: self.char_limit]
 
-            # Saaf text return karo
-            text = " ".join(soup.get_text().split())
-            return text[: self.char_limit]
+            if self.page_cache is not None and result.status == 200 and result.text:
+                self.page_cache.put(
+                    url,
+                    result.text,
+                    etag=result.etag,
+                    last_modified=result.last_modified,
+                )
+            return result.text
 
         except Exception as e:
             logger.error(f"Page fetch failed: {e}")
-            return None
\ No newline at end of file
+            # Network fail hua par purani copy hai toh wahi de do
+            if cached is not None:
+                return cached.text[: self.char_limit]
+            return None
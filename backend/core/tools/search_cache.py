@@ -0,0 +1,166 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Search results ka "Register" (local cache).
+Ek hi topic din mein kai baar research hota hai, alag-alag users ke liye.
+Har baar DuckDuckGo pe jaane ke bajaye, hum result yahan SQLite file mein rakh lete hain.
+
+WHY SQLITE? (SQLite kyu?)
+Celery workers / uvicorn workers alag processes hain.
+RAM wala cache har process ka alag hota, SQLite file sab share karte hain.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from agno.utils.log import logger
+
+DEFAULT_CACHE_PATH = os.getenv("SEARCH_CACHE_PATH", "tmp/search_cache.db")
+
+
+class SearchCache:
+    """
+    Query-normalized search result cache with TTL and size-bounded eviction.
+
+    Args:
+        path: SQLite file path (shared across worker processes).
+        ttl_seconds: How long a cached result stays fresh.
+        max_entries: Max rows kept; least recently used rows are evicted beyond this.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl_seconds: int = 6 * 60 * 60,
+        max_entries: int = 5000,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._init_db()
+
+    @classmethod
+    def instance(cls, **kwargs) -> "SearchCache":
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls(**kwargs)
+        return cls._instance
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Har call pe naya connection (fork ke baad bhi safe, sqlite connect sasta hai);
+        # block ke end pe commit / rollback aur close
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache (accessed_at)"
+            )
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache_stats (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            conn.execute(
+                "INSERT OR IGNORE INTO search_cache_stats (name, value) VALUES ('hits', 0), ('misses', 0), ('evictions', 0)"
+            )
+
+    @staticmethod
+    def make_key(kind: str, query: str, **params: Any) -> str:
+        """Query ko normalize karta hai: lowercase, extra spaces hata ke, params sorted."""
+        normalized = " ".join(query.lower().split())
+        extra = "&".join(f"{k}={params[k]}" for k in sorted(params) if params[k] is not None)
+        return f"{kind}|{normalized}|{extra}"
+
+    def _bump(self, conn: sqlite3.Connection, name: str, by: int = 1):
+        conn.execute("UPDATE search_cache_stats SET value = value + ? WHERE name = ?", (by, name))
+
+    def get(self, key: str) -> Optional[Any]:
+        """Fresh result milta hai toh return, warna None (miss)."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM search_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row[1] > self.ttl_seconds:
+                    self._bump(conn, "misses")
+                    return None
+                conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self._bump(conn, "hits")
+                return json.loads(row[0])
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: Any):
+        """Result save karta hai aur size limit se upar ho toh purane rows nikaal deta hai."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now),
+                )
+                # Expired rows pehle, fir LRU order mein extra rows
+                expired = conn.execute(
+                    "DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+                ).rowcount
+                count = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+                overflow = count - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM search_cache WHERE key IN "
+                        "(SELECT key FROM search_cache ORDER BY accessed_at ASC LIMIT ?)",
+                        (overflow,),
+                    )
+                evicted = expired + max(overflow, 0)
+                if evicted:
+                    self._bump(conn, "evictions", evicted)
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    def stats(self) -> dict:
+        """Hit-rate aur size (saare processes ka combined)."""
+        with self._connect() as conn:
+            counters = dict(conn.execute("SELECT name, value FROM search_cache_stats").fetchall())
+            entries = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "evictions": counters["evictions"],
+            "hit_rate": round(counters["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM search_cache")
+            conn.execute("UPDATE search_cache_stats SET value = 0")
@@ -0,0 +1,201 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Published URLs ka local index (SQLite) + sharded sitemap rendering.
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Pehle har update pe poora sitemap.xml download → parse → har <loc> scan → poora re-upload
+hota tha. Bade sites pe yeh slow hai, aur 50,000 URLs ke baad single sitemap invalid bhi.
+
+HOW IT WORKS? (Kaise kaam karta hai?)
+- Har site ke URLs disk pe (SQLite) + memory set mein: "already published?" O(1) check.
+- URLs shards mein bante hain (sitemap-1.xml, sitemap-2.xml, ...), har shard max 50k URLs.
+- sitemap.xml ek sitemap index hai jo shards ki list rakhta hai.
+- Naya URL sirf aakhri shard mein jaata hai → sirf wahi shard re-render + upload hota hai.
+  Index sirf tab badalta hai jab naya shard banta hai.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from xml.sax.saxutils import escape
+
+try:
+    import fcntl
+except ImportError:  # Windows: cross-process lock nahi, sirf in-process queue
+    fcntl = None
+
+DEFAULT_SITEMAP_INDEX_PATH = os.getenv("SITEMAP_INDEX_PATH", "tmp/sitemap_index.db")
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+MAX_URLS_PER_SHARD = 50000  # sitemaps.org protocol limit
+
+
+class SitemapIndex:
+    """
+    Persistent set of published URLs for one site, split into sitemap shards.
+
+    Args:
+        site_url: Site base URL (index is kept per site).
+        path: SQLite file path (shared across worker processes).
+        shard_size: Max URLs per shard file.
+    """
+
+    def __init__(
+        self,
+        site_url: str,
+        path: str = DEFAULT_SITEMAP_INDEX_PATH,
+        shard_size: int = MAX_URLS_PER_SHARD,
+    ):
+        self.site_url = site_url.rstrip("/")
+        self.path = path
+        self.shard_size = min(shard_size, MAX_URLS_PER_SHARD)
+        self._urls: Optional[Set[str]] = None
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sitemap_urls (
+                    site TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    shard INTEGER NOT NULL,
+                    lastmod TEXT,
+                    PRIMARY KEY (site, url)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sitemap_urls_shard ON sitemap_urls(site, shard)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _loaded(self) -> Set[str]:
+        if self._urls is None:
+            with self._connect() as conn:
+                rows = conn.execute("SELECT url FROM sitemap_urls WHERE site = ?", (self.site_url,))
+                self._urls = {row[0] for row in rows}
+        return self._urls
+
+    @contextmanager
+    def writer_lock(self):
+        """Exclusive lock across processes for one add → render → upload cycle."""
+        if fcntl is None:
+            yield
+            return
+        with open(f"{self.path}.lock", "w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # -------------------------
+    # MEMBERSHIP
+    # -------------------------
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return url in self._loaded()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._loaded())
+
+    def add(self, urls: Iterable[str], lastmod: Optional[str] = None) -> Dict[int, List[str]]:
+        """
+        Add URLs (already-known ones are skipped). Returns {shard: newly added URLs}.
+        """
+        with self._lock:
+            known = self._loaded()
+            candidates = [u for u in dict.fromkeys(urls) if u not in known]
+            if not candidates:
+                return {}
+
+            added: Dict[int, List[str]] = {}
+            with self._connect() as conn:
+                try:
+                    # IMMEDIATE: doosra process bhi isi waqt shard count na padhe
+                    conn.execute("BEGIN IMMEDIATE")
+                    shard, count = self._last_shard(conn)
+                    for url in candidates:
+                        if count >= self.shard_size:
+                            shard, count = shard + 1, 0
+                        cur = conn.execute(
+                            "INSERT OR IGNORE INTO sitemap_urls (site, url, shard, lastmod) VALUES (?, ?, ?, ?)",
+                            (self.site_url, url, shard, lastmod),
+                        )
+                        known.add(url)
+                        # rowcount 0 = kisi aur process ne pehle hi daal diya tha
+                        if cur.rowcount:
+                            added.setdefault(shard, []).append(url)
+                            count += 1
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    self._urls = None
+                    raise
+            return added
+
+    def remove(self, urls: Iterable[str]):
+        """Undo an `add` (e.g. when the shard upload failed)."""
+        urls = list(urls)
+        with self._lock:
+            with self._connect() as conn:
+                conn.executemany(
+                    "DELETE FROM sitemap_urls WHERE site = ? AND url = ?",
+                    [(self.site_url, url) for url in urls],
+                )
+            if self._urls is not None:
+                self._urls.difference_update(urls)
+
+    def _last_shard(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        row = conn.execute(
+            "SELECT shard, COUNT(*) FROM sitemap_urls WHERE site = ? "
+            "GROUP BY shard ORDER BY shard DESC LIMIT 1",
+            (self.site_url,),
+        ).fetchone()
+        return (row[0], row[1]) if row else (1, 0)
+
+    def shards(self) -> List[int]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT shard FROM sitemap_urls WHERE site = ? ORDER BY shard", (self.site_url,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    # -------------------------
+    # RENDERING
+    # -------------------------
+    @staticmethod
+    def shard_filename(shard: int) -> str:
+        return f"sitemap-{shard}.xml"
+
+    def render_shard(self, shard: int) -> str:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT url, lastmod FROM sitemap_urls WHERE site = ? AND shard = ? ORDER BY url",
+                (self.site_url, shard),
+            ).fetchall()
+        parts = [f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">']
+        for url, lastmod in rows:
+            entry = f"<url><loc>{escape(url)}</loc>"
+            if lastmod:
+                entry += f"<lastmod>{escape(lastmod)}</lastmod>"
+            parts.append(entry + "</url>")
+        parts.append("</urlset>\n")
+        return "\n".join(parts)
+
+    def render_index(self) -> str:
+        parts = [f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">']
+        for shard in self.shards():
+            parts.append(f"<sitemap><loc>{escape(self.site_url)}/{self.shard_filename(shard)}</loc></sitemap>")
+        parts.append("</sitemapindex>\n")
+        return "\n".join(parts)
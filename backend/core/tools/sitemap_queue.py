@@ -0,0 +1,122 @@
+"""
+WHAT IS THIS FILE? (Yeh file kya hai?)
+Har site ke liye ek single-writer sitemap update queue.
+
+WHY IS IT NEEDED? (Kyu chahiye?)
+Do agents ek hi waqt publish karein toh dono sitemap padhte hain, dono append karte hain,
+dono upload karte hain → ek URL gum, aur kaam double. Yahan:
+- Saare callers apne URLs queue mein daalte hain aur ek Future paate hain.
+- Ek hi writer thread chhoti window (default 250ms) tak aane wale URLs jama karta hai
+  aur sabko ek hi read-modify-write cycle mein likhta hai.
+- Har Future ko sirf usi caller ke URLs ka result milta hai.
+Alag processes (Celery workers) ke beech SitemapIndex.writer_lock() file lock se serialize hota hai.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, List, Tuple
+
+from agno.utils.log import logger
+
+SitemapWriter = Callable[[List[str]], Dict]
+
+
+class SitemapWriteQueue:
+    """
+    Coalescing single-writer queue for one site's sitemap.
+
+    Args:
+        writer: Does one read-modify-write for a list of URLs and returns a result dict
+            (status, added_urls, ...), e.g. CpanelDeployTools._add_to_sitemap.
+        window: Seconds to keep collecting URLs after the first one arrives.
+        max_batch: Flush early once this many URLs are pending.
+    """
+    _queues: Dict[Tuple[str, Hashable], "SitemapWriteQueue"] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, writer: SitemapWriter, window: float = 0.25, max_batch: int = 1000):
+        self.writer = writer
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: "queue.Queue[Tuple[List[str], Future]]" = queue.Queue()
+        self._stats = {"submitted": 0, "writes": 0, "urls_written": 0}
+        self._stats_lock = threading.Lock()  # submit callers + writer thread dono badalte hain
+        self._thread = threading.Thread(target=self._run, name="sitemap-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def for_site(cls, site_url: str, writer: SitemapWriter, config_key: Hashable = None,
+                 **kwargs) -> "SitemapWriteQueue":
+        """
+        Process-wide queue per (site, writer config). `config_key` writer ki dependencies
+        (credentials, http client, index) describe karta hai: same key wale callers ek queue
+        share karte hain, config badla toh naya queue + naya writer.
+        """
+        key = (site_url, config_key)
+        with cls._registry_lock:
+            if key not in cls._queues:
+                cls._queues[key] = cls(writer, **kwargs)
+            return cls._queues[key]
+
+    def submit(self, urls: List[str]) -> Future:
+        """Queue URLs for inclusion; the Future resolves to the result for these URLs."""
+        future: Future = Future()
+        self._pending.put((list(urls), future))
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+        return future
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {**self._stats, "pending": self._pending.qsize()}
+
+    def _collect(self) -> List[Tuple[List[str], Future]]:
+        batch = [self._pending.get()]
+        size = len(batch[0][0])
+        deadline = time.monotonic() + self.window
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._pending.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            urls = list(dict.fromkeys(u for item_urls, _ in batch for u in item_urls))
+            try:
+                result = self.writer(urls)
+            except Exception as e:
+                logger.error(f"Sitemap writer failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            with self._stats_lock:
+                self._stats["writes"] += 1
+                self._stats["urls_written"] += len(result.get("added_urls") or [])
+            for item_urls, future in batch:
+                future.set_result(self._result_for(result, item_urls, len(batch)))
+
+    @staticmethod
+    def _result_for(result: Dict, urls: List[str], coalesced: int) -> Dict:
+        if result.get("status") != "success":
+            return {**result, "coalesced": coalesced}
+        wanted = set(urls)
+        mine = [u for u in result.get("added_urls") or [] if u in wanted]
+        if not mine:
+            return {
+                "status": "ok",
+                "message": "URL already exists in sitemap",
+                "sitemap": result.get("sitemap"),
+                "coalesced": coalesced,
+            }
+        return {**result, "added_urls": mine, "coalesced": coalesced}
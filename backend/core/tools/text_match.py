@@ -0,0 +1,86 @@
+"""
+Multi-pattern keyword matching with one compiled regex.
+
+All hints are escaped and joined into a single alternation, so each line of text
+is scanned once by the C regex engine no matter how many hints there are.
+Hints that already have enough matching lines drop out of the pattern, so the
+rest of the page is only scanned for the hints still pending. Matching is
+case-insensitive: the text is lowercased once instead of once per hint.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class HintMatcher:
+    """
+    Case-insensitive matcher over a fixed set of hints.
+
+    Args:
+        hints: Keywords to look for (duplicates and blanks are ignored).
+    """
+
+    def __init__(self, hints: Iterable[str]):
+        self.hints: List[str] = list(dict.fromkeys(h for h in hints if h and h.strip()))
+        # Lowered hint -> indexes (case-only duplicates share one alternative)
+        self._index: Dict[str, List[int]] = {}
+        for i, hint in enumerate(self.hints):
+            self._index.setdefault(hint.lower(), []).append(i)
+        # Alternation ek position pe ek hi hint match karta hai (longest pehle): jo hints
+        # uske andar substring hain woh bhi saath mein count
+        self._implied: Dict[str, List[str]] = {
+            hint: [other for other in self._index if other in hint] for hint in self._index
+        }
+        # Matches non-overlapping hote hain: jis hint ka prefix kisi doosre hint ka suffix hai
+        # ("abc" + "bcd" in "abcd") woh chhup sakta hai, toh matched lines pe uska seedha `in` check
+        self._overlapping = {
+            hint for hint in self._index
+            if any(other[k:] == hint[:len(other) - k]
+                   for other in self._index if other != hint
+                   for k in range(max(1, len(other) - len(hint) + 1), len(other)))
+        }
+        self._pattern = self._compile(self._index)
+
+    @staticmethod
+    def _compile(hints: Iterable[str]) -> Optional[re.Pattern]:
+        ordered = sorted(hints, key=len, reverse=True)
+        return re.compile("|".join(map(re.escape, ordered))) if ordered else None
+
+    def _find(self, pattern: re.Pattern, pending: Set[str], text: str) -> Set[str]:
+        seen = set(pattern.findall(text))
+        if not seen:
+            return seen
+        seen.update(hint for hint in self._overlapping & pending if hint not in seen and hint in text)
+        return {implied for hint in seen for implied in self._implied[hint] if implied in pending}
+
+    def find(self, text: str) -> set:
+        """Indexes of hints that occur in `text` (expects already-lowercased text)."""
+        if self._pattern is None:
+            return set()
+        found = self._find(self._pattern, set(self._index), text)
+        return {i for hint in found for i in self._index[hint]}
+
+    def match_lines(self, body: str, max_per_hint: int = 5) -> Dict[str, List[str]]:
+        """Lines containing each hint (at most `max_per_hint` per hint), in page order."""
+        matches: Dict[str, List[str]] = {}
+        if self._pattern is None:
+            return matches
+        pattern = self._pattern
+        pending = set(self._index)
+        lines = body.split("\n")
+        lowered = body.lower().split("\n")
+        for line, low in zip(lines, lowered):
+            full = []
+            for hint in self._find(pattern, pending, low):
+                for index in self._index[hint]:
+                    hits = matches.setdefault(self.hints[index], [])
+                    hits.append(line.strip())
+                if len(hits) == max_per_hint:
+                    full.append(hint)
+            if full:
+                # Bhare hue hints regex se hatao: baaki page sirf pending hints ke liye scan hota hai
+                pending.difference_update(full)
+                if not pending:
+                    break
+                pattern = self._compile(pending)
+        return matches
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# `backend.*` imports repo root se resolve hote hain (app aur worker jaisa)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
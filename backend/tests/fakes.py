@@ -0,0 +1,56 @@
+# Tests ke liye chhote fakes: Postgres / agno ke bina core modules import aur chalane ke liye.
+import sys
+import types
+
+
+class FakeResult:
+    def __init__(self, rows=()):
+        self._rows = [types.SimpleNamespace(**row) for row in rows]
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params=None):
+        self.engine.statements.append((str(statement), params))
+        return FakeResult(self.engine.handler(str(statement), params or {}))
+
+    def commit(self):
+        self.engine.commits += 1
+
+    def rollback(self):
+        self.engine.rollbacks += 1
+
+
+class FakeEngine:
+    """`auth_engine` jaisa: har `execute` handler(sql, params) -> rows ko jaata hai."""
+
+    def __init__(self, handler=None):
+        self.handler = handler or (lambda sql, params: [])
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+def install_fake_db(monkeypatch, engine: FakeEngine):
+    # Asli backend.core.db import pe Postgres engine + agno tracing banata hai
+    module = types.ModuleType("backend.core.db")
+    module.auth_engine = engine
+    monkeypatch.setitem(sys.modules, "backend.core.db", module)
+    return module
@@ -0,0 +1,116 @@
+import multiprocessing
+import socket
+import threading
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis mein EVAL (Lua) ke liye
+
+from backend.core.fair_share import LocalFairShareLimiter, RedisFairShareLimiter
+
+@pytest.fixture
+def redis_url():
+    # Alag processes ek hi (fake) Redis server se TCP pe baat karte hain, jaise prefork workers
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = fakeredis.TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{port}/0"
+    server.shutdown()
+    server.server_close()
+
+
+def _generate(url, name, user_id, events, release):
+    # Ek prefork worker process: apna limiter object, shared Redis state
+    limiter = RedisFairShareLimiter(capacity=2, url=url, name="test", poll_interval=0.01)
+    with limiter.slot(user_id):
+        events.put(("start", name))
+        release.wait(30)
+        events.put(("end", name))
+
+
+def _wait_for(check):
+    deadline = time.monotonic() + 30
+    while not check():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_users_interleave_across_processes(redis_url):
+    ctx = multiprocessing.get_context("spawn")
+    events = ctx.Queue()
+    releases = {}
+    procs = []
+
+    def spawn(name, user_id):
+        releases[name] = ctx.Event()
+        procs.append(ctx.Process(target=_generate, args=(redis_url, name, user_id, events, releases[name])))
+        procs[-1].start()
+
+    # "big" user ka campaign: 6 generations, capacity 2 -> 2 chalte, 4 wait
+    for i in range(6):
+        spawn(f"big-{i}", "big")
+    limiter = RedisFairShareLimiter(capacity=2, url=redis_url, name="test")
+    first = [events.get(timeout=30)[1] for _ in range(2)]
+    _wait_for(lambda: limiter.stats()["waiting"].get("big") == 4)
+
+    # Chhota user baad mein aata hai, big ke 4 waiters ke peeche
+    spawn("small", "small")
+    _wait_for(lambda: limiter.stats()["waiting"].get("small") == 1)
+    releases[first[0]].set()
+
+    # Pehla free slot small ko milta hai (share = 1 each), big ke agle waiter ko nahi
+    log = [("start", name) for name in first]
+    log.append(events.get(timeout=30))
+    log.append(events.get(timeout=30))
+    assert log[2:] == [("end", first[0]), ("start", "small")]
+    assert limiter.stats()["running"] == {"big": 1, "small": 1}
+
+    for release in releases.values():
+        release.set()
+    for proc in procs:
+        proc.join(timeout=30)
+        assert proc.exitcode == 0
+    while len(log) < 14:
+        log.append(events.get(timeout=5))
+
+    running = peak = 0
+    for kind, _ in log:
+        running += 1 if kind == "start" else -1
+        peak = max(peak, running)
+    assert peak <= 2
+    assert limiter.stats() == {"capacity": 2, "running": {}, "waiting": {}}
+
+
+def test_local_limiter_shares_capacity_between_users():
+    limiter = LocalFairShareLimiter(capacity=2)
+    started = []
+    releases = {}
+
+    def hold(name, user_id):
+        with limiter.slot(user_id):
+            started.append(name)
+            releases[name].wait(5)
+
+    threads = []
+    for name, user_id in [(f"big-{i}", "big") for i in range(4)] + [("small", "small")]:
+        releases[name] = threading.Event()
+        threads.append(threading.Thread(target=hold, args=(name, user_id)))
+        threads[-1].start()
+        if name == "big-3":
+            _wait_for(lambda: limiter.stats()["waiting"].get("big") == 2)
+    _wait_for(lambda: limiter.stats()["waiting"].get("small") == 1)
+
+    releases[started[0]].set()
+    _wait_for(lambda: len(started) == 3)
+    assert started[2] == "small"
+
+    for release in releases.values():
+        release.set()
+    for thread in threads:
+        thread.join(5)
+    assert limiter.stats() == {"capacity": 2, "running": {}, "waiting": {}}
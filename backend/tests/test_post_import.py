@@ -0,0 +1,76 @@
+import importlib
+from datetime import datetime
+
+import pytest
+
+from backend.tests.fakes import FakeEngine, install_fake_db
+
+
+@pytest.fixture
+def post_import(monkeypatch):
+    engine = FakeEngine()
+    install_fake_db(monkeypatch, engine)
+    module = importlib.reload(importlib.import_module("backend.core.post_import"))
+    module.engine = engine
+    return module
+
+
+@pytest.mark.parametrize("raw, error", [
+    ({"campaign_id": "c1", "content": "Hi", "scheduled_date": 12345}, "scheduled_date must be an ISO 8601 string"),
+    ({"campaign_id": "c1", "content": "Hi", "scheduled_date": "next tuesday"}, "invalid scheduled_date"),
+    ({"campaign_id": "c1", "content": "Hi", "platform": "p" * 51}, "platform longer than 50 characters"),
+    ({"campaign_id": "c" * 256, "content": "Hi"}, "campaign_id longer than 255 characters"),
+    ({"campaign_id": 42, "content": "Hi"}, "campaign_id must be a string"),
+    ({"campaign_id": "c1", "content": ["Hi"]}, "content must be a string"),
+    ({"campaign_id": "c1", "content": "x" * 10_001}, "content longer than 10000 characters"),
+    ({"campaign_id": "c1", "content": "Hi\x00"}, "content contains a NUL character"),
+    ({"campaign_id": "c1"}, "content is required"),
+    ({"content": "Hi"}, "campaign_id is required"),
+    ("not a row", "row must be an object"),
+])
+def test_normalize_row_rejects_bad_values(post_import, raw, error):
+    with pytest.raises(ValueError, match=error):
+        post_import.normalize_row(raw)
+
+
+def test_normalize_row_accepts_limits_and_dates(post_import):
+    row = post_import.normalize_row({
+        "campaign_id": "c" * 255, "content": " Hi ", "platform": "LinkedIn",
+        "scheduled_date": "2026-03-01T09:30:00+05:30",
+    })
+    assert row["platform"] == "linkedin"
+    assert row["content"] == "Hi"
+    assert row["scheduled_date"] == datetime(2026, 3, 1, 4, 0)
+    assert row["status"] == "scheduled"
+
+    row = post_import.normalize_row({"campaign_id": "c1", "content": "Hi", "platform": "x" * 50,
+                                     "scheduled_date": datetime(2026, 3, 1)})
+    assert row["scheduled_date"] == datetime(2026, 3, 1)
+
+    row = post_import.normalize_row({"campaign_id": "c1", "content": "Hi", "platform": "", "scheduled_date": ""})
+    assert (row["platform"], row["scheduled_date"], row["status"]) == ("linkedin", None, "draft")
+
+
+def test_bad_row_is_rejected_alone(post_import):
+    inserted = []
+
+    def handler(sql, params):
+        if "FROM campaigns" in sql:
+            return [{"id": cid} for cid in params["ids"]]
+        if "INSERT INTO posts" in sql:
+            inserted.extend(params)
+        return []
+
+    post_import.engine.handler = handler
+    rows = [{"campaign_id": "c1", "content": f"Post {i}"} for i in range(5)]
+    rows[2] = {"campaign_id": "c1", "content": "Bad", "scheduled_date": 12345, "platform": "p" * 80}
+
+    result = post_import.import_posts("u1", rows, batch_size=10, method="executemany")
+
+    assert result["created"] == 4
+    assert result["failed"] == 1
+    assert [r.get("error") for r in result["results"]] == [
+        None, None, "platform longer than 50 characters", None, None
+    ]
+    assert [row["content"] for row in inserted] == ["Post 0", "Post 1", "Post 3", "Post 4"]
+    assert post_import.engine.rollbacks == 0
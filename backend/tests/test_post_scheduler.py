@@ -0,0 +1,76 @@
+import importlib
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.core import post_publishers
+from backend.tests.fakes import FakeEngine, install_fake_db
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+class PostsTable:
+    """Scheduler ki do queries (refresh SELECT, claim UPDATE) ka in-memory posts table."""
+
+    def __init__(self, posts):
+        self.posts = {post["id"]: dict(post) for post in posts}
+
+    def _due(self, until, platforms):
+        rows = [p for p in self.posts.values()
+                if p["status"] == "scheduled" and p["scheduled_date"] <= until
+                and p["platform"].lower() in platforms]
+        return sorted(rows, key=lambda p: p["scheduled_date"])
+
+    def __call__(self, sql, params):
+        if sql.lstrip().startswith("SELECT"):
+            return [{"id": p["id"], "scheduled_date": p["scheduled_date"]}
+                    for p in self._due(params["horizon"], params["platforms"])]
+        if "SET status = 'publishing'" in sql:
+            claimed = self._due(params["now"], params["platforms"])[:params["limit"]]
+            for post in claimed:
+                post["status"] = "publishing"
+            return [{"id": p["id"]} for p in claimed]
+        return []
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    table = PostsTable([
+        {"id": "li-1", "platform": "linkedin", "status": "scheduled", "scheduled_date": NOW - timedelta(minutes=5)},
+        {"id": "tt-1", "platform": "TikTok", "status": "scheduled", "scheduled_date": NOW - timedelta(minutes=1)},
+    ])
+    engine = FakeEngine(table)
+    install_fake_db(monkeypatch, engine)
+    monkeypatch.setattr(post_publishers, "_PUBLISHERS", {})
+    table.engine = engine
+    return table
+
+
+def _scheduler(dispatched):
+    module = importlib.reload(importlib.import_module("backend.core.post_scheduler"))
+    return module.PostScheduler(dispatch=dispatched.append, refresh_seconds=0)
+
+
+def test_nothing_claimed_without_registered_publishers(posts):
+    dispatched = []
+    scheduler = _scheduler(dispatched)
+
+    scheduler.tick(NOW)
+
+    assert dispatched == []
+    assert {p["status"] for p in posts.posts.values()} == {"scheduled"}
+    assert posts.engine.statements == []
+
+
+def test_unsupported_platform_post_stays_scheduled(posts):
+    post_publishers.register("linkedin")(lambda post: None)
+    dispatched = []
+    scheduler = _scheduler(dispatched)
+
+    scheduler.tick(NOW)
+    scheduler.tick(NOW + timedelta(minutes=1))
+
+    assert dispatched == ["li-1"]
+    assert posts.posts["li-1"]["status"] == "publishing"
+    assert posts.posts["tt-1"]["status"] == "scheduled"
+    assert scheduler.next_due() is None
@@ -0,0 +1,92 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+from backend.core import post_publishers
+from backend.tests.fakes import FakeEngine, install_fake_db
+
+
+class PostsTable:
+    """publish_post ki UPDATE queries ka in-memory posts table."""
+
+    def __init__(self, **statuses):
+        self.posts = {
+            post_id: {"id": post_id, "campaign_id": "c1", "content": "Hello", "platform": "linkedin",
+                      "scheduled_date": None, "status": status, "publish_error": None}
+            for post_id, status in statuses.items()
+        }
+
+    def __call__(self, sql, params):
+        post = self.posts.get(params["id"])
+        if "SET status = 'sending'" in sql:
+            if post and post["status"] == "publishing":
+                post["status"] = "sending"
+                return [post]
+        elif "SET status = 'failed'" in sql:
+            if post and post["status"] == "sending":
+                post.update(status="failed", publish_error=params["error"])
+                return [{"id": post["id"]}]
+        elif "SET status = :status" in sql:
+            post.update(status=params["status"], publish_error=params["error"])
+        return []
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    def load(table):
+        install_fake_db(monkeypatch, FakeEngine(table))
+        # Asli agent_config Ollama model import karta hai; publish_post ko uski zaroorat nahi
+        agent_config = types.ModuleType("backend.core.agent.agent_config")
+        agent_config.apply_brand_voice = agent_config.create_agent = agent_config.create_post_writer = None
+        monkeypatch.setitem(sys.modules, "backend.core.agent.agent_config", agent_config)
+        return importlib.reload(importlib.import_module("backend.worker"))
+
+    monkeypatch.setattr(post_publishers, "_PUBLISHERS", {})
+    return load
+
+
+def test_redelivery_does_not_publish_twice(worker):
+    table = PostsTable(p1="publishing")
+    sent = []
+    post_publishers.register("linkedin")(lambda post: sent.append(post.id))
+    module = worker(table)
+
+    assert module.publish_post.run("p1")["status"] == "published"
+    assert module.publish_post.run("p1")["status"] == "skipped"
+    assert sent == ["p1"]
+    assert table.posts["p1"]["status"] == "published"
+
+
+def test_send_is_marked_before_the_publisher_runs(worker):
+    table = PostsTable(p1="publishing")
+    seen = []
+    post_publishers.register("linkedin")(lambda post: seen.append(table.posts[post.id]["status"]))
+    worker(table).publish_post.run("p1")
+
+    assert seen == ["sending"]
+
+
+def test_interrupted_send_is_failed_not_resent(worker):
+    # Pichla attempt send ke beech crash hua: row `sending` mein reh gayi
+    table = PostsTable(p1="sending")
+    sent = []
+    post_publishers.register("linkedin")(lambda post: sent.append(post.id))
+    module = worker(table)
+
+    result = module.publish_post.run("p1")
+
+    assert sent == []
+    assert result["status"] == "failed"
+    assert table.posts["p1"]["status"] == "failed"
+    assert table.posts["p1"]["publish_error"] == module.INTERRUPTED_PUBLISH_ERROR
+
+
+def test_missing_publisher_fails_the_post(worker):
+    table = PostsTable(p1="publishing")
+    result = worker(table).publish_post.run("p1")
+
+    assert result["status"] == "failed"
+    assert table.posts["p1"]["status"] == "failed"
+    assert "linkedin" in table.posts["p1"]["publish_error"]
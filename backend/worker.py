@@ -1,10 +1,321 @@
-from backend.core.celery_app import celery_app
+from backend.core.celery_app import RETRY_SAFE, celery_app
+import os
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from sqlalchemy import text
+
+from backend.core.agent.agent_config import apply_brand_voice, create_agent, create_post_writer
+from backend.core.db import auth_engine
+from backend.core import blob_store, post_publishers, task_events, task_store
+from backend.core.fair_share import get_limiter
+
+# Tool name → pipeline phase (progress UI ke liye)
+TOOL_PHASES = (
+    (("search", "duckduckgo", "corpus"), "researching"),
+    (("image",), "images"),
+    (("deploy", "sitemap", "manifest"), "publishing"),
+)
+PROGRESS_INTERVAL = 1.0  # seconds; har token pe backend update nahi
+
+# Campaign fan-out: ek campaign ke kitne posts saath mein (LLM limit fair_share mein alag se)
+CAMPAIGN_MAX_PARALLEL = int(os.getenv("CAMPAIGN_MAX_PARALLEL", "4"))
+CAMPAIGN_INSERT_BATCH = 5  # itne posts ready hote hi ek bulk INSERT
+# Post content ki max length per platform (characters); unknown platform pe default
+PLATFORM_CHAR_LIMITS = {"twitter": 280, "x": 280, "threads": 500, "instagram": 2200, "linkedin": 3000}
+DEFAULT_CHAR_LIMIT = 3000
+# Redelivery pe `sending` mein atka post: dobara bhejne ki jagah yeh error
+INTERRUPTED_PUBLISH_ERROR = "Publishing was interrupted; check the platform before rescheduling this post"
+
 
 @celery_app.task(name="test_task")
 def test_task(word: str):
     time.sleep(5)
     return f"Hello {word}, from background task!"
 
-# Ideally, we will import actual generation tasks here later
-# from backend.core.tools.generator import generate_content_task
+
+def _phase_for_tool(tool_name: str) -> str:
+    name = (tool_name or "").lower()
+    for keywords, phase in TOOL_PHASES:
+        if any(k in name for k in keywords):
+            return phase
+    return "working"
+
+
+class _Progress:
+    """
+    Throttled progress publisher: task_events (SSE / long-poll subscribers ko push)
+    + Celery task state (PROGRESS + meta, purane polling clients ke liye).
+    """
+
+    def __init__(self, task):
+        self.task = task
+        self.version = 0
+        self.state = {"status": task_store.RUNNING, "phase": "starting", "tokens": 0, "tool_calls": []}
+        self._last_sent = 0.0
+
+    def update(self, force: bool = False, **changes):
+        self.state.update(changes)
+        now = time.monotonic()
+        if force or now - self._last_sent >= PROGRESS_INTERVAL:
+            self._last_sent = now
+            self.version += 1
+            self.task.update_state(state="PROGRESS", meta=self.state)
+            task_events.publish(self.task.request.id, {**self.state, "version": self.version})
+
+    def finish(self, status: str, **extra):
+        self.version += 1
+        self.state.update(status=status, phase=status)
+        task_events.publish(self.task.request.id, {**self.state, **extra, "version": self.version})
+
+
+@celery_app.task(name="generate_content", bind=True)
+def generate_content(self, message: str, session_id: str, user_id: str, system_prompt: str | None = None):
+    """
+    Content agent ko worker mein chalata hai (1,400+ word blogs: HTTP stream hold nahi hota).
+    Progress Celery state mein, final result `tasks` table + chat_messages mein.
+    """
+    task_id = self.request.id
+    progress = _Progress(self)
+    started = time.time()
+    task_store.update_task(task_id, task_store.RUNNING)
+    progress.update(force=True)
+
+    combined_response = ""
+    try:
+        agent = create_agent()
+        stream = agent.run(
+            apply_brand_voice(message, system_prompt),
+            stream=True,
+            stream_events=True,
+            session_id=session_id,
+            user_id=user_id,
+        )
+
+        for chunk in stream:
+            event_type_str = str(getattr(chunk, 'event', None))
+
+            if event_type_str == "ToolCallStarted":
+                tool_name = getattr(getattr(chunk, 'tool', None), 'tool_name', 'Unknown')
+                progress.update(
+                    force=True,
+                    phase=_phase_for_tool(tool_name),
+                    tool_calls=progress.state["tool_calls"] + [tool_name],
+                )
+                continue
+
+            if event_type_str == "ToolCallCompleted":
+                continue
+
+            if hasattr(chunk, 'content') and chunk.content:
+                if event_type_str in ["RunResponse", "RunCompleted"]:
+                    continue
+                combined_response += chunk.content
+                # Token count approx (~4 chars/token); exact metrics model pe depend karte hain
+                progress.update(
+                    force=progress.state["phase"] != "writing",
+                    phase="writing",
+                    tokens=len(combined_response) // 4,
+                )
+
+        with auth_engine.connect() as conn:
+            conn.execute(text("""
+                INSERT INTO chat_messages (chat_id, role, content)
+                VALUES (:cid, 'assistant', :content)
+            """), {"cid": session_id, "content": combined_response})
+            conn.commit()
+
+        # Bada HTML blob store mein; Redis backend + tasks.result mein sirf summary + reference
+        result = blob_store.offload({
+            "content": combined_response,
+            "preview": combined_response[:280],
+            "words": len(combined_response.split()),
+            "tokens": len(combined_response) // 4,
+            "tool_calls": progress.state["tool_calls"],
+            "duration_seconds": round(time.time() - started, 2),
+        }, content_types={"content": "text/markdown"})
+        task_store.update_task(task_id, task_store.COMPLETED, result)
+        progress.finish(task_store.COMPLETED, tokens=result["tokens"], duration_seconds=result["duration_seconds"])
+        return result
+
+    except Exception as e:
+        task_store.update_task(task_id, task_store.FAILED, blob_store.offload({
+            "error": str(e),
+            "partial_content": combined_response,
+            "tool_calls": progress.state["tool_calls"],
+        }, policy="research", content_types={"partial_content": "text/markdown"}))
+        progress.finish(task_store.FAILED, error=str(e))
+        raise
+
+
+def _campaign_post_prompt(brief: str, platform: str, index: int, count: int, char_limit: int) -> str:
+    return (
+        f"Write post {index + 1} of {count} for a {platform} campaign.\n"
+        f"Campaign brief: {brief}\n\n"
+        f"Give this post its own angle so it does not repeat the other {count - 1} posts. "
+        f"Keep it under {char_limit} characters. Return only the post text, ready to publish on {platform}."
+    )
+
+
+def _generate_campaign_post(prompt: str, user_id: str, char_limit: int) -> str:
+    """
+    Tool-less post writer (deploy / search nahi, session nahi). Limit se lamba aaye toh ek
+    baar chhota karwao; fir bhi lamba / khaali ho toh yeh post failed count hota hai.
+    """
+    writer = create_post_writer()
+    content = ""
+    for attempt in range(2):
+        # Fair share slot: ek user ke bade campaign se baaki users ki generations na rukein
+        with get_limiter().slot(user_id):
+            response = writer.run(prompt)
+        content = (response.content or "").strip()
+        if not content:
+            raise ValueError("Empty response from model")
+        if len(content) <= char_limit:
+            return content
+        prompt = (
+            f"Shorten this post to under {char_limit} characters, keeping its message. "
+            f"Return only the post text.\n\n{content}"
+        )
+    raise ValueError(f"Post is {len(content)} characters, limit is {char_limit}")
+
+
+def _insert_posts(rows: list):
+    """Ek round trip mein kai posts (executemany)."""
+    if not rows:
+        return
+    with auth_engine.connect() as conn:
+        conn.execute(text("""
+            INSERT INTO posts (id, campaign_id, content, platform, scheduled_date, status)
+            VALUES (:id, :cid, :content, :platform, NULL, 'draft')
+        """), rows)
+        conn.commit()
+
+
+@celery_app.task(name="generate_campaign_posts", bind=True)
+def generate_campaign_posts(self, campaign_id: str, user_id: str, brief: str, count: int,
+                            platform: str = "linkedin", system_prompt: str | None = None):
+    """
+    Ek brief se `count` campaign posts: bounded parallel generations, har few posts pe
+    bulk insert + progress event. Kuch posts fail ho jayein toh baaki phir bhi save hote hain.
+    """
+    task_id = self.request.id
+    progress = _Progress(self)
+    started = time.time()
+    task_store.update_task(task_id, task_store.RUNNING)
+    progress.update(force=True, phase="generating", total=count, completed=0, failed=0)
+
+    post_ids, errors, pending = [], [], []
+    char_limit = PLATFORM_CHAR_LIMITS.get(platform.lower(), DEFAULT_CHAR_LIMIT)
+
+    def flush():
+        _insert_posts(pending)
+        post_ids.extend(row["id"] for row in pending)
+        pending.clear()
+        progress.update(force=True, completed=len(post_ids), failed=len(errors), post_ids=post_ids)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(count, CAMPAIGN_MAX_PARALLEL))) as pool:
+            futures = {
+                pool.submit(
+                    _generate_campaign_post,
+                    apply_brand_voice(_campaign_post_prompt(brief, platform, i, count, char_limit), system_prompt),
+                    user_id,
+                    char_limit,
+                ): i
+                for i in range(count)
+            }
+            for future in as_completed(futures):
+                try:
+                    content = future.result()
+                except Exception as e:
+                    errors.append({"index": futures[future], "error": str(e)})
+                    progress.update(failed=len(errors))
+                    continue
+                pending.append({"id": str(uuid.uuid4()), "cid": campaign_id, "content": content, "platform": platform})
+                if len(pending) >= CAMPAIGN_INSERT_BATCH:
+                    flush()
+        flush()
+
+        result = {
+            "campaign_id": campaign_id,
+            "requested": count,
+            "created": len(post_ids),
+            "failed": len(errors),
+            "post_ids": post_ids,
+            "errors": errors,
+            "duration_seconds": round(time.time() - started, 2),
+        }
+        status = task_store.COMPLETED if post_ids else task_store.FAILED
+        task_store.update_task(task_id, status, result)
+        progress.finish(status, created=len(post_ids), failed=len(errors), duration_seconds=result["duration_seconds"])
+        return result
+
+    except Exception as e:
+        # DB error etc.: jo posts insert ho chuke woh result mein rehte hain
+        task_store.update_task(task_id, task_store.FAILED, {
+            "error": str(e),
+            "campaign_id": campaign_id,
+            "post_ids": post_ids,
+        })
+        progress.finish(task_store.FAILED, error=str(e))
+        raise
+
+
+@celery_app.task(name="publish_post", **RETRY_SAFE)
+def publish_post(post_id: str):
+    """
+    Scheduler ka claim kiya hua post platform client se publish karo (publishing → sending → published).
+    Client na ho ya fail kare toh `failed` + publish_error; `published` sirf successful send pe.
+
+    Client call se pehle row `sending` mark karke commit hoti hai, toh redelivery (acks_late) pe
+    post dobara nahi bheja jaata. Send ke beech crash hua ho (row `sending` mein atki) toh redelivery
+    use `failed` karti hai: bheja gaya ya nahi pata nahi, isliye user check karke reschedule kare.
+    """
+    with auth_engine.connect() as conn:
+        post = conn.execute(text("""
+            UPDATE posts SET status = 'sending'
+            WHERE id = :id AND status = 'publishing'
+            RETURNING id, campaign_id, content, platform, scheduled_date
+        """), {"id": post_id}).fetchone()
+        if not post:
+            interrupted = conn.execute(text("""
+                UPDATE posts SET status = 'failed', publish_error = :error
+                WHERE id = :id AND status = 'sending'
+                RETURNING id
+            """), {"id": post_id, "error": INTERRUPTED_PUBLISH_ERROR}).fetchone()
+        conn.commit()
+
+    if not post:
+        if interrupted:
+            print(f"Post publish interrupted earlier ({post_id}), marked failed")
+            return {"post_id": post_id, "status": "failed", "error": INTERRUPTED_PUBLISH_ERROR}
+        return {"post_id": post_id, "status": "skipped"}
+
+    publisher = post_publishers.get_publisher(post.platform)
+    error = None
+    if publisher is None:
+        error = f"No publishing client configured for platform '{post.platform}'"
+    else:
+        try:
+            publisher(post)
+        except Exception as e:
+            error = str(e)
+
+    status = "failed" if error else "published"
+    with auth_engine.connect() as conn:
+        conn.execute(text("""
+            UPDATE posts SET status = :status, publish_error = :error WHERE id = :id
+        """), {"id": post_id, "status": status, "error": error})
+        conn.commit()
+
+    if error:
+        print(f"Post publish failed ({post_id}): {error}")
+        return {"post_id": post_id, "platform": post.platform, "status": status, "error": error}
+    return {"post_id": post_id, "platform": post.platform, "status": status}
+
+
+@celery_app.task(name="purge_expired_blobs", **RETRY_SAFE)
+def purge_expired_blobs():
+    """Expiry policy ke hisaab se purane offloaded results hatao (beat se har ghante)."""
+    return {"removed": blob_store.BlobStore().purge_expired()}